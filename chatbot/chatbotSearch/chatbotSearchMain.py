@@ -12,14 +12,15 @@ from .search import parse_meetings_list
 from .llm import call_hyperclova_rag
 
 # 모델
-from .models import ChatRequest, ChatResponse
+from .models import ChatRequest, ChatResponse, get_response_kind, ROLE_USER, ROLE_ASSISTANT
 
 # 설정
-from .config import ENABLE_PERSONA
+from .config import ENABLE_PERSONA, LOG_LEVEL
 
 # 데이터베이스 & 컨텍스트
-from .database import init_db_connection, test_db_connection
-from .context import init_redis_client, get_context, save_context, delete_context
+from .database import init_db_connection, test_db_connection, ensure_search_indexes
+from .context import init_redis_client, close_redis, get_context, load_request_state, save_user_meta, save_context_async, update_context_fields, touch_context, delete_context, begin_write_batch, flush_write_batch
+from .context import meeting_title_lc, meeting_desc_lc, meeting_tokens, build_and_save_meeting_context
 
 # 검색
 from .search import (
@@ -38,7 +39,8 @@ from .formatting import (
     format_single_meeting,
     format_single_meeting_with_persona,
     format_multiple_meetings_short,
-    calculate_shown_counts
+    calculate_shown_counts,
+    first_two_sentences
 )
 
 # 선택 처리
@@ -52,7 +54,7 @@ import re
 # ============================================================
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,  # DEBUG 로그는 INFO에서 포맷팅 없이 건너뜀
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -72,6 +74,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def setup_search_indexes():
+    """시작 시 검색용 인덱스 확인/생성 (ENABLE_SEARCH_INDEX_SETUP일 때만)"""
+    ensure_search_indexes()
+
+@app.on_event("shutdown")
+def shutdown_redis():
+    """종료 시 Redis 정리 (남은 컨텍스트 저장 완료 후 연결 해제)"""
+    close_redis()
+
+@app.on_event("shutdown")
+async def shutdown_llm_client():
+    """종료 시 HyperCLOVA 비동기 HTTP 클라이언트 정리"""
+    from .llm import close_llm_client
+    await close_llm_client()
+
 # ============================================================
 # 클라이언트 초기화
 # ============================================================
@@ -84,6 +102,162 @@ app.add_middleware(
 # Redis 초기화
 redis_client = init_redis_client()
 
+# ============================================================
+# 페이지네이션 파싱용 상수
+# ============================================================
+
+# "두 개", "세개" 등 한글 수량 표현 (한 번의 검색 + dict 조회)
+_KOREAN_NUM_RE = re.compile(r'(한|두|세|네|다섯|여섯|일곱|여덟|아홉|열)\s*개')
+_KOREAN_NUM_MAP = {'한': 1, '두': 2, '세': 3, '네': 4, '다섯': 5, '여섯': 6, '일곱': 7, '여덟': 8, '아홉': 9, '열': 10}
+_RE_NUM_GAE = re.compile(r'(\d+)개')
+
+# ============================================================
+# 요청마다 쓰이는 정규식 (모듈 로드 시 한 번만 컴파일)
+# ============================================================
+
+_RE_KOR_TOKENS = re.compile(r'[가-힣]{2,}')
+_RE_EN_TOKENS = re.compile(r'[A-Za-z0-9]+')
+_RE_SINGLE_DATE = re.compile(r'^\d{1,2}월\s*\d{1,2}일$|^\d{1,2}일$')
+_RE_OBVIOUS_DATE = re.compile(r'^\d{1,2}월\s?\d{1,2}일$')
+_RE_OBVIOUS_EXCLUDE = re.compile(r'[?저그이]|뭐|어떤|있어')  # 질문/지시어 포함 시 명확한 회의명 아님
+_RE_PERSON_NAME = re.compile(r'([가-힣]{2,4})')
+_RE_NAME_JOSA = re.compile(r'[가이은는을를]$')
+_RE_MEETING_KEYWORD = re.compile(r'(.+?)\s*회의')
+
+# ============================================================
+# 후속 질문 키워드 (리스트 순회 대신 alternation 정규식 한 번으로 검사)
+# ============================================================
+
+def _keyword_re(words):
+    """부분 문자열 키워드 목록 → 하나의 alternation 정규식"""
+    return re.compile('|'.join(map(re.escape, words)))
+
+def _pattern_re(patterns):
+    """정규식 목록 → 하나의 alternation 정규식"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+_MORE_PATTERN_LIST = [
+    r'나머.*',
+    r'남은.*',
+    r'더.*[보줘있알려]',
+    r'추가.*',
+    r'계속|이어서|다음',
+    r'또.*[있뭐어]',
+    r'그\s*외',
+    r'더\s*[보줘]'
+]
+_MORE_PATTERNS_RE = _pattern_re(_MORE_PATTERN_LIST)
+
+# "나머지" 요청 (awaiting_selection)
+_MORE_KEYWORDS_RE = _keyword_re([
+    '나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
+    '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
+    '다음', '또', '그외', '외', '그밖', '더있나', '더있니',
+    '또뭐', '또있어', '나머', '남머', '나미', '더보'
+])
+_FUZZY_MORE_RE = _keyword_re(['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알'])
+
+# "나머지" 요청 (count_result)
+_COUNT_MORE_KEYWORDS_RE = _keyword_re([
+    '나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
+    '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
+    '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니',
+    '또뭐', '또있어', '나머', '남머', '나미', '더보'
+])
+_COUNT_FUZZY_MORE_RE = _keyword_re(['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알', '추가'])
+
+# 페이지네이션 요청 (meeting_list_shown)
+_LIST_MORE_RE = _keyword_re([
+    '나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
+    '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
+    '다음', '또', '그외', '줘봐', '줘', '보여줘'
+])
+
+# 페이지네이션 요청 (후속 질문, 띄어쓰기 제거된 쿼리 기준)
+_FOLLOWUP_PAGINATION_RE = _pattern_re(_MORE_PATTERN_LIST + [
+    r'완료.*나머',
+    r'완료.*더',
+    r'예정.*나머',
+    r'예정.*더'
+])
+_FUZZY_PAGINATION_RE = _keyword_re(['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알', '추가로', '계속', '이어'])
+
+# 페이지네이션 요청 (오프토픽 체크 전)
+_PAGINATION_KEYWORDS_RE = _keyword_re([
+    '나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
+    '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
+    '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니',
+    '또뭐', '또있어', '나머', '남머', '나미', '더보',
+    '줘봐', '줘', '보여줘'
+])
+_PAGINATION_PATTERNS_RE = _pattern_re(_MORE_PATTERN_LIST + [
+    r'줘\s*봐',
+    r'보여\s*줘'
+])
+
+# 상태/검색 의도/날짜 범위
+_STATUS_ONLY_KEYWORDS = frozenset(['완료된', '예정된', '진행중', '취소된'])
+_STATUS_KEYWORDS_RE = _keyword_re(['예정', '완료', '진행중', '취소', 'scheduled', 'completed', 'recording'])
+_SEARCH_INTENT_RE = _keyword_re(['찾아', '검색', '있어', '있었어', '있나', '뭐', '어떤', '미팅'])
+_DATE_RANGE_RE = _keyword_re(['부터', '까지', '사이', '동안', '이후', '이전'])
+
+# 후속 질문 분류 (awaiting_selection)
+_STATUS_FILTER_KEYWORDS = {
+    '완료': 'COMPLETED',
+    '완료된': 'COMPLETED',
+    '예정': 'SCHEDULED',
+    '예정된': 'SCHEDULED'
+}
+_NUMBER_SELECT_RE = re.compile(r'(?:(완료|예정)\s*)?(\d+)')  # "완료 2", "예정 2", "2"
+_COMPLETED_MORE_RE = re.compile(r'완료.*(?:나머|더|추가|남)')
+_SCHEDULED_MORE_RE = re.compile(r'예정.*(?:나머|더|추가|남)')
+
+def classify_followup(user_query: str, intent: str = None) -> str:
+    """
+    awaiting_selection 상태의 후속 질문 분류 (한 번만 판정)
+
+    Returns:
+        'status_filter' | 'number' | 'more_completed' | 'more_scheduled' | 'more'
+        | 'new_search' | 'search_intent' | 'selection'
+
+    "완료 2", "완료 나머지"처럼 상태 키워드가 번호/나머지 요청에도 들어가므로
+    판정 순서는 기존 단계 순서를 그대로 따름
+    """
+    query = user_query.strip()
+    if query in _STATUS_FILTER_KEYWORDS:
+        return 'status_filter'
+    if _NUMBER_SELECT_RE.match(query):
+        return 'number'
+
+    query_lower = user_query.lower().replace(' ', '')  # 띄어쓰기 제거
+    if _COMPLETED_MORE_RE.search(query_lower):
+        return 'more_completed'
+    if _SCHEDULED_MORE_RE.search(query_lower):
+        return 'more_scheduled'
+    if (_MORE_KEYWORDS_RE.search(user_query) or _MORE_PATTERNS_RE.search(user_query)
+            or _FUZZY_MORE_RE.search(query_lower)):
+        return 'more'
+
+    if _STATUS_KEYWORDS_RE.search(user_query):
+        return 'new_search'
+    if _SEARCH_INTENT_RE.search(user_query) or intent == 'meeting_search':
+        return 'search_intent'
+    return 'selection'
+
+def _token_substring_re(tokens):
+    """
+    토큰 목록 → 한 번의 스캔으로 모든 등장 위치를 찾는 정규식
+    - lookahead라 겹치는 위치도 검사, 같은 위치에서는 긴 토큰 우선
+    """
+    alternation = '|'.join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+    return re.compile(f'(?=({alternation}))')
+
+# 컨텍스트 매칭 시 제외할 토큰 (정확히 일치하는 경우만)
+_EXCLUDED = frozenset(['회의', '알려', '알려줘', '보여', '보여줘', '찾아', '검색', '있어', '있었어', '있나', '관련', '뭐가', '어떤'])
+
+# 페르소나 정렬: 설정값은 실행 중 바뀌지 않으므로 import 시점에 한 번만 분기
+_persona_sort = search_with_persona if ENABLE_PERSONA else (lambda meetings, user_job: meetings)
+
 # ============================================================
 # Phase 2-A: Template 페르소나 함수들
 # ============================================================
@@ -102,11 +276,29 @@ def get_user_id_by_name(user_name: str) -> int:
             result = cursor.fetchone()
             return result['id'] if result else 1
         except Exception as e:
-            print(f"[ERROR] user_id 조회 실패: {e}")
+            logger.error("user_id 조회 실패: %s", e)
             return 1
         finally:
             cursor.close()
 
+def get_user_meta_by_name(user_name: str) -> dict:
+    """사용자 이름으로 user_id/직무/직급 조회 (없거나 실패하면 None)"""
+    from .database import get_db_connection
+    
+    with get_db_connection() as conn:
+        if not conn:
+            return None
+        
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT id, job, position FROM user WHERE name = %s", (user_name,))
+            return cursor.fetchone()
+        except Exception as e:
+            logger.error("사용자 정보 조회 실패: %s", e)
+            return None
+        finally:
+            cursor.close()
+
 # ============================================================
 # COUNT 질문 감지 함수
 # ============================================================
@@ -189,8 +381,8 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
         return ChatResponse(
             answer=lambda_response,
             history=request.history + [
-                {"role": "user", "content": user_query},
-                {"role": "assistant", "content": lambda_response}
+                {"role": ROLE_USER, "content": user_query},
+                {"role": ROLE_ASSISTANT, "content": lambda_response}
             ],
             source="lambda_raw",
             session_id=session_id
@@ -211,7 +403,7 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
 
 예시: "이번주 마케팅 회의", "1월 디자인 회의" """
         
-        print(f"[DEBUG] 너무 많은 결과: {total_count}개 → 재검색 유도")
+        logger.debug("너무 많은 결과: %s개 → 재검색 유도", total_count)
         
         return ChatResponse(
             answer=too_many_msg,
@@ -220,13 +412,13 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
         )
     
     # ========== 10개 미만: HyperCLOVA X에게 판단 맡기기 ==========
-    print(f"[DEBUG] {total_count}개 회의 발견 → HyperCLOVA X RAG 호출")
+    logger.debug("%s개 회의 발견 → HyperCLOVA X RAG 호출", total_count)
     
     # HyperCLOVA X RAG 호출 (여러 회의 처리 규칙 적용)
     rag_answer = call_hyperclova_rag(user_query, lambda_response)
     
     if rag_answer:
-        print(f"✅ RAG 답변 생성 성공!")
+        logger.debug("✅ RAG 답변 생성 성공!")
 
         shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
 
@@ -240,8 +432,8 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
             'original_query': user_query,
             'lambda_response': lambda_response
         }
-        save_context(session_id, context)
-        print(f"[DEBUG] 컨텍스트 저장 완료: {len(meetings[:5])}개 회의")
+        save_context_async(session_id, context)
+        logger.debug("컨텍스트 저장 완료: %s개 회의", len(meetings[:5]))
         
         return ChatResponse(
             answer=rag_answer,
@@ -250,7 +442,7 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
         )
     
     # RAG 실패 시 Lambda 원본 반환
-    print(f"⚠️ RAG 실패 → Lambda 원본 답변 반환")
+    logger.warning("⚠️ RAG 실패 → Lambda 원본 답변 반환")
     
     return ChatResponse(
         answer=lambda_response,
@@ -258,22 +450,6 @@ def handle_multiple_meetings(lambda_response: str, user_query: str,
         session_id=session_id
     )
 
-def is_obvious_pattern(user_query: str) -> bool:
-    """
-    명확한 패턴인지 확인 (LLM 호출 불필요)
-    """
-    query_strip = user_query.strip()
-    
-    obvious_patterns = [
-        # 번호 선택
-        query_strip.isdigit(),
-        # 날짜 선택 (정규식)
-        bool(re.match(r'^\d{1,2}월\s?\d{1,2}일$', query_strip)),
-        # 명확한 회의명 (길고 물음표 없음)
-        (len(user_query) > 8 and '회의' in user_query and not any(w in user_query for w in ['?', '뭐', '어떤', '있어'])),
-    ]
-    return any(obvious_patterns)
-
 def is_detail_question(query: str, context: dict) -> bool:
     """
     회의 상세 질문인지 판단
@@ -368,7 +544,7 @@ def is_participant_query(user_query: str, context: dict = None) -> dict:
         match = re.search(pattern, user_query)
         if match:
             person_name = match.group(1)
-            person_name = re.sub(r'[가이은는을를]$', '', person_name)
+            person_name = _RE_NAME_JOSA.sub('', person_name)
             
             if person_name not in ['사람', '누가', '누구', '회의', '미팅', '멤버', '거기', '여기']:
                 return {
@@ -432,7 +608,7 @@ def detect_pronoun_meeting_reference(user_query: str) -> bool:
                 similarity_miting = difflib.SequenceMatcher(None, next_token_clean, '미팅').ratio()
                 
                 if similarity_meeting >= 0.5 or similarity_miting >= 0.5:
-                    print(f"[DEBUG] 대명사 + 회의 유사 단어 감지: '{tokens[i]} {next_token}' (정제: '{next_token_clean}', 유사도: {max(similarity_meeting, similarity_miting):.1%})")
+                    logger.debug("대명사 + 회의 유사 단어 감지: '%s %s' (정제: '%s', 유사도: %.1f%%)", tokens[i], next_token, next_token_clean, max(similarity_meeting, similarity_miting) * 100)
                     return True
     
     return False
@@ -454,6 +630,203 @@ def needs_llm_analysis(user_query: str, context: dict) -> bool:
     # 3. 그 외는 LLM 안 씀
     return False
 
+# ============================================================
+# "나머지" 회의 페이지네이션
+# ============================================================
+
+def handle_more_meetings(request, session_id, context, meetings, user_query, requested_count, total_count):
+    """
+    통계 결과의 "나머지"/"더 보여줘" 처리 (last_shown_index 위치부터 requested_count개 표시)
+    """
+    start_idx = context.get('last_shown_index', 5)  # 기본값: 5개까지 봄
+    end_idx = min(start_idx + requested_count, len(meetings))
+    remaining_meetings = meetings[start_idx:end_idx]
+    
+    if not remaining_meetings:
+        answer = "더 이상 회의가 없어요! 😊\n\n이미 모든 회의를 보여드렸습니다."
+        return ChatResponse(
+            answer=answer,
+            history=request.history,
+            source="no_more_meetings",
+            session_id=session_id
+        )
+    
+    # ========== 상세 포맷으로 보여주기 ==========
+    parts = ["나머지 회의들이에요! 📋\n\n"]
+    
+    for i, meeting in enumerate(remaining_meetings):
+        actual_number = start_idx + i + 1
+        title = meeting.get('title', '제목 없음')
+        
+        # 저장 시점(또는 get_context)에 만들어둔 표시용 날짜 사용
+        date_str = meeting.get('scheduled_at_display', '')
+        
+        # summary 또는 description
+        summary = meeting.get('summary', '')
+        if not summary or summary.strip() == '':
+            summary = meeting.get('description', '내용 없음')
+        
+        # 1-2문장 (80자)
+        display_text = first_two_sentences(summary)
+        if len(display_text) > 80:
+            display_text = display_text[:80] + "..."
+        
+        parts.append(f"📌 {actual_number}. {title} {date_str}\n")
+        parts.append(f"   - {display_text}\n\n")
+    
+    # 남은 개수 계산
+    remaining_count = total_count - end_idx
+    
+    if remaining_count > 0:
+        parts.append(f"💡 이 외에도 {remaining_count}개가 더 있어요!\n")
+        parts.append("\"더 보여줘\" 또는 \"나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
+    else:
+        parts.append("✅ 모든 회의를 보여드렸어요!\n\n")
+    
+    parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+    parts.append(f"예: 번호({start_idx + 1}, {start_idx + 2}), 제목(디자인 회의) 😊")
+    answer = ''.join(parts)
+    
+    # ========== 컨텍스트 업데이트 (진행 상황 저장) ==========
+    context['state'] = 'awaiting_selection'
+    context['last_shown_index'] = end_idx  # 어디까지 봤는지 저장
+    update_context_fields(session_id, state='awaiting_selection', last_shown_index=end_idx)
+    
+    return ChatResponse(
+        answer=answer,
+        history=request.history + [
+            {"role": ROLE_USER, "content": user_query},
+            {"role": ROLE_ASSISTANT, "content": answer}
+        ],
+        source="count_remaining",
+        session_id=session_id
+    )
+
+# ============================================================
+# Intent 핸들러 (LLM 전처리 결과 intent → 처리 함수)
+# ============================================================
+
+def _handle_task_search(user_query, original_query, request, session_id, context, user_id, user_job, is_contextual, scope_expansion):
+    """task_search intent 처리 (선택된 회의 or 전체 회의의 할 일 검색)"""
+    # 컨텍스트 활용 여부 결정
+    if is_contextual and context and context.get('state') == 'meeting_selected' and not scope_expansion:
+        # 특정 회의의 할일 검색
+        selected_meeting_id = context.get('selected_meeting_id')
+        
+        logger.debug("Task 검색 - 컨텍스트 활용: meeting_id=%s", selected_meeting_id)
+        
+        from .search import search_tasks
+        task_response, tasks = search_tasks(
+            user_query=user_query,
+            user_id=user_id,
+            meeting_id=selected_meeting_id
+        )
+        
+        return ChatResponse(
+            answer=task_response,
+            history=request.history + [
+                {"role": ROLE_USER, "content": original_query},
+                {"role": ROLE_ASSISTANT, "content": task_response}
+            ],
+            source="task_search_contextual",
+            session_id=session_id
+        )
+    else:
+        # 전체 회의의 할일 검색 (scope_expansion=True 또는 컨텍스트 없음)
+        logger.debug("Task 검색 - 전체 검색 (scope_expansion=%s)", scope_expansion)
+        
+        from .search import search_tasks
+        task_response, tasks = search_tasks(
+            user_query=user_query,
+            user_id=user_id,
+            meeting_id=None
+        )
+        
+        return ChatResponse(
+            answer=task_response,
+            history=request.history + [
+                {"role": ROLE_USER, "content": original_query},
+                {"role": ROLE_ASSISTANT, "content": task_response}
+            ],
+            source="task_search_global",
+            session_id=session_id
+        )
+
+def _handle_keyword_search(user_query, original_query, request, session_id, context, user_id, user_job, is_contextual, scope_expansion):
+    """keyword_search intent 처리 (키워드가 등록된 회의 검색)"""
+    # "'예산' 키워드 있는 회의?"
+    logger.debug("Keyword 검색 intent 감지")
+    
+    # 키워드 추출 (따옴표 있으면 따옴표 안, 없으면 첫 단어)
+    keyword_pattern = re.search(r"['\"\'](.+?)['\"\']", user_query)
+
+    if keyword_pattern:
+        keyword_name = keyword_pattern.group(1).strip()
+    elif '키워드' in user_query:
+        # "전략 키워드 있는 회의?" → "전략" 추출
+        keyword_match = re.search(r'([가-힣a-zA-Z0-9]+)\s*키워드', user_query)
+        if keyword_match:
+            keyword_name = keyword_match.group(1).strip()
+        else:
+            keyword_name = None
+    else:
+        keyword_name = None
+    
+    if keyword_name:
+        logger.debug("Keyword 검색: '%s'", keyword_name)
+        
+        from .search import search_keywords
+        keyword_response, meetings = search_keywords(
+            keyword_name=keyword_name,
+            user_job=user_job
+        )
+        
+        # 컨텍스트 저장 (단일 회의면)
+        if meetings and len(meetings) == 1:
+            save_context_async(session_id, {
+                'state': 'meeting_selected',
+                'selected_meeting_id': meetings[0]['id'],
+                'meeting_title': meetings[0]['title']
+            })
+            logger.debug("단일 회의 컨텍스트 저장: meeting_id=%s", meetings[0]['id'])
+        elif meetings and len(meetings) > 1:
+            shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
+
+            build_and_save_meeting_context(
+                session_id, meetings[:10], 'awaiting_selection',
+                shown_completed=shown_completed,
+                shown_scheduled=shown_scheduled,
+                offset=min(5, len(meetings[:10])),
+                total_count=len(meetings)
+            )
+            logger.debug("여러 회의 컨텍스트 저장: %s개", len(meetings))
+        
+        return ChatResponse(
+            answer=keyword_response,
+            history=request.history + [
+                {"role": ROLE_USER, "content": original_query},
+                {"role": ROLE_ASSISTANT, "content": keyword_response}
+            ],
+            source="keyword_search",
+            session_id=session_id
+        )
+    else:
+        # 키워드 추출 실패
+        return ChatResponse(
+            answer="어떤 키워드로 검색하시겠어요? 😊\n예: \"'예산' 키워드 있는 회의?\"",
+            history=request.history + [
+                {"role": ROLE_USER, "content": original_query},
+                {"role": ROLE_ASSISTANT, "content": "어떤 키워드로 검색하시겠어요? 😊"}
+            ],
+            source="keyword_clarification",
+            session_id=session_id
+        )
+
+INTENT_HANDLERS = {
+    'task_search': _handle_task_search,
+    'keyword_search': _handle_keyword_search,
+}
+
 # ============================================================
 # 엔드포인트
 # ============================================================
@@ -463,8 +836,9 @@ def root():
     """헬스 체크"""
     return {"status": "ok", "message": "회의록 검색 챗봇 서버가 실행 중입니다."}
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post("/chat", response_model=ChatResponse, response_model_exclude_none=True)
 async def chat(request: ChatRequest):
+    batch_token = begin_write_batch()  # 이번 요청의 컨텍스트 저장은 응답 시점에 한 번에 전송
     try:
         session_id = request.session_id or str(uuid.uuid4())
         user_query = request.message.strip()
@@ -475,31 +849,30 @@ async def chat(request: ChatRequest):
             original_user_query = user_query
             user_query = user_query.replace('나의', user_name).replace('내', user_name).replace('나', user_name).replace('저', user_name)
             if original_user_query != user_query:
-                print(f"[자동 치환] '{original_user_query}' → '{user_query}'")
+                logger.debug("[자동 치환] '%s' → '%s'", original_user_query, user_query)
 
         # user_job/user_position 처리: NONE이 아니면 해당 값 사용, NONE이면 DB에서 조회
         user_job = request.user_job if request.user_job and request.user_job != 'NONE' else None
         user_position = request.user_position if request.user_position and request.user_position != 'NONE' else None
         
-        # user_id 먼저 조회 (항상 필요함!)
-        user_id = get_user_id_by_name(user_name)
-
-        # DB에서 사용자 정보 조회 (직무/직급이 NONE일 때만)
-        if not user_job or not user_position:
-            from .database import get_db_connection
-            
-            with get_db_connection() as conn:
-                if conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT job, position FROM user WHERE id = %s", (user_id,))
-                    user_data = cursor.fetchone()
-                    cursor.close()
-                    
-                    if user_data:
-                        if not user_job:
-                            user_job = user_data.get('job', 'NONE')
-                        if not user_position:
-                            user_position = user_data.get('position', 'NONE')
+        # 컨텍스트 + 캐시된 사용자 정보를 Redis 왕복 한 번으로 조회
+        context, user_meta = load_request_state(session_id, user_name)
+        
+        # 캐시에 없으면 DB에서 user_id/직무/직급 한 번에 조회 (항상 필요함!)
+        if user_meta is None:
+            user_meta = get_user_meta_by_name(user_name)
+            if user_meta:
+                save_user_meta(user_name, user_meta)
+            else:
+                user_meta = {'id': 1, 'job': None, 'position': None}
+        
+        user_id = user_meta['id']
+        
+        # 직무/직급이 NONE일 때만 DB 값 사용
+        if not user_job:
+            user_job = user_meta.get('job', 'NONE')
+        if not user_position:
+            user_position = user_meta.get('position', 'NONE')
         
         # 기본값 설정
         if not user_job:
@@ -516,18 +889,15 @@ async def chat(request: ChatRequest):
         if user_job_normalized not in valid_jobs:
             user_job_normalized = 'NONE'
             
-        print(f"\n{'='*70}")
-        print(f"💬 사용자 질문: {user_query}")
-        print(f"👤 User Name: {user_name}")
-        print(f"👤 User Job (원본): {user_job}")
-        print(f"👤 User Job (정규화): {user_job_normalized}")
-        print(f"👤 User Position: {user_position}")
-        print(f"🔑 Session ID: {session_id}")
-        print(f"{'='*70}\n")
+        logger.debug("💬 사용자 질문: %s", user_query)
+        logger.debug("👤 User Name: %s", user_name)
+        logger.debug("👤 User Job (원본): %s", user_job)
+        logger.debug("👤 User Job (정규화): %s", user_job_normalized)
+        logger.debug("👤 User Position: %s", user_position)
+        logger.debug("🔑 Session ID: %s", session_id)
 
         # ========== 변수 초기화 ==========
         original_query = user_query
-        context = get_context(session_id)
         intent = None
         llm_analysis = None
 
@@ -536,7 +906,7 @@ async def chat(request: ChatRequest):
         name_reuse_condition = False
         if context and context.get('state') == 'meeting_selected' and context.get('last_person_name'):
             pronoun_detected = detect_pronoun_meeting_reference(user_query)
-            print(f"[DEBUG] 이름 재사용 조건 체크: state={context.get('state')}, name={context.get('last_person_name')}, pronoun={pronoun_detected}")
+            logger.debug("이름 재사용 조건 체크: state=%s, name=%s, pronoun=%s", context.get('state'), context.get('last_person_name'), pronoun_detected)
             if pronoun_detected:
                 name_reuse_condition = True
         
@@ -558,7 +928,7 @@ async def chat(request: ChatRequest):
         )
                 
         if is_task_query_preliminary:
-            print(f"[DEBUG] Task 질문 우선 감지 → LLM 건너뛰기")
+            logger.debug("Task 질문 우선 감지 → LLM 건너뛰기")
             # Task 질문은 LLM 없이 바로 처리
 
         # ========== 확인 질문 처리 ==========
@@ -573,27 +943,23 @@ async def chat(request: ChatRequest):
                     source="confirmation",
                     session_id=session_id,
                     history=request.history + [
-                        {"role": "user", "content": user_query},
-                        {"role": "assistant", "content": f"네, 맞아요! 총 {meeting_count}개의 회의예요. 😊"}
+                        {"role": ROLE_USER, "content": user_query},
+                        {"role": ROLE_ASSISTANT, "content": f"네, 맞아요! 총 {meeting_count}개의 회의예요. 😊"}
                     ]
                 )
             
             # 2. 페이지네이션 요청 (나머지/더)
-            more_keywords = ['나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여', 
-                            '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서', 
-                            '다음', '또', '그외', '줘봐', '줘', '보여줘']
-            
-            if any(keyword in user_query for keyword in more_keywords):
-                print(f"[DEBUG] meeting_list_shown 상태에서 페이지네이션 요청")
+            if _LIST_MORE_RE.search(user_query):
+                logger.debug("meeting_list_shown 상태에서 페이지네이션 요청")
                 # 상태를 awaiting_selection으로 변경하고 아래 로직으로 넘김
                 context['state'] = 'awaiting_selection'
-                save_context(session_id, context)
+                update_context_fields(session_id, state='awaiting_selection')
                 # 아래 awaiting_selection 처리로 넘어감
         
         # ========== 번호 선택 우선 체크 ==========
         elif (context and context.get('state') == 'awaiting_selection' and 
             user_query.strip().isdigit()):
-            print(f"[DEBUG] 번호 선택 감지 → 선택 처리로 이동")
+            logger.debug("번호 선택 감지 → 선택 처리로 이동")
             # 선택 처리로 넘어감
 
         # ========== RAG 상세 질문 우선 체크 ==========
@@ -604,28 +970,28 @@ async def chat(request: ChatRequest):
             # COUNT 질문이 아니고, 검색 키워드도 없으면 RAG 가능성
             if (not is_count_question(user_query) and  # ← 함수 호출로 변경
                 not any(word in user_query for word in ['회의', '검색', '할일', '참석', '키워드'])):
-                print(f"[DEBUG] RAG 상세 질문 가능성 → LLM으로 확인")
+                logger.debug("RAG 상세 질문 가능성 → LLM으로 확인")
         
         # ========== 1차: 명확한 패턴 빠른 처리 ==========
         elif is_obvious_pattern(user_query):
-            print(f"[DEBUG] 명확한 패턴 감지 → LLM 호출 스킵")
+            logger.debug("명확한 패턴 감지 → LLM 호출 스킵")
             intent = 'meeting_search'
 
         # ========== 2차: LLM 전처리 (오타 보정 + 의도 파악) ==========
         elif needs_llm_analysis(user_query, context):
-            print(f"[DEBUG] LLM 전처리 필요 → HyperCLOVA X 호출")
-            from .llm import preprocess_query_with_llm
+            logger.debug("LLM 전처리 필요 → HyperCLOVA X 호출")
+            from .llm import preprocess_query_with_llm_async
             
-            llm_analysis = preprocess_query_with_llm(user_query, context)
+            llm_analysis = await preprocess_query_with_llm_async(user_query, context)
             
             corrected_query = llm_analysis.get('corrected_query', user_query)
             intent = llm_analysis.get('intent', 'meeting_search')
             is_contextual = llm_analysis.get('is_contextual', False)
             
-            print(f"[LLM 분석] 원본: {user_query}")
-            print(f"[LLM 분석] 보정: {corrected_query}")
-            print(f"[LLM 분석] 의도: {intent}")
-            print(f"[LLM 분석] 컨텍스트 사용: {is_contextual}")
+            logger.debug("[LLM 분석] 원본: %s", user_query)
+            logger.debug("[LLM 분석] 보정: %s", corrected_query)
+            logger.debug("[LLM 분석] 의도: %s", intent)
+            logger.debug("[LLM 분석] 컨텍스트 사용: %s", is_contextual)
             
             # 보정된 쿼리로 교체
             user_query = corrected_query
@@ -636,10 +1002,10 @@ async def chat(request: ChatRequest):
             is_new_search_intent = llm_analysis.get('intent') == 'meeting_search'
             
             # 명확한 선택 패턴인지 확인 (숫자/날짜만 허용)
-            is_obvious_selection = user_query.strip().isdigit() or bool(re.match(r'^\d{1,2}월\s?\d{1,2}일$', user_query.strip()))
+            is_obvious_selection = user_query.strip().isdigit() or bool(_RE_OBVIOUS_DATE.match(user_query.strip()))
             
             if is_selection_state and is_new_search_intent and not is_obvious_selection:
-                print(f"[DEBUG] 새로운 검색 의도 감지 (LLM Intent: {intent}) → 컨텍스트 무시")
+                logger.debug("새로운 검색 의도 감지 (LLM Intent: %s) → 컨텍스트 무시", intent)
                 delete_context(session_id)
                 # 컨텍스트를 삭제했으므로, 아래 Task/Participant 처리는 건너뛰고 
                 # 최종 MySQL 검색으로 바로 진입하도록 pass 처리합니다.
@@ -648,67 +1014,36 @@ async def chat(request: ChatRequest):
             # ========== Intent별 자동 처리 (Task/Participant) ==========
             scope_expansion = llm_analysis.get('scope_expansion', False) if llm_analysis else False
 
+            handler = INTENT_HANDLERS.get(intent)
+
             # 1. Task 검색 intent
             if intent == 'task_search':
-                # 컨텍스트 활용 여부 결정
-                if is_contextual and context and context.get('state') == 'meeting_selected' and not scope_expansion:
-                    # 특정 회의의 할일 검색
-                    selected_meeting_id = context.get('selected_meeting_id')
-                    meeting_title = context.get('meeting_title', '')
-                    
-                    print(f"[DEBUG] Task 검색 - 컨텍스트 활용: meeting_id={selected_meeting_id}")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=selected_meeting_id
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_contextual",
-                        session_id=session_id
-                    )
-                else:
-                    # 전체 회의의 할일 검색 (scope_expansion=True 또는 컨텍스트 없음)
-                    print(f"[DEBUG] Task 검색 - 전체 검색 (scope_expansion={scope_expansion})")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=None
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_global",
-                        session_id=session_id
-                    )
+                return handler(
+                    user_query=user_query,
+                    original_query=original_query,
+                    request=request,
+                    session_id=session_id,
+                    context=context,
+                    user_id=user_id,
+                    user_job=user_job_normalized,
+                    is_contextual=is_contextual,
+                    scope_expansion=scope_expansion
+                )
             
             # 2. Participant 검색 intent
             elif intent == 'participant_search':
                 # 특정 회의 참석자 vs 특정 사람이 참석한 회의
                 
                 # 이름 패턴 확인
-                name_match = re.search(r'([가-힣]{2,4})', user_query)
+                name_match = _RE_PERSON_NAME.search(user_query)
                 
                 # 1순위: "누가 참석" 패턴 체크
                 if '누가' in user_query:
                     # "마케팅 회의에 누가 참석했어?" → 회의 검색 후 참석자 조회
-                    meeting_keyword_match = re.search(r'(.+?)\s*회의', user_query)
+                    meeting_keyword_match = _RE_MEETING_KEYWORD.search(user_query)
                     if meeting_keyword_match:
                         meeting_keyword = meeting_keyword_match.group(1).strip()
-                        print(f"[DEBUG] Participant 검색 - 회의명으로 검색: {meeting_keyword}")
+                        logger.debug("Participant 검색 - 회의명으로 검색: %s", meeting_keyword)
                         
                         # 회의 검색
                         from .search import search_meetings_direct
@@ -731,8 +1066,8 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=participant_response,
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": participant_response}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": participant_response}
                                 ],
                                 source="participant_meeting_members",
                                 session_id=session_id
@@ -772,8 +1107,8 @@ async def chat(request: ChatRequest):
                     # 특정 사람이 참석한 회의 검색
                     person_name = name_match.group(1)
                     # 조사 제거 (가, 이, 은, 는, 을, 를)
-                    person_name = re.sub(r"[가이은는을를]$", "", person_name)
-                    print(f"[DEBUG] Participant 검색 - 특정 사람: {person_name}")
+                    person_name = _RE_NAME_JOSA.sub("", person_name)
+                    logger.debug("Participant 검색 - 특정 사람: %s", person_name)
                     
                     from .search import search_participants
                     participant_response, results = search_participants(
@@ -790,39 +1125,27 @@ async def chat(request: ChatRequest):
                             'meeting_title': meeting['title'],
                             'original_query': user_query
                         }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 단일 회의 컨텍스트 저장: meeting_id={meeting['id']}")
+                        save_context_async(session_id, context)
+                        logger.debug("단일 회의 컨텍스트 저장: meeting_id=%s", meeting['id'])
                     elif results and len(results) > 1:
                         # 여러 회의 - 선택 대기 상태
-                        meetings_serializable = []
-                        for meeting in results:
-                            meeting_copy = {}
-                            for key, value in meeting.items():
-                                if isinstance(value, datetime):
-                                    meeting_copy[key] = value.isoformat()
-                                else:
-                                    meeting_copy[key] = value
-                            meetings_serializable.append(meeting_copy)
-                        
                         shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
 
-                        context = {
-                            'state': 'awaiting_selection',
-                            'shown_completed': shown_completed,
-                            'shown_scheduled': shown_scheduled,
-                            'meetings': meetings_serializable[:10],
-                            'offset': min(5, len(meetings_serializable[:10])),
-                            'total_count': len(results),
-                            'original_query': user_query
-                        }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 여러 회의 컨텍스트 저장: {len(results)}개")
+                        context = build_and_save_meeting_context(
+                            session_id, results[:10], 'awaiting_selection',
+                            shown_completed=shown_completed,
+                            shown_scheduled=shown_scheduled,
+                            offset=min(5, len(results[:10])),
+                            total_count=len(results),
+                            original_query=user_query
+                        )
+                        logger.debug("여러 회의 컨텍스트 저장: %s개", len(results))
                     
                     return ChatResponse(
                         answer=participant_response,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": participant_response}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": participant_response}
                         ],
                         source="participant_person_meetings",
                         session_id=session_id
@@ -831,7 +1154,7 @@ async def chat(request: ChatRequest):
                 elif is_contextual and context and context.get('state') == 'meeting_selected':
                     # 특정 회의의 참석자 조회
                     selected_meeting_id = context.get('selected_meeting_id')
-                    print(f"[DEBUG] Participant 검색 - 특정 회의: meeting_id={selected_meeting_id}")
+                    logger.debug("Participant 검색 - 특정 회의: meeting_id=%s", selected_meeting_id)
                     
                     from .search import search_participants
                     participant_response, results = search_participants(
@@ -842,8 +1165,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer=participant_response,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": participant_response}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": participant_response}
                         ],
                         source="participant_meeting_members",
                         session_id=session_id
@@ -856,8 +1179,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer=fallback_msg,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": fallback_msg}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": fallback_msg}
                         ],
                         source="participant_clarification",
                         session_id=session_id
@@ -865,7 +1188,7 @@ async def chat(request: ChatRequest):
         
             # ========== LLM 보정 후 다시 Task 체크 ==========
             if intent == 'task_search' or (context and context.get('selected_meeting_id') and detect_pronoun_meeting_reference(user_query)):
-                print(f"[DEBUG] LLM 보정 후 Task 질문 재감지")
+                logger.debug("LLM 보정 후 Task 질문 재감지")
                 # Task 질문이면 아래 is_task_query로 진행
         
         # ========== Task 질문 체크 ==========
@@ -909,7 +1232,7 @@ async def chat(request: ChatRequest):
         #     )
         
         if is_task_query:
-            print(f"[DEBUG] Task 질문 감지")
+            logger.debug("Task 질문 감지")
             
             from .search import search_tasks
             
@@ -918,7 +1241,7 @@ async def chat(request: ChatRequest):
             if context and context.get('selected_meeting_id'):
                 if not any(keyword in user_query for keyword in ['전체', '모든', '전부', '다른 회의']):
                     meeting_id_from_context = context['selected_meeting_id']
-                    print(f"[컨텍스트] 회의 ID={meeting_id_from_context}의 Task 조회")
+                    logger.debug("[컨텍스트] 회의 ID=%s의 Task 조회", meeting_id_from_context)
             
             # "X 회의에서 할일" 패턴 감지
             has_meeting_context_in_query = (
@@ -929,7 +1252,7 @@ async def chat(request: ChatRequest):
             meeting_id = None
             
             if has_meeting_context_in_query:
-                print(f"[DEBUG] 'X 회의에서 할일' 패턴 감지 → 회의 검색 먼저")
+                logger.debug("'X 회의에서 할일' 패턴 감지 → 회의 검색 먼저")
                 
                 # 대명사 체크
                 pronouns = ['저 회의', '그 회의', '이 회의', '해당 회의', '거기', '저회의', '그회의', '이회의']
@@ -938,7 +1261,7 @@ async def chat(request: ChatRequest):
                 if has_pronoun and context and context.get('selected_meeting_id'):
                     # 대명사면 무조건 컨텍스트 사용
                     meeting_id = context['selected_meeting_id']
-                    print(f"[DEBUG] 대명사 감지 → 컨텍스트 회의 사용 (ID: {meeting_id})")
+                    logger.debug("대명사 감지 → 컨텍스트 회의 사용 (ID: %s)", meeting_id)
                 else:
                     # 회의명으로 검색
                     meeting_pattern = r'([가-힣a-zA-Z0-9\s]+)(회의|미팅)에서'
@@ -946,7 +1269,7 @@ async def chat(request: ChatRequest):
                     
                     if match:
                         meeting_query = match.group(1).strip() + match.group(2)
-                        print(f"[DEBUG] 추출된 회의명: {meeting_query}")
+                        logger.debug("추출된 회의명: %s", meeting_query)
                         
                         from .search import search_meetings_direct
                         _, meetings = search_meetings_direct(
@@ -960,12 +1283,12 @@ async def chat(request: ChatRequest):
                         
                         if meetings and len(meetings) == 1:
                             meeting_id = meetings[0]['id']
-                            print(f"[DEBUG] 단일 회의 발견: {meetings[0]['title']} (ID: {meeting_id})")
+                            logger.debug("단일 회의 발견: %s (ID: %s)", meetings[0]['title'], meeting_id)
                         elif meetings and len(meetings) > 1:
                             meeting_id = meetings[0]['id']
-                            print(f"[DEBUG] 여러 '{meeting_query}' 발견 ({len(meetings)}개) → 최신 회의 사용: {meetings[0]['title']} (ID: {meeting_id})")
+                            logger.debug("여러 '%s' 발견 (%s개) → 최신 회의 사용: %s (ID: %s)", meeting_query, len(meetings), meetings[0]['title'], meeting_id)
                         else:
-                            print(f"[DEBUG] '{meeting_query}' 회의를 찾을 수 없음")
+                            logger.debug("'%s' 회의를 찾을 수 없음", meeting_query)
 
             # 컨텍스트 우선 사용
             if not meeting_id:
@@ -977,14 +1300,15 @@ async def chat(request: ChatRequest):
                 # "전체" 키워드만 체크 (타인 이름은 search_tasks에서 판단)
                 if any(keyword in user_query for keyword in ['전체', '모든', '전부']):
                     meeting_id = None
-                    print(f"[DEBUG] '{user_query}' - 전체 검색 키워드 감지, meeting_id 초기화")
+                    logger.debug("'%s' - 전체 검색 키워드 감지, meeting_id 초기화", user_query)
 
             # 기존 함수 사용!
             user_id = get_user_id_by_name(user_name)
-            print(f"[DEBUG] user_id 조회 성공: {user_id}")
+            logger.debug("user_id 조회 성공: %s", user_id)
 
             # 타인 이름 목록 DB에서 조회
             from .config import DB_CONFIG
+            from .database import get_db_connection
 
             try:
                 with get_db_connection() as conn:
@@ -993,11 +1317,11 @@ async def chat(request: ChatRequest):
                         cursor.execute("SELECT name FROM user WHERE id != %s", (user_id,))
                         other_names = [row['name'] for row in cursor.fetchall()]
                         cursor.close()
-                        print(f"[DEBUG] DB에서 타인 이름 조회: {other_names}")
+                        logger.debug("DB에서 타인 이름 조회: %s", other_names)
                     else:
                         other_names = []
             except Exception as e:
-                print(f"[DEBUG] 타인 이름 조회 실패: {e}")
+                logger.debug("타인 이름 조회 실패: %s", e)
                 other_names = []
             
             # 1. 이름이 쿼리에 있으면 저장
@@ -1005,8 +1329,8 @@ async def chat(request: ChatRequest):
                 if name in user_query:
                     if context:
                         context['last_person_name'] = name
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 컨텍스트에 이름 저장: {name}")
+                        save_context_async(session_id, context)
+                        logger.debug("컨텍스트에 이름 저장: %s", name)
                     break
             
             # 2. 이름이 없고 + meeting_id 있고 + 이전 이름 있으면 → 이름 재사용
@@ -1015,10 +1339,10 @@ async def chat(request: ChatRequest):
                 has_name_in_query = any(name in user_query for name in other_names)
                 if not has_name_in_query:
                     person_name = context.get('last_person_name')
-                    print(f"[DEBUG] 이전 질문의 이름 재사용: {person_name}")
+                    logger.debug("이전 질문의 이름 재사용: %s", person_name)
                     # user_query에 이름 추가
                     user_query = user_query + f" {person_name}"
-                    print(f"[DEBUG] 쿼리 확장: {user_query}")
+                    logger.debug("쿼리 확장: %s", user_query)
 
             # user_id를 어디서 가져올지 결정
             from .database import get_db_connection
@@ -1028,11 +1352,11 @@ async def chat(request: ChatRequest):
             message, tasks = search_tasks(user_query, user_id=user_id, meeting_id=meeting_id, user_name=user_name)
 
             # Task 검색 시에도 컨텍스트 저장
-            print(f"[DEBUG] Task 검색 완료, meeting_id={meeting_id}")
+            logger.debug("Task 검색 완료, meeting_id=%s", meeting_id)
              
             if meeting_id:
                 try:
-                    print(f"[DEBUG] 컨텍스트 저장 시도: meeting_id={meeting_id}")
+                    logger.debug("컨텍스트 저장 시도: meeting_id=%s", meeting_id)
                     
                     from .database import get_db_connection
                     
@@ -1055,23 +1379,21 @@ async def chat(request: ChatRequest):
                                     'selected_meeting_id': meeting_id,
                                     'meeting_title': title,
                                 })
-                                save_context(session_id, existing_context)
-                                print(f"[DEBUG] ✅ 컨텍스트 저장 성공: meeting_id={meeting_id}, title={title}")
+                                save_context_async(session_id, existing_context)
+                                logger.debug("✅ 컨텍스트 저장 성공: meeting_id=%s, title=%s", meeting_id, title)
                             else:
-                                print(f"[DEBUG] ❌ 회의 정보 조회 실패: meeting_id={meeting_id}")
+                                logger.debug("❌ 회의 정보 조회 실패: meeting_id=%s", meeting_id)
                                 
                 except Exception as e:
-                    print(f"[DEBUG] ❌ 컨텍스트 저장 중 예외 발생: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("컨텍스트 저장 중 예외 발생: %s", e)
             else:
-                print(f"[DEBUG] meeting_id 없음, 컨텍스트 저장 스킵")
+                logger.debug("meeting_id 없음, 컨텍스트 저장 스킵")
 
             return ChatResponse(
                 answer=message,
                 history=request.history + [
-                    {"role": "user", "content": user_query},
-                    {"role": "assistant", "content": message}
+                    {"role": ROLE_USER, "content": user_query},
+                    {"role": ROLE_ASSISTANT, "content": message}
                 ],
                 source="task_query",
                 session_id=session_id
@@ -1091,13 +1413,13 @@ async def chat(request: ChatRequest):
             llm_intent = classify_query_intent(user_query, meeting_title)
             if llm_intent == "RAG":
                 is_detail_question = True
-                print(f"[LLM 보강] RAG 질문으로 재분류")
+                logger.debug("[LLM 보강] RAG 질문으로 재분류")
 
         if (context and context.get('state') == 'meeting_selected' and 
             is_detail_question and
             intent not in ['task_search', 'participant_search', 'meeting_search']):
             
-            print(f"[DEBUG] RAG 상세 질문 처리: '{user_query}'")
+            logger.debug("RAG 상세 질문 처리: '%s'", user_query)
 
             selected_meeting_id = context.get('selected_meeting_id')
             meeting_title = context.get('meeting_title', '선택된 회의')
@@ -1109,8 +1431,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer="데이터베이스 연결에 실패했어요. 😢",
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": "데이터베이스 연결에 실패했어요. 😢"}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": "데이터베이스 연결에 실패했어요. 😢"}
                         ],
                         source="db_connection_error",
                         session_id=session_id
@@ -1147,8 +1469,8 @@ async def chat(request: ChatRequest):
                         return ChatResponse(
                             answer=rag_answer,
                             history=request.history + [
-                                {"role": "user", "content": original_query},
-                                {"role": "assistant", "content": rag_answer}
+                                {"role": ROLE_USER, "content": original_query},
+                                {"role": ROLE_ASSISTANT, "content": rag_answer}
                             ],
                             source="meeting_detail_rag",
                             session_id=session_id
@@ -1167,7 +1489,7 @@ async def chat(request: ChatRequest):
             selected_meeting_id = context.get('selected_meeting_id')
             selected_meeting_title = context.get('meeting_title', '')
             
-            print(f"[컨텍스트] 이전 선택 회의: {selected_meeting_title} (ID: {selected_meeting_id})")
+            logger.debug("[컨텍스트] 이전 선택 회의: %s (ID: %s)", selected_meeting_title, selected_meeting_id)
             
             # 짧은 질문이거나 대명사 사용하면 회의명 추가
             # 단, 새로운 검색 의도가 명확한 경우는 제외
@@ -1187,13 +1509,13 @@ async def chat(request: ChatRequest):
                 intent = classify_query_intent(user_query, selected_meeting_title)
                 if intent == "RAG":
                     is_detail_question = True
-                    print(f"[LLM 보강] RAG 질문으로 재분류")
+                    logger.debug("[LLM 보강] RAG 질문으로 재분류")
 
             if context and context.get('state') == 'meeting_selected':
                 selected_meeting_id = context.get('selected_meeting_id')
                 selected_meeting_title = context.get('meeting_title', '')
                 
-                print(f"[컨텍스트] 이전 선택 회의: {selected_meeting_title} (ID: {selected_meeting_id})")
+                logger.debug("[컨텍스트] 이전 선택 회의: %s (ID: %s)", selected_meeting_title, selected_meeting_id)
                 
                 # 🔹 LLM으로 의도 분류
                 from .llm import classify_query_intent
@@ -1201,12 +1523,12 @@ async def chat(request: ChatRequest):
                 
                 if intent == "RAG":
                     # RAG 상세 질문 → 컨텍스트 유지, 확장 안 함
-                    print(f"[LLM 의도] RAG 질문 → 컨텍스트 유지")
+                    logger.debug("[LLM 의도] RAG 질문 → 컨텍스트 유지")
                     # selected_meeting_id 유지하여 1055번 줄 RAG 처리로 진행
                     
                 elif intent == "NEW_SEARCH":
                     # 새로운 검색 → 컨텍스트 삭제
-                    print(f"[LLM 의도] 새로운 검색 → 컨텍스트 삭제")
+                    logger.debug("[LLM 의도] 새로운 검색 → 컨텍스트 삭제")
                     context = None
                     selected_meeting_id = None
                     selected_meeting_title = None
@@ -1216,9 +1538,9 @@ async def chat(request: ChatRequest):
                     # 컨텍스트 확장 (할일, 담당자 등)
                     if not is_count_check:  # COUNT 질문은 확장 안 함
                         user_query = f"{selected_meeting_title} 회의에서 {user_query}"
-                        print(f"[LLM 의도] 컨텍스트 확장: {user_query}")
+                        logger.debug("[LLM 의도] 컨텍스트 확장: %s", user_query)
                     else:
-                        print(f"[LLM 의도] CONTEXT_DEPENDENT이지만 COUNT 질문 → 확장 안 함")
+                        logger.debug("[LLM 의도] CONTEXT_DEPENDENT이지만 COUNT 질문 → 확장 안 함")
 
             # 명확한 컨텍스트 참조가 있으면 무조건 컨텍스트 활용
             has_context_ref = any(ref in user_query for ref in context_refs)
@@ -1283,18 +1605,18 @@ async def chat(request: ChatRequest):
 
             if should_use_context:
                 user_query = f"{selected_meeting_title} 회의에서 {user_query}"
-                print(f"[컨텍스트 확장] {original_query} → {user_query}")
+                logger.debug("[컨텍스트 확장] %s → %s", original_query, user_query)
             elif is_detail_question:
-                print(f"[RAG 질문] 컨텍스트 확장 안 함: {user_query}")
+                logger.debug("[RAG 질문] 컨텍스트 확장 안 함: %s", user_query)
 
             else:
                 if wants_global_search:
-                    print(f"[컨텍스트] 전체 검색 요청 → 컨텍스트 무시")
+                    logger.debug("[컨텍스트] 전체 검색 요청 → 컨텍스트 무시")
                 elif is_count_check:
-                    print(f"[컨텍스트] 개수 확인 질문 → 컨텍스트 유지 (확장 안 함)")
+                    logger.debug("[컨텍스트] 개수 확인 질문 → 컨텍스트 유지 (확장 안 함)")
                     # COUNT 질문은 컨텍스트는 유지하되 확장하지 않음
                 else:
-                    print(f"[컨텍스트] 새로운 검색 → 컨텍스트 무시")
+                    logger.debug("[컨텍스트] 새로운 검색 → 컨텍스트 무시")
                     context = None
                     selected_meeting_id = None  # 컨텍스트 필터 해제
                     selected_meeting_title = None
@@ -1314,7 +1636,7 @@ async def chat(request: ChatRequest):
                         any(re.search(pattern, user_query) for pattern in count_patterns)
 
         if is_count_query:
-            print(f"\n📊 통계 질문 감지: '{user_query}'")
+            logger.debug("📊 통계 질문 감지: '%s'", user_query)
             
             # 날짜/상태 파싱
             date_info = parse_date_from_query(user_query)
@@ -1323,7 +1645,7 @@ async def chat(request: ChatRequest):
             # 컨텍스트에서 이전 검색 상태 가져오기
             if not status and context and context.get('search_status'):
                 status = context.get('search_status')
-                print(f"[DEBUG] 컨텍스트에서 상태 복원: {status}")
+                logger.debug("컨텍스트에서 상태 복원: %s", status)
                 
             # ========== "했어" 같은 과거형 어미가 있으면 완료된 회의로 처리 ==========
             if not status:
@@ -1334,7 +1656,7 @@ async def chat(request: ChatRequest):
                 for pattern in past_tense_patterns:
                     if re.search(pattern, user_query):
                         status = 'COMPLETED'
-                        print(f"[DEBUG] 통계 질문 + 과거형 어미 → COMPLETED로 처리")
+                        logger.debug("통계 질문 + 과거형 어미 → COMPLETED로 처리")
                         break
             
             # 일반적인 회의 목록 요청 패턴 체크
@@ -1342,7 +1664,7 @@ async def chat(request: ChatRequest):
             is_general_request = any(p in user_query for p in general_list_patterns) and not date_info.get('type')
             
             if is_general_request:
-                print("[DEBUG] 일반 회의 목록 요청으로 판단 → 키워드 검색 생략")
+                logger.debug("일반 회의 목록 요청으로 판단 → 키워드 검색 생략")
                 keywords = []  # 키워드 없이 전체 검색
             else:
                 keywords = extract_keywords_from_query(user_query)
@@ -1358,12 +1680,12 @@ async def chat(request: ChatRequest):
             # 키워드 없으면 컨텍스트에서 재사용
             if not keywords and context and context.get('original_query'):
                 original_query = context.get('original_query')
-                print(f"[DEBUG] COUNT - 키워드 없음, 컨텍스트에서 추출: '{original_query}'")
+                logger.debug("COUNT - 키워드 없음, 컨텍스트에서 추출: '%s'", original_query)
                 keywords = extract_keywords_from_query(original_query)
                 keywords = [k for k in keywords if k not in excluded_for_count]
-                print(f"[DEBUG] COUNT - 컨텍스트 키워드: {keywords}")
+                logger.debug("COUNT - 컨텍스트 키워드: %s", keywords)
 
-            print(f"[DEBUG] 통계 쿼리 키워드: {keywords if keywords else '(없음)'}")
+            logger.debug("통계 쿼리 키워드: %s", keywords if keywords else '(없음)')
             
             # COUNT 쿼리 실행
             from .search import search_meeting_count
@@ -1379,9 +1701,9 @@ async def chat(request: ChatRequest):
                 meetings = count_result['meetings']
                 
                 # ========== Phase 2-A: 페르소나 정렬 적용 ==========
-                if ENABLE_PERSONA and meetings and len(meetings) > 1:
-                    meetings = search_with_persona(meetings, user_job_normalized)
-                    print(f"[DEBUG] Phase 2-A (통계 초기): {user_job_normalized} 관련도 순으로 정렬")
+                if meetings and len(meetings) > 1:
+                    meetings = _persona_sort(meetings, user_job_normalized)
+                    logger.debug("Phase 2-A (통계 초기): %s 관련도 순으로 정렬", user_job_normalized)
                 
                 # ========== 답변 생성 ==========
                 # 상태별 표현
@@ -1435,33 +1757,21 @@ async def chat(request: ChatRequest):
                         
                 # ========== 컨텍스트 저장 (후속 질문 대비) ==========
                 if meetings and count > 0:
-                    # datetime → str 변환 (전체 회의 저장!)
-                    meetings_serializable = []
-                    for meeting in meetings:
-                        meeting_copy = {}
-                        for key, value in meeting.items():
-                            if isinstance(value, datetime):
-                                meeting_copy[key] = value.isoformat()
-                            else:
-                                meeting_copy[key] = value
-                        meetings_serializable.append(meeting_copy)
-                    
-                    context_data = {
-                        'state': 'count_result',
-                        'meetings': meetings_serializable,
-                        'total_count': count,
-                        'original_query': user_query
-                    }
-                    save_context(session_id, context_data)
-                    print(f"[DEBUG] 통계 결과 컨텍스트 저장: {count}개 회의")
+                    # 전체 회의 저장!
+                    build_and_save_meeting_context(
+                        session_id, meetings, 'count_result',
+                        total_count=count,
+                        original_query=user_query
+                    )
+                    logger.debug("통계 결과 컨텍스트 저장: %s개 회의", count)
                                     
                     answer += "\n\n💬 \"그 회의들 보여줘\" 라고 물어보시면 자세히 알려드릴게요!"
                 
                 return ChatResponse(
                     answer=answer,
                     history=request.history + [
-                        {"role": "user", "content": user_query},
-                        {"role": "assistant", "content": answer}
+                        {"role": ROLE_USER, "content": user_query},
+                        {"role": ROLE_ASSISTANT, "content": answer}
                     ],
                     source="count_query",
                     session_id=session_id
@@ -1481,11 +1791,11 @@ async def chat(request: ChatRequest):
 
         # 명확한 패턴이 아닐 때만 LLM 분석
         if not is_obvious_pattern(user_query) and needs_llm_analysis(user_query, context):
-            from .llm import preprocess_query_with_llm
+            from .llm import preprocess_query_with_llm_async
             
-            preprocessed = preprocess_query_with_llm(user_query, context)
+            preprocessed = await preprocess_query_with_llm_async(user_query, context)
             llm_analysis = preprocessed
-            print(f"[DEBUG] LLM 전처리 결과: {preprocessed}")
+            logger.debug("LLM 전처리 결과: %s", preprocessed)
             
             corrected_query = preprocessed.get('corrected_query', user_query)
             intent = preprocessed.get('intent', 'meeting_search')
@@ -1500,10 +1810,10 @@ async def chat(request: ChatRequest):
             is_new_search_intent = preprocessed.get('intent') == 'meeting_search' if preprocessed else False
 
             # 명확한 선택 패턴인지 확인 (숫자/날짜만 허용)
-            is_obvious_selection = user_query.strip().isdigit() or bool(re.match(r'^\d{1,2}월\s?\d{1,2}일$', user_query.strip()))
+            is_obvious_selection = user_query.strip().isdigit() or bool(_RE_OBVIOUS_DATE.match(user_query.strip()))
             
             if is_selection_state and is_new_search_intent and not is_obvious_selection:
-                print(f"[DEBUG] 새로운 검색 의도 감지 (LLM Intent: {intent}) → 컨텍스트 무시")
+                logger.debug("새로운 검색 의도 감지 (LLM Intent: %s) → 컨텍스트 무시", intent)
                 delete_context(session_id)
                 # 컨텍스트를 삭제했으므로, 아래 Task/Participant 처리를 건너뛰고 
                 # 최종 MySQL 검색으로 바로 진입하도록 pass 처리합니다.
@@ -1512,52 +1822,21 @@ async def chat(request: ChatRequest):
             # ========== Intent별 자동 처리 (Task/Participant) ==========
             scope_expansion = llm_analysis.get('scope_expansion', False)
 
+            handler = INTENT_HANDLERS.get(intent)
+
             # 1. Task 검색 intent
             if intent == 'task_search':
-                # 컨텍스트 활용 여부 결정
-                if is_contextual and context and context.get('state') == 'meeting_selected' and not scope_expansion:
-                    # 특정 회의의 할일 검색
-                    selected_meeting_id = context.get('selected_meeting_id')
-                    meeting_title = context.get('meeting_title', '')
-                    
-                    print(f"[DEBUG] Task 검색 - 컨텍스트 활용: meeting_id={selected_meeting_id}")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=selected_meeting_id
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_contextual",
-                        session_id=session_id
-                    )
-                else:
-                    # 전체 회의의 할일 검색 (scope_expansion=True 또는 컨텍스트 없음)
-                    print(f"[DEBUG] Task 검색 - 전체 검색 (scope_expansion={scope_expansion})")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=None
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_global",
-                        session_id=session_id
-                    )
+                return handler(
+                    user_query=user_query,
+                    original_query=original_query,
+                    request=request,
+                    session_id=session_id,
+                    context=context,
+                    user_id=user_id,
+                    user_job=user_job_normalized,
+                    is_contextual=is_contextual,
+                    scope_expansion=scope_expansion
+                )
             
             # 2. Participant 검색 intent
             elif intent == 'participant_search':
@@ -1567,10 +1846,10 @@ async def chat(request: ChatRequest):
                 if '누가' in user_query:
                     # "마케팅 회의에 누가 참석했어?" → 회의 검색 후 참석자 조회
                     # 회의명 추출 (간단히 "회의" 앞의 단어들)
-                    meeting_keyword_match = re.search(r'(.+?)\s*회의', user_query)
+                    meeting_keyword_match = _RE_MEETING_KEYWORD.search(user_query)
                     if meeting_keyword_match:
                         meeting_keyword = meeting_keyword_match.group(1).strip()
-                        print(f"[DEBUG] Participant 검색 - 회의명으로 검색: {meeting_keyword}")
+                        logger.debug("Participant 검색 - 회의명으로 검색: %s", meeting_keyword)
                         
                         # 회의 검색
                         from .search import search_meetings_direct
@@ -1586,7 +1865,7 @@ async def chat(request: ChatRequest):
                         if meetings and len(meetings) == 1:
                             # 단일 회의 발견 → 참석자 조회
                             meeting_id = meetings[0]['id']
-                            print(f"[DEBUG] Participant 검색 - 특정 회의: meeting_id={meeting_id}")
+                            logger.debug("Participant 검색 - 특정 회의: meeting_id=%s", meeting_id)
                             
                             from .search import search_participants
                             participant_response, results = search_participants(
@@ -1597,8 +1876,8 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=participant_response,
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": participant_response}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": participant_response}
                                 ],
                                 source="participant_meeting_members",
                                 session_id=session_id
@@ -1608,8 +1887,8 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=f"{meeting_keyword} 관련 회의가 여러 개 있어요. 어떤 회의의 참석자를 확인하시겠어요?\n\n{search_response}",
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": search_response}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": search_response}
                                 ],
                                 source="participant_multiple_meetings",
                                 session_id=session_id
@@ -1617,7 +1896,7 @@ async def chat(request: ChatRequest):
                     # 컨텍스트 활용
                     elif is_contextual and context and context.get('state') == 'meeting_selected':
                         selected_meeting_id = context.get('selected_meeting_id')
-                        print(f"[DEBUG] Participant 검색 - 특정 회의 (컨텍스트): meeting_id={selected_meeting_id}")
+                        logger.debug("Participant 검색 - 특정 회의 (컨텍스트): meeting_id=%s", selected_meeting_id)
                         
                         from .search import search_participants
                         participant_response, results = search_participants(
@@ -1628,22 +1907,22 @@ async def chat(request: ChatRequest):
                         return ChatResponse(
                             answer=participant_response,
                             history=request.history + [
-                                {"role": "user", "content": original_query},
-                                {"role": "assistant", "content": participant_response}
+                                {"role": ROLE_USER, "content": original_query},
+                                {"role": ROLE_ASSISTANT, "content": participant_response}
                             ],
                             source="participant_meeting_members",
                             session_id=session_id
                         )
                 
                 # 2순위: 특정 사람이 참석한 회의 검색
-                name_match = re.search(r'([가-힣]{2,4})', user_query)
+                name_match = _RE_PERSON_NAME.search(user_query)
                 
                 if name_match and any(w in user_query for w in ['참석한', '나온', '있었']):
                     # "김철수가 참석한 회의?" → 특정 사람 검색
                     person_name = name_match.group(1)
                     # 조사 제거 (가, 이, 은, 는, 을, 를)
-                    person_name = re.sub(r"[가이은는을를]$", "", person_name)
-                    print(f"[DEBUG] Participant 검색 - 특정 사람: {person_name}")
+                    person_name = _RE_NAME_JOSA.sub("", person_name)
+                    logger.debug("Participant 검색 - 특정 사람: %s", person_name)
                     
                     from .search import search_participants
                     participant_response, results = search_participants(
@@ -1660,40 +1939,28 @@ async def chat(request: ChatRequest):
                             'meeting_title': meeting['title'],
                             'original_query': user_query
                         }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 단일 회의 컨텍스트 저장: meeting_id={meeting['id']}")
+                        save_context_async(session_id, context)
+                        logger.debug("단일 회의 컨텍스트 저장: meeting_id=%s", meeting['id'])
                     
                     elif results and len(results) > 1:
                         # 여러 회의 - 선택 대기 상태
-                        meetings_serializable = []
-                        for meeting in results:
-                            meeting_copy = {}
-                            for key, value in meeting.items():
-                                if isinstance(value, datetime):
-                                    meeting_copy[key] = value.isoformat()
-                                else:
-                                    meeting_copy[key] = value
-                            meetings_serializable.append(meeting_copy)
-                            
                         shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
 
-                        context = {
-                            'state': 'awaiting_selection',
-                            'shown_completed': shown_completed,
-                            'shown_scheduled': shown_scheduled,
-                            'meetings': meetings_serializable[:10],
-                            'offset': min(5, len(meetings_serializable[:10])),
-                            'total_count': len(results),
-                            'original_query': user_query
-                        }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 여러 회의 컨텍스트 저장: {len(results)}개")
+                        context = build_and_save_meeting_context(
+                            session_id, results[:10], 'awaiting_selection',
+                            shown_completed=shown_completed,
+                            shown_scheduled=shown_scheduled,
+                            offset=min(5, len(results[:10])),
+                            total_count=len(results),
+                            original_query=user_query
+                        )
+                        logger.debug("여러 회의 컨텍스트 저장: %s개", len(results))
                     
                     return ChatResponse(
                         answer=participant_response,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": participant_response}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": participant_response}
                         ],
                         source="participant_person_meetings",
                         session_id=session_id
@@ -1706,8 +1973,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer=fallback_msg,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": fallback_msg}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": fallback_msg}
                         ],
                         source="participant_clarification",
                         session_id=session_id
@@ -1715,7 +1982,7 @@ async def chat(request: ChatRequest):
                 
             # 3. 회의 상세 질문 (RAG) - keyword_search보다 먼저
             if is_detail_question(user_query, context):
-                print(f"[DEBUG] 회의 상세 질문 감지 (RAG)")
+                logger.debug("회의 상세 질문 감지 (RAG)")
                 
                 selected_meeting_id = context.get('selected_meeting_id')
                 meeting_title = context.get('meeting_title', '선택된 회의')
@@ -1728,8 +1995,8 @@ async def chat(request: ChatRequest):
                         return ChatResponse(
                             answer="데이터베이스 연결에 실패했어요. 😢",
                             history=request.history + [
-                                {"role": "user", "content": original_query},
-                                {"role": "assistant", "content": "데이터베이스 연결에 실패했어요. 😢"}
+                                {"role": ROLE_USER, "content": original_query},
+                                {"role": ROLE_ASSISTANT, "content": "데이터베이스 연결에 실패했어요. 😢"}
                             ],
                             source="db_connection_error",
                             session_id=session_id
@@ -1767,8 +2034,8 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=rag_answer,
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": rag_answer}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": rag_answer}
                                 ],
                                 source="meeting_detail_rag",
                                 session_id=session_id
@@ -1777,107 +2044,38 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=f"❌ {meeting_title} 정보를 찾을 수 없어요.",
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": f"❌ {meeting_title} 정보를 찾을 수 없어요."}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": f"❌ {meeting_title} 정보를 찾을 수 없어요."}
                                 ],
                                 source="meeting_not_found",
                                 session_id=session_id
                             )
                     except Exception as e:
-                        logger.error(f"RAG 처리 중 오류: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        logger.exception("RAG 처리 중 오류: %s", e)
                         
                         return ChatResponse(
                             answer="회의 정보를 가져오는 중 오류가 발생했어요. 😢",
                             history=request.history + [
-                                {"role": "user", "content": original_query},
-                                {"role": "assistant", "content": "회의 정보를 가져오는 중 오류가 발생했어요. 😢"}
+                                {"role": ROLE_USER, "content": original_query},
+                                {"role": ROLE_ASSISTANT, "content": "회의 정보를 가져오는 중 오류가 발생했어요. 😢"}
                             ],
                             source="rag_error",
                             session_id=session_id
                         )
 
-            # 4. Keyword 검색 intent
-            elif intent == 'keyword_search':
-                # "'예산' 키워드 있는 회의?"
-                print(f"[DEBUG] Keyword 검색 intent 감지")
-                
-                # 키워드 추출 (따옴표 있으면 따옴표 안, 없으면 첫 단어)
-                keyword_pattern = re.search(r"['\"\'](.+?)['\"\']", user_query)
-
-                if keyword_pattern:
-                    keyword_name = keyword_pattern.group(1).strip()
-                elif '키워드' in user_query:
-                    # "전략 키워드 있는 회의?" → "전략" 추출
-                    keyword_match = re.search(r'([가-힣a-zA-Z0-9]+)\s*키워드', user_query)
-                    if keyword_match:
-                        keyword_name = keyword_match.group(1).strip()
-                    else:
-                        keyword_name = None
-                else:
-                    keyword_name = None
-                
-                if keyword_name:
-                    print(f"[DEBUG] Keyword 검색: '{keyword_name}'")
-                    
-                    from .search import search_keywords
-                    keyword_response, meetings = search_keywords(
-                        keyword_name=keyword_name,
-                        user_job=user_job_normalized
-                    )
-                    
-                    # 컨텍스트 저장 (단일 회의면)
-                    if meetings and len(meetings) == 1:
-                        save_context(session_id, {
-                            'state': 'meeting_selected',
-                            'selected_meeting_id': meetings[0]['id'],
-                            'meeting_title': meetings[0]['title']
-                        })
-                        print(f"[DEBUG] 단일 회의 컨텍스트 저장: meeting_id={meetings[0]['id']}")
-                    elif meetings and len(meetings) > 1:
-                        meetings_serializable = []
-                        for meeting in meetings:
-                            meeting_copy = {}
-                            for key, value in meeting.items():
-                                if isinstance(value, datetime):
-                                    meeting_copy[key] = value.isoformat()
-                                else:
-                                    meeting_copy[key] = value
-                            meetings_serializable.append(meeting_copy)
-                        
-                        shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
-
-                        save_context(session_id, {
-                            'state': 'awaiting_selection',
-                            'shown_completed': shown_completed,
-                            'shown_scheduled': shown_scheduled,
-                            'meetings': meetings_serializable[:10],
-                            'offset': min(5, len(meetings_serializable[:10])),
-                            'total_count': len(meetings)
-                        })
-                        print(f"[DEBUG] 여러 회의 컨텍스트 저장: {len(meetings)}개")
-                    
-                    return ChatResponse(
-                        answer=keyword_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": keyword_response}
-                        ],
-                        source="keyword_search",
-                        session_id=session_id
-                    )
-                else:
-                    # 키워드 추출 실패
-                    return ChatResponse(
-                        answer="어떤 키워드로 검색하시겠어요? 😊\n예: \"'예산' 키워드 있는 회의?\"",
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": "어떤 키워드로 검색하시겠어요? 😊"}
-                        ],
-                        source="keyword_clarification",
-                        session_id=session_id
-                    )
+            # 4. 테이블에 등록된 나머지 intent (keyword_search 등)
+            elif handler:
+                return handler(
+                    user_query=user_query,
+                    original_query=original_query,
+                    request=request,
+                    session_id=session_id,
+                    context=context,
+                    user_id=user_id,
+                    user_job=user_job_normalized,
+                    is_contextual=is_contextual,
+                    scope_expansion=scope_expansion
+                )
 
         # === Participant 질문 처리 ===
         participant_info = is_participant_query(user_query, context)
@@ -1886,7 +2084,7 @@ async def chat(request: ChatRequest):
         if not participant_info['is_participant']:
             # LLM 전처리 결과가 있고, participant_search로 판단했으면
             if preprocessed is not None and preprocessed.get('intent') == 'participant_search':
-                print(f"[DEBUG] LLM이 participant_search로 판단 → Participant 처리")
+                logger.debug("LLM이 participant_search로 판단 → Participant 처리")
                 participant_info = {
                     'is_participant': True,
                     'query_type': 'meeting_participants' if context and context.get('selected_meeting_id') else None,
@@ -1894,9 +2092,9 @@ async def chat(request: ChatRequest):
                 }
         
         if participant_info['is_participant']:
-            print(f"\n👥 참석자 질문 감지")
-            print(f"[DEBUG] query_type: {participant_info['query_type']}")
-            print(f"[DEBUG] person_name: {participant_info['person_name']}")
+            logger.debug("👥 참석자 질문 감지")
+            logger.debug("query_type: %s", participant_info['query_type'])
+            logger.debug("person_name: %s", participant_info['person_name'])
             
             from .search import search_participants
             
@@ -1908,8 +2106,8 @@ async def chat(request: ChatRequest):
                         answer=answer,
                         source="participant_query",
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": answer}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": answer}
                         ],
                         session_id=session_id
                     )
@@ -1920,15 +2118,15 @@ async def chat(request: ChatRequest):
                     meeting_id=meeting_id
                 )
                 
-                # 컨텍스트 유지
-                save_context(session_id, context)
+                # 컨텍스트 유지 (내용 변경 없음 → TTL만 연장)
+                touch_context(session_id)
                 
                 return ChatResponse(
                     answer=answer,
                     source="participant_query",
                     history=request.history + [
-                        {"role": "user", "content": original_query},
-                        {"role": "assistant", "content": answer}
+                        {"role": ROLE_USER, "content": original_query},
+                        {"role": ROLE_ASSISTANT, "content": answer}
                     ],
                     session_id=session_id
                 )
@@ -1942,28 +2140,17 @@ async def chat(request: ChatRequest):
                 
                 # 여러 회의면 컨텍스트 저장
                 if len(meetings) > 1:
-                    meetings_serializable = []
-                    for m in meetings[:10]:
-                        meeting_copy = {}
-                        for key, value in m.items():
-                            if isinstance(value, datetime):
-                                meeting_copy[key] = value.isoformat()
-                            else:
-                                meeting_copy[key] = value
-                        meetings_serializable.append(meeting_copy)
-                    
                     shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
                     
-                    save_context(session_id, {
-                        'state': 'awaiting_selection',
-                        'shown_completed': shown_completed,
-                        'shown_scheduled': shown_scheduled,
-                        'last_query': user_query,
-                        'meetings': meetings_serializable
-                    })
+                    build_and_save_meeting_context(
+                        session_id, meetings[:10], 'awaiting_selection',
+                        shown_completed=shown_completed,
+                        shown_scheduled=shown_scheduled,
+                        last_query=user_query
+                    )
                 elif len(meetings) == 1:
                     # 단일 회의면 선택 상태로
-                    save_context(session_id, {
+                    save_context_async(session_id, {
                         'state': 'meeting_selected',
                         'selected_meeting_id': meetings[0]['id'],
                         'meeting_title': meetings[0]['title']
@@ -1973,16 +2160,16 @@ async def chat(request: ChatRequest):
                     answer=answer,
                     source="participant_query",
                     history=request.history + [
-                        {"role": "user", "content": original_query},
-                        {"role": "assistant", "content": answer}
+                        {"role": ROLE_USER, "content": original_query},
+                        {"role": ROLE_ASSISTANT, "content": answer}
                     ],
                     session_id=session_id
                 )
 
-            from .llm import preprocess_query_with_llm
+            from .llm import preprocess_query_with_llm_async
             
-            preprocessed = preprocess_query_with_llm(user_query, context)
-            print(f"[DEBUG] LLM 전처리 결과: {preprocessed}")
+            preprocessed = await preprocess_query_with_llm_async(user_query, context)
+            logger.debug("LLM 전처리 결과: %s", preprocessed)
             
             corrected_query = preprocessed.get('corrected_query', user_query)
             intent = preprocessed.get('intent', 'meeting_search')
@@ -1994,66 +2181,35 @@ async def chat(request: ChatRequest):
             
             # ========== Intent별 자동 처리 ==========
             
+            handler = INTENT_HANDLERS.get(intent)
+
             # 1. Task 검색 intent
             if intent == 'task_search':
-                # 컨텍스트 활용 여부 결정
-                if is_contextual and context and context.get('state') == 'meeting_selected' and not scope_expansion:
-                    # 특정 회의의 할일 검색
-                    selected_meeting_id = context.get('selected_meeting_id')
-                    meeting_title = context.get('meeting_title', '')
-                    
-                    print(f"[DEBUG] Task 검색 - 컨텍스트 활용: meeting_id={selected_meeting_id}")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=selected_meeting_id
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_contextual",
-                        session_id=session_id
-                    )
-                else:
-                    # 전체 회의의 할일 검색 (scope_expansion=True 또는 컨텍스트 없음)
-                    print(f"[DEBUG] Task 검색 - 전체 검색 (scope_expansion={scope_expansion})")
-                    
-                    from .search import search_tasks
-                    task_response, tasks = search_tasks(
-                        user_query=user_query,
-                        user_id=user_id,
-                        meeting_id=None
-                    )
-                    
-                    return ChatResponse(
-                        answer=task_response,
-                        history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": task_response}
-                        ],
-                        source="task_search_global",
-                        session_id=session_id
-                    )
+                return handler(
+                    user_query=user_query,
+                    original_query=original_query,
+                    request=request,
+                    session_id=session_id,
+                    context=context,
+                    user_id=user_id,
+                    user_job=user_job_normalized,
+                    is_contextual=is_contextual,
+                    scope_expansion=scope_expansion
+                )
             
             # 2. Participant 검색 intent
             elif intent == 'participant_search':
                 # 특정 회의 참석자 vs 특정 사람이 참석한 회의
                 
                 # 이름 패턴 확인
-                name_match = re.search(r'([가-힣]{2,4})', user_query)
+                name_match = _RE_PERSON_NAME.search(user_query)
                 
                 if name_match and any(w in user_query for w in ['참석한', '나온', '있었', '회의']):
                     # 특정 사람이 참석한 회의 검색
                     person_name = name_match.group(1)
                     # 조사 제거 (가, 이, 은, 는, 을, 를)
-                    person_name = re.sub(r"[가이은는을를]$", "", person_name)
-                    print(f"[DEBUG] Participant 검색 - 특정 사람: {person_name}")
+                    person_name = _RE_NAME_JOSA.sub("", person_name)
+                    logger.debug("Participant 검색 - 특정 사람: %s", person_name)
                     
                     from .search import search_participants
                     participant_response, results = search_participants(
@@ -2070,39 +2226,27 @@ async def chat(request: ChatRequest):
                             'meeting_title': meeting['title'],
                             'original_query': user_query
                         }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 단일 회의 컨텍스트 저장: meeting_id={meeting['id']}")
+                        save_context_async(session_id, context)
+                        logger.debug("단일 회의 컨텍스트 저장: meeting_id=%s", meeting['id'])
                     elif results and len(results) > 1:
                         # 여러 회의 - 선택 대기 상태
-                        meetings_serializable = []
-                        for meeting in results:
-                            meeting_copy = {}
-                            for key, value in meeting.items():
-                                if isinstance(value, datetime):
-                                    meeting_copy[key] = value.isoformat()
-                                else:
-                                    meeting_copy[key] = value
-                            meetings_serializable.append(meeting_copy)
-                        
                         shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
 
-                        context = {
-                            'state': 'awaiting_selection',
-                            'shown_completed': shown_completed,
-                            'shown_scheduled': shown_scheduled,
-                            'meetings': meetings_serializable[:10],
-                            'offset': min(5, len(meetings_serializable[:10])),
-                            'total_count': len(results),
-                            'original_query': user_query
-                        }
-                        save_context(session_id, context)
-                        print(f"[DEBUG] 여러 회의 컨텍스트 저장: {len(results)}개")
+                        context = build_and_save_meeting_context(
+                            session_id, results[:10], 'awaiting_selection',
+                            shown_completed=shown_completed,
+                            shown_scheduled=shown_scheduled,
+                            offset=min(5, len(results[:10])),
+                            total_count=len(results),
+                            original_query=user_query
+                        )
+                        logger.debug("여러 회의 컨텍스트 저장: %s개", len(results))
                     
                     return ChatResponse(
                         answer=participant_response,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": participant_response}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": participant_response}
                         ],
                         source="participant_person_meetings",
                         session_id=session_id
@@ -2111,7 +2255,7 @@ async def chat(request: ChatRequest):
                 elif is_contextual and context and context.get('state') == 'meeting_selected':
                     # 특정 회의의 참석자 조회
                     selected_meeting_id = context.get('selected_meeting_id')
-                    print(f"[DEBUG] Participant 검색 - 특정 회의: meeting_id={selected_meeting_id}")
+                    logger.debug("Participant 검색 - 특정 회의: meeting_id=%s", selected_meeting_id)
                     
                     from .search import search_participants
                     participant_response, results = search_participants(
@@ -2122,8 +2266,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer=participant_response,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": participant_response}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": participant_response}
                         ],
                         source="participant_meeting_members",
                         session_id=session_id
@@ -2136,8 +2280,8 @@ async def chat(request: ChatRequest):
                     return ChatResponse(
                         answer=fallback_msg,
                         history=request.history + [
-                            {"role": "user", "content": original_query},
-                            {"role": "assistant", "content": fallback_msg}
+                            {"role": ROLE_USER, "content": original_query},
+                            {"role": ROLE_ASSISTANT, "content": fallback_msg}
                         ],
                         source="participant_clarification",
                         session_id=session_id
@@ -2153,7 +2297,7 @@ async def chat(request: ChatRequest):
             is_detail_question_early and
             not any(keyword in user_query for keyword in ['할일', '할 일', 'task', '담당', '맡은'])):
             
-            print(f"[DEBUG] RAG 상세 질문 우선 처리: '{user_query}'")
+            logger.debug("RAG 상세 질문 우선 처리: '%s'", user_query)
             
             selected_meeting_id = context.get('selected_meeting_id')
             
@@ -2192,8 +2336,8 @@ async def chat(request: ChatRequest):
                             return ChatResponse(
                                 answer=rag_answer,
                                 history=request.history + [
-                                    {"role": "user", "content": original_query},
-                                    {"role": "assistant", "content": rag_answer}
+                                    {"role": ROLE_USER, "content": original_query},
+                                    {"role": ROLE_ASSISTANT, "content": rag_answer}
                                 ],
                                 source="meeting_detail_rag",
                                 session_id=session_id
@@ -2208,26 +2352,27 @@ async def chat(request: ChatRequest):
         previous_meeting_id = None  
 
         if request.history and len(request.history) >= 2:
-            last_response = request.history[-1].get('content', '') if request.history[-1].get('role') == 'assistant' else ''
+            # 직전 어시스턴트 답변 본문으로 종류 판단
+            last_kind = get_response_kind(request.history[-1])
             
             # 이전 답변이 Task 관련
-            if '할 일' in last_response or '담당:' in last_response:
-                previous_was_task = True
+            previous_was_task = last_kind in ('task', 'task_meeting_detail')
             
             # 이전 답변이 회의 상세 (📌 포함)
-            if '📌' in last_response and '회의' in last_response:
-                previous_was_meeting_detail = True
+            previous_was_meeting_detail = last_kind in ('meeting_detail', 'task_meeting_detail')
 
         # 컨텍스트에서 meeting_id 확인 (개수 확인 질문 제외)
         if context and context.get('selected_meeting_id') and not is_count_check:
             previous_meeting_id = context['selected_meeting_id']
-            print(f"[DEBUG] 컨텍스트에 저장된 meeting_id: {previous_meeting_id}")
-
-        # 강한 새 질문 신호 체크
-        has_date = parse_date_from_query(user_query).get('type') is not None
-        has_search_verb = any(kw in user_query for kw in ['찾아', '검색', '보여', '알려', '조회'])
-        has_status = any(kw in user_query for kw in ['완료', '예정', '지난', '최근'])
-        is_clear_new_query = has_date or has_search_verb or has_status or len(user_query) > 20
+            logger.debug("컨텍스트에 저장된 meeting_id: %s", previous_meeting_id)
+
+        # 강한 새 질문 신호 체크 (비용이 싼 조건부터 - 날짜 파싱은 마지막에만 수행)
+        is_clear_new_query = (
+            len(user_query) > 20
+            or any(kw in user_query for kw in ['찾아', '검색', '보여', '알려', '조회'])
+            or any(kw in user_query for kw in ['완료', '예정', '지난', '최근'])
+            or parse_date_from_query(user_query).get('type') is not None
+        )
 
         # Task 패턴
         task_patterns = ['맡은 일', '담당', '해야 할', 'task', '액션', '할일', '할 일', '다른 사람', '다른사람', '누가', '누구']
@@ -2247,32 +2392,32 @@ async def chat(request: ChatRequest):
                 if context and context.get('selected_meeting_id'):
                     is_task_question = True
                     meeting_id_from_meeting_ref = context['selected_meeting_id']
-                    print(f"[DEBUG] '이 회의' + Task 단어 감지 → meeting_id={meeting_id_from_meeting_ref}")
+                    logger.debug("'이 회의' + Task 단어 감지 → meeting_id=%s", meeting_id_from_meeting_ref)
 
         # 1-2. 이전이 회의 상세 + 짧은 질문 + Task 관련 단어
         if not is_clear_new_query and previous_was_meeting_detail and len(user_query) <= 15:
             if any(kw in user_query for kw in ['할', '맡', '담당', '일', '해야', '사람', '누가', '누구']):  
                 is_task_question = True
-                print(f"[DEBUG] 암묵적 Task 질문 감지 (이전: 회의 상세)")
+                logger.debug("암묵적 Task 질문 감지 (이전: 회의 상세)")
 
         # 1-3. 이전이 Task + 짧은 질문 + "다른 사람" 패턴
         if not is_clear_new_query and previous_was_task and len(user_query) <= 15:
             if any(word in user_query for word in ['다른', '누가', '누구', '사람']):
                 is_task_question = True
-                print(f"[DEBUG] 이전 Task + '다른 사람' 패턴 감지")
+                logger.debug("이전 Task + '다른 사람' 패턴 감지")
 
         # 2. 이전이 Task + 회의 언급
         elif not is_clear_new_query and previous_was_task and len(user_query) <= 20:
             if any(word in user_query for word in ['회의', '저기', '거기', '안에서', '에서', '저', '그']):
                 is_task_question = True
-                print(f"[DEBUG] 컨텍스트 기반 Task 질문 감지")
+                logger.debug("컨텍스트 기반 Task 질문 감지")
 
         # 3. "아니" + 회의 맥락 (정정 패턴)
         if any(word in user_query for word in ['아니', '그게 아니']):
             if context and context.get('selected_meeting_id') and len(user_query) <= 20:
                 if any(word in user_query for word in ['회의', '저', '그', '거기', '저기', '안에서', '에서']):
                     is_task_question = True
-                    print(f"[DEBUG] 정정 패턴 감지 → Task 질문")
+                    logger.debug("정정 패턴 감지 → Task 질문")
 
         # 4. 컨텍스트에 meeting_id 있음 + 회의 범위 지정 + Task 단어
         elif not is_clear_new_query and context and context.get('selected_meeting_id') and len(user_query) <= 20:
@@ -2281,10 +2426,10 @@ async def chat(request: ChatRequest):
             
             if has_meeting_ref and has_task_word:
                 is_task_question = True
-                print(f"[DEBUG] 회의 컨텍스트 + 범위 지정어 + Task 단어 → Task 질문")
+                logger.debug("회의 컨텍스트 + 범위 지정어 + Task 단어 → Task 질문")
 
         if is_task_question:
-            print(f"[DEBUG] Task 질문 감지")
+            logger.debug("Task 질문 감지")
             
             from .search import search_tasks
             
@@ -2297,16 +2442,16 @@ async def chat(request: ChatRequest):
                     meeting_id = context['selected_meeting_id']
             
             if is_asking_all_tasks:
-                print(f"[DEBUG] '전체' 키워드 감지 → meeting_id 무시")
+                logger.debug("'전체' 키워드 감지 → meeting_id 무시")
             
-            print(f"[DEBUG] Task 검색 meeting_id: {meeting_id}")
+            logger.debug("Task 검색 meeting_id: %s", meeting_id)
             
             message, tasks = search_tasks(user_query, user_id=user_id, meeting_id=meeting_id)
             return ChatResponse(
                 answer=message,
                 history=request.history + [
-                    {"role": "user", "content": user_query},
-                    {"role": "assistant", "content": message}
+                    {"role": ROLE_USER, "content": user_query},
+                    {"role": ROLE_ASSISTANT, "content": message}
                 ],
                 source="task_query",
                 session_id=session_id
@@ -2325,7 +2470,7 @@ async def chat(request: ChatRequest):
                 should_use_context = False
                 delete_context(session_id)
                 context = None
-                print(f"[DEBUG] 날짜 정보 감지 ({date_info_check.get('original')}) → 새로운 검색")
+                logger.debug("날짜 정보 감지 (%s) → 새로운 검색", date_info_check.get('original'))
             else:
                 # 명확한 선택 패턴 체크
                 selection_patterns = [
@@ -2343,51 +2488,33 @@ async def chat(request: ChatRequest):
                 # 판단: "나머지"는 특별 처리
                 if any(word in user_query.lower() for word in ['나머지', '더', '더보기', '추가', '계속']):
                     should_use_context = False  # 컨텍스트는 유지하되, handle_selection으로 안 넘김
-                    print(f"[DEBUG] '나머지' 요청 감지 → 특별 처리")
+                    logger.debug("'나머지' 요청 감지 → 특별 처리")
                 elif is_clear_selection:
                     should_use_context = True
-                    print(f"[DEBUG] 선택 의도 감지 → 컨텍스트 사용")
+                    logger.debug("선택 의도 감지 → 컨텍스트 사용")
                 else:
                     # 새로운 검색으로 처리
                     should_use_context = False
                     delete_context(session_id)
-                    print(f"[DEBUG] 새로운 검색 의도 감지 → 컨텍스트 무시")
+                    logger.debug("새로운 검색 의도 감지 → 컨텍스트 무시")
                     
         # ========== 후속 질문 처리 (LLM 활용) ==========
         elif context and not is_obvious_pattern(user_query):
             # "나머지" 요청 감지 (정규식 + 오타 허용)
             query_lower = user_query.lower().replace(' ', '')  # 띄어쓰기 제거
             
-            pagination_patterns = [
-                r'나머.*',
-                r'남은.*',
-                r'더.*[보줘있알려]',
-                r'추가.*',
-                r'계속|이어서|다음',
-                r'또.*[있뭐어]',
-                r'그\s*외',
-                r'더\s*[보줘]',
-                r'완료.*나머',
-                r'완료.*더',
-                r'예정.*나머',
-                r'예정.*더'
-            ]
-            
-            # 오타 허용 키워드
-            fuzzy_pagination = ['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알', '추가로', '계속', '이어']
-            
-            is_pagination = (
-                any(re.search(pattern, query_lower) for pattern in pagination_patterns) or
-                any(fuzzy in query_lower for fuzzy in fuzzy_pagination)
+            # 패턴 + 오타 허용 키워드
+            is_pagination = bool(
+                _FOLLOWUP_PAGINATION_RE.search(query_lower) or
+                _FUZZY_PAGINATION_RE.search(query_lower)
             )
             
             # ========== 상태 키워드 체크 (새 검색) ==========
-            status_keywords = ['완료된', '예정된', '진행중', '취소된']
-            is_status_only = user_query.strip() in status_keywords  # "완료된"만 입력
+            is_status_only = user_query.strip() in _STATUS_ONLY_KEYWORDS  # "완료된"만 입력
             
             # 검색 의도가 명확하지 않고 짧은 질문 (단, 페이지네이션/상태 키워드 아닐 때만)
             if not is_pagination and not is_status_only and len(user_query) < 20 and not any(w in user_query for w in ['찾아', '검색', '회의', '뭐있어']):
-                print(f"[DEBUG] 후속 질문 가능성 → LLM으로 확인")
+                logger.debug("후속 질문 가능성 → LLM으로 확인")
                 
                 from .llm import answer_with_context
                 llm_answer = answer_with_context(user_query, context)
@@ -2395,27 +2522,27 @@ async def chat(request: ChatRequest):
                 return ChatResponse(
                     answer=llm_answer,
                     history=request.history + [
-                        {"role": "user", "content": original_query},
-                        {"role": "assistant", "content": llm_answer}
+                        {"role": ROLE_USER, "content": original_query},
+                        {"role": ROLE_ASSISTANT, "content": llm_answer}
                     ],
                     source="context_followup",
                     session_id=session_id
                 )
             elif is_pagination:
-                print(f"[DEBUG] 페이지네이션 요청 감지 → awaiting_selection 처리로 이동")
+                logger.debug("페이지네이션 요청 감지 → awaiting_selection 처리로 이동")
             elif is_status_only:
-                print(f"[DEBUG] 상태 키워드만 입력 → 새 검색으로 처리")
+                logger.debug("상태 키워드만 입력 → 새 검색으로 처리")
                 delete_context(session_id)
                 # 아래 MySQL 검색으로 진행
 
         # === 컨텍스트 기반 선택 처리 ===
         if should_use_context and context.get('state') == 'awaiting_selection':
-            print(f"[DEBUG] 컨텍스트 내 선택 처리: {user_query}")
+            logger.debug("컨텍스트 내 선택 처리: %s", user_query)
             return handle_selection(user_query, context, request, session_id)
 
         # ========== 통계 결과 후속 질문 처리 (Phase 3) ==========
         if context and context.get('state') == 'count_result':
-            print(f"[DEBUG] 통계 결과 컨텍스트 있음")
+            logger.debug("통계 결과 컨텍스트 있음")
             
             meetings = context.get('meetings', [])
             total_count = context.get('total_count', 0)
@@ -2423,7 +2550,7 @@ async def chat(request: ChatRequest):
             # ========== 0-1. 숫자만 입력 (번호 선택) ==========
             if user_query.strip().isdigit():
                 selected_number = int(user_query.strip())
-                print(f"[DEBUG] 번호 선택: {selected_number}번")
+                logger.debug("번호 선택: %s번", selected_number)
                 
                 shown_completed = context.get('shown_completed', 3)
                 shown_scheduled = context.get('shown_scheduled', 3)
@@ -2433,14 +2560,14 @@ async def chat(request: ChatRequest):
                     # 완료된 회의 선택
                     completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
                     selected_meeting = completed_meetings[selected_number - 1]
-                    print(f"[DEBUG] 완료된 회의 선택: {selected_number}번 → {selected_meeting.get('title')}")
+                    logger.debug("완료된 회의 선택: %s번 → %s", selected_number, selected_meeting.get('title'))
                 
                 elif shown_completed < selected_number <= (shown_completed + shown_scheduled):
                     # 예정된 회의 선택
                     scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
                     scheduled_index = selected_number - shown_completed - 1
                     selected_meeting = scheduled_meetings[scheduled_index]
-                    print(f"[DEBUG] 예정된 회의 선택: {selected_number}번 → {selected_meeting.get('title')}")
+                    logger.debug("예정된 회의 선택: %s번 → %s", selected_number, selected_meeting.get('title'))
                 
                 # ========== 상태 없이 숫자만 입력 ==========
                 else:
@@ -2453,7 +2580,7 @@ async def chat(request: ChatRequest):
                         # 명확화 질문
                         context['last_source'] = 'ambiguous_number'
                         context['last_ambiguous_number'] = selected_number
-                        save_context(session_id, context)
+                        save_context_async(session_id, context)
                         
                         # 둘 다 있음 → 명확화 질문
                         return ChatResponse(
@@ -2466,14 +2593,14 @@ async def chat(request: ChatRequest):
                         # 완료만 있음
                         completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
                         selected_meeting = completed_meetings[selected_number - 1]
-                        print(f"[DEBUG] 완료 {selected_number}번 선택 (자동): {selected_meeting.get('title')}")
+                        logger.debug("완료 %s번 선택 (자동): %s", selected_number, selected_meeting.get('title'))
                     
                     elif has_scheduled:
                         # 예정만 있음
                         scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
                         scheduled_index = selected_number - shown_completed - 1
                         selected_meeting = scheduled_meetings[scheduled_index]
-                        print(f"[DEBUG] 예정 {selected_number}번 선택 (자동): {selected_meeting.get('title')}")
+                        logger.debug("예정 %s번 선택 (자동): %s", selected_number, selected_meeting.get('title'))
                     
                     else:
                         # 둘 다 없음
@@ -2490,57 +2617,33 @@ async def chat(request: ChatRequest):
                 return ChatResponse(
                     answer=answer,
                     history=request.history + [
-                        {"role": "user", "content": user_query},
-                        {"role": "assistant", "content": answer}
+                        {"role": ROLE_USER, "content": user_query},
+                        {"role": ROLE_ASSISTANT, "content": answer}
                     ],
                     source="meeting_selection_by_number",
                     session_id=session_id
 )
                         
             # ========== 1. "나머지", "더" 요청 감지 (오타 허용) ==========
-            more_keywords = ['나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여', 
-                            '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서', 
-                            '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니', 
-                            '또뭐', '또있어', '나머', '남머', '나미', '더보']
-
-            more_patterns = [
-                r'나머.*',
-                r'남은.*',
-                r'더.*[보줘있알려]',
-                r'추가.*',
-                r'계속|이어서|다음',
-                r'또.*[있뭐어]',
-                r'그\s*외',
-                r'더\s*[보줘]'
-            ]
-
-            wants_more = any(keyword in user_query for keyword in more_keywords) or \
-                        any(re.search(pattern, user_query) for pattern in more_patterns)
+            wants_more = bool(_COUNT_MORE_KEYWORDS_RE.search(user_query) or
+                              _MORE_PATTERNS_RE.search(user_query))
 
             # 오타 허용 (부분 매칭)
             if not wants_more:
-                fuzzy_more = ['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알', '추가']
-                if any(x in user_query for x in fuzzy_more):
+                if _COUNT_FUZZY_MORE_RE.search(user_query):
                     wants_more = True
-                    print(f"[DEBUG] 유사 단어 감지 (오타 허용)")
+                    logger.debug("유사 단어 감지 (오타 허용)")
                     
             # 숫자 패턴 감지 ("3개", "5개", "두 개")
-            number_match = re.search(r'(\d+)개', user_query)
-            korean_numbers = {'한': 1, '두': 2, '세': 3, '네': 4, '다섯': 5, '여섯': 6, '일곱': 7, '여덟': 8, '아홉': 9, '열': 10}
-            korean_match = None
-            for korean, num in korean_numbers.items():
-                if korean in user_query and '개' in user_query:
-                    korean_match = num
-                    break
+            number_match = _RE_NUM_GAE.search(user_query)
+            korean_num = _KOREAN_NUM_RE.search(user_query) if '개' in user_query else None
+            korean_match = _KOREAN_NUM_MAP[korean_num.group(1)] if korean_num else None
             
             if number_match or korean_match or '몇개' in user_query:
                 wants_more = True
             
             if wants_more and len(meetings) > 5:
-                print(f"[DEBUG] 통계 결과 나머지 요청: '{user_query}'")
-                
-                # ========== 현재 어디까지 보여줬는지 추적 ==========
-                last_shown_index = context.get('last_shown_index', 5)  # 기본값: 5개까지 봄
+                logger.debug("통계 결과 나머지 요청: '%s'", user_query)
                 
                 # 요청한 개수 파싱 (기본값: 5개씩)
                 requested_count = 5
@@ -2549,75 +2652,8 @@ async def chat(request: ChatRequest):
                 elif korean_match:
                     requested_count = korean_match
                 
-                # 다음 범위 계산
-                start_idx = last_shown_index
-                end_idx = min(start_idx + requested_count, len(meetings))
-                
-                remaining_meetings = meetings[start_idx:end_idx]
-                
-                if not remaining_meetings:
-                    answer = "더 이상 회의가 없어요! 😊\n\n이미 모든 회의를 보여드렸습니다."
-                    return ChatResponse(
-                        answer=answer,
-                        history=request.history,
-                        source="no_more_meetings",
-                        session_id=session_id
-                    )
-                
-                # ========== 상세 포맷으로 보여주기 ==========
-                answer = f"나머지 회의들이에요! 📋\n\n"
-                
-                for i, meeting in enumerate(remaining_meetings):
-                    actual_number = start_idx + i + 1
-                    emoji = f"📌 {actual_number}."
-                    
-                    title = meeting.get('title', '제목 없음')
-                                                        
-                    scheduled_at = meeting.get('scheduled_at')
-                    if isinstance(scheduled_at, str):
-                        scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                    date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
-                    
-                    # summary 또는 description
-                    summary = meeting.get('summary', '')
-                    if not summary or summary.strip() == '':
-                        summary = meeting.get('description', '내용 없음')
-                    
-                    # 1-2문장 (80자)
-                    lines = summary.split('.')[:2]
-                    display_text = '. '.join([line.strip() for line in lines if line.strip()])
-                    if len(display_text) > 80:
-                        display_text = display_text[:80] + "..."
-                    
-                    answer += f"{emoji} {title} {date_str}\n"
-                    answer += f"   - {display_text}\n\n"
-                
-                # 남은 개수 계산
-                shown_total = end_idx
-                remaining_count = total_count - shown_total
-                
-                if remaining_count > 0:
-                    answer += f"💡 이 외에도 {remaining_count}개가 더 있어요!\n"
-                    answer += "\"더 보여줘\" 또는 \"나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
-                else:
-                    answer += "✅ 모든 회의를 보여드렸어요!\n\n"
-                
-                answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                answer += f"예: 번호({start_idx + 1}, {start_idx + 2}), 제목(디자인 회의) 😊"
-                
-                # ========== 컨텍스트 업데이트 (진행 상황 저장) ==========
-                context['state'] = 'awaiting_selection'
-                context['last_shown_index'] = end_idx  # 어디까지 봤는지 저장
-                save_context(session_id, context)
-                
-                return ChatResponse(
-                    answer=answer,
-                    history=request.history + [
-                        {"role": "user", "content": user_query},
-                        {"role": "assistant", "content": answer}
-                    ],
-                    source="count_remaining",
-                    session_id=session_id
+                return handle_more_meetings(
+                    request, session_id, context, meetings, user_query, requested_count, total_count
                 )
             
             # ========== 2. "보여줘", "자세히" 등 상세 요청 ==========
@@ -2625,15 +2661,15 @@ async def chat(request: ChatRequest):
             wants_details = any(keyword in user_query for keyword in show_keywords)
             
             if wants_details:
-                print(f"[DEBUG] 통계 결과 상세 요청: '{user_query}'")
+                logger.debug("통계 결과 상세 요청: '%s'", user_query)
                 meetings = context.get('meetings', [])
                 total_count = context.get('total_count', 0)
                 
                 if meetings:
                     # ========== Phase 2-A: 페르소나 정렬 적용 ==========
-                    if ENABLE_PERSONA and len(meetings) > 1:
-                        meetings = search_with_persona(meetings, user_job_normalized)
-                        print(f"[DEBUG] Phase 2-A (통계 결과): {user_job_normalized} 관련도 순으로 정렬")
+                    if len(meetings) > 1:
+                        meetings = _persona_sort(meetings, user_job_normalized)
+                        logger.debug("Phase 2-A (통계 결과): %s 관련도 순으로 정렬", user_job_normalized)
                     
                     # 여러 회의 포맷으로 보여주기
                     answer, shown_completed, shown_scheduled = format_multiple_meetings_short(
@@ -2645,26 +2681,16 @@ async def chat(request: ChatRequest):
                     )
                     
                     # ========== 컨텍스트를 awaiting_selection으로 변경 ==========
-                    # datetime → str 변환 (정렬된 meetings 사용)
-                    meetings_serializable = []
-                    for meeting in meetings[:10]:
-                        meeting_copy = {}
-                        for key, value in meeting.items():
-                            if isinstance(value, datetime):
-                                meeting_copy[key] = value.isoformat()
-                            else:
-                                meeting_copy[key] = value
-                        meetings_serializable.append(meeting_copy)
-                    
-                    context['state'] = 'awaiting_selection'
-                    context['meetings'] = meetings_serializable  # 정렬된 결과로 업데이트
-                    save_context(session_id, context)
+                    # 정렬된 meetings로 기존 컨텍스트 업데이트
+                    context = build_and_save_meeting_context(
+                        session_id, meetings[:10], 'awaiting_selection', base=context
+                    )
                     
                     return ChatResponse(
                         answer=answer,
                         history=request.history + [
-                            {"role": "user", "content": user_query},
-                            {"role": "assistant", "content": answer}
+                            {"role": ROLE_USER, "content": user_query},
+                            {"role": ROLE_ASSISTANT, "content": answer}
                         ],
                         source="count_details",
                         session_id=session_id
@@ -2674,35 +2700,30 @@ async def chat(request: ChatRequest):
         
         # ========== awaiting_selection 처리 (회의 선택 대기) ==========
         if context and context.get('state') == 'awaiting_selection':
-            print(f"[DEBUG] 컨텍스트 있음 (state: {context.get('state')})")
+            logger.debug("컨텍스트 있음 (state: %s)", context.get('state'))
             
             meetings = context.get('meetings', [])
             
             if meetings:
                 # ========== 0-0. 상태 필터링 ("완료", "예정" 단독 입력) ==========
-                status_filter_keywords = {
-                    '완료': 'COMPLETED',
-                    '완료된': 'COMPLETED', 
-                    '예정': 'SCHEDULED',
-                    '예정된': 'SCHEDULED'
-                }
-
                 # 명확화 질문 직후인지 체크
                 last_source = context.get('last_source')
-                print(f"[DEBUG] last_source: {last_source}, last_number: {context.get('last_ambiguous_number')}")
+                logger.debug("last_source: %s, last_number: %s", last_source, context.get('last_ambiguous_number'))
                 if last_source == 'ambiguous_number' and user_query.strip() in ['완료', '예정']:
                     # "완료" 또는 "예정"만 입력 시 → 이전 번호 재사용
                     last_number = context.get('last_ambiguous_number')
                     if last_number:
                         user_query = f"{user_query} {last_number}"
-                        print(f"[DEBUG] 명확화 질문 직후 → 쿼리 확장: {user_query}")
+                        logger.debug("명확화 질문 직후 → 쿼리 확장: %s", user_query)
                         
                 # ========== 쿼리 확장 적용 후 다시 체크 ==========
                 query_to_check = user_query.strip()  # 확장된 쿼리 사용
+                followup = classify_followup(user_query, intent)
+                logger.debug("후속 질문 분류: %s", followup)
 
-                if query_to_check in status_filter_keywords:
-                    target_status = status_filter_keywords[query_to_check]
-                    print(f"[DEBUG] 상태 필터링 요청: {target_status}")
+                if followup == 'status_filter':
+                    target_status = _STATUS_FILTER_KEYWORDS[query_to_check]
+                    logger.debug("상태 필터링 요청: %s", target_status)
 
                     # 해당 상태의 회의만 필터링
                     filtered_meetings = [m for m in meetings if m.get('status') == target_status]
@@ -2736,50 +2757,46 @@ async def chat(request: ChatRequest):
                     next_batch = remaining_meetings[:5]
                     start_number = current_offset + 1
                     
-                    answer = f"나머지 {'완료된' if target_status == 'COMPLETED' else '예정된'} 회의예요! 📋\n\n"
+                    parts = [f"나머지 {'완료된' if target_status == 'COMPLETED' else '예정된'} 회의예요! 📋\n\n"]
 
                     for i, meeting in enumerate(next_batch):
                         actual_number = start_number + i
                         
-                        scheduled_at = meeting.get('scheduled_at')
-                        if isinstance(scheduled_at, str):
-                            scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                        
-                        date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+                        date_str = meeting.get('scheduled_at_display', '')  # get_context에서 미리 포맷
                         title = meeting.get('title', '제목 없음')
                         
                         summary = meeting.get('summary', '')
                         if not summary or summary.strip() == '':
                             summary = meeting.get('description', '내용 없음')
                         
-                        lines = summary.split('.')[:2]
-                        display_text = '. '.join([line.strip() for line in lines if line.strip()])
+                        display_text = first_two_sentences(summary)
                         if len(display_text) > 80:
                             display_text = display_text[:80] + "..."
                         
-                        answer += f" 📌 {actual_number}. {title} {date_str}\n"
-                        answer += f"   - {display_text}\n\n"
+                        parts.append(f" 📌 {actual_number}. {title} {date_str}\n")
+                        parts.append(f"   - {display_text}\n\n")
                     
                     # 남은 개수 계산
                     total_shown = current_offset + len(next_batch)
                     remaining_count = len(filtered_meetings) - total_shown
                     
                     if remaining_count > 0:
-                        answer += f"💡 {remaining_count}개가 더 있어요!\n"
-                        answer += f"\"{'완료된' if target_status == 'COMPLETED' else '예정된'} 나머지\" 또는 \"나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
+                        parts.append(f"💡 {remaining_count}개가 더 있어요!\n")
+                        parts.append(f"\"{'완료된' if target_status == 'COMPLETED' else '예정된'} 나머지\" 또는 \"나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
                     else:
-                        answer += "✅ 모든 회의를 보여드렸어요!\n\n"
+                        parts.append("✅ 모든 회의를 보여드렸어요!\n\n")
 
-                    answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                    answer += f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊"
+                    parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+                    parts.append(f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊")
+                    answer = ''.join(parts)
                     
                     # 컨텍스트 업데이트
                     if target_status == 'COMPLETED':
                         context['shown_completed'] = total_shown
+                        update_context_fields(session_id, shown_completed=total_shown)
                     else:
                         context['shown_scheduled'] = total_shown
-                    
-                    save_context(session_id, context)
+                        update_context_fields(session_id, shown_scheduled=total_shown)
                     
                     return ChatResponse(
                         answer=answer,
@@ -2789,10 +2806,8 @@ async def chat(request: ChatRequest):
                 
                 # ========== 0-1. 번호 선택 ==========
                 # "완료 2", "예정 2", "2" 패턴 감지
-                number_pattern = r'(?:(완료|예정)\s*)?(\d+)'
-                number_match = re.match(number_pattern, user_query.strip())
-
-                if number_match:
+                if followup == 'number':
+                    number_match = _NUMBER_SELECT_RE.match(query_to_check)
                     status_prefix = number_match.group(1)  # "완료" 또는 "예정" 또는 None
                     selected_number = int(number_match.group(2))
                     
@@ -2806,7 +2821,7 @@ async def chat(request: ChatRequest):
                     if status_prefix == '완료':
                         if 1 <= selected_number <= shown_completed:
                             selected_meeting = completed_meetings[selected_number - 1]
-                            print(f"[DEBUG] 완료 {selected_number}번 선택: {selected_meeting.get('title')}")
+                            logger.debug("완료 %s번 선택: %s", selected_number, selected_meeting.get('title'))
                         else:
                             return ChatResponse(
                                 answer=f"❌ 완료 {selected_number}번은 없어요!\n완료 1번부터 {shown_completed}번까지 선택할 수 있어요. 😊",
@@ -2817,7 +2832,7 @@ async def chat(request: ChatRequest):
                     elif status_prefix == '예정':
                         if 1 <= selected_number <= shown_scheduled:
                             selected_meeting = scheduled_meetings[selected_number - 1]
-                            print(f"[DEBUG] 예정 {selected_number}번 선택: {selected_meeting.get('title')}")
+                            logger.debug("예정 %s번 선택: %s", selected_number, selected_meeting.get('title'))
                         else:
                             return ChatResponse(
                                 answer=f"❌ 예정 {selected_number}번은 없어요!\n예정 1번부터 {shown_scheduled}번까지 선택할 수 있어요. 😊",
@@ -2836,7 +2851,7 @@ async def chat(request: ChatRequest):
                             # 명확화 질문
                             context['last_source'] = 'ambiguous_number'
                             context['last_ambiguous_number'] = selected_number
-                            save_context(session_id, context)
+                            save_context_async(session_id, context)
 
                             # 둘 다 있음 → 명확화 질문
                             return ChatResponse(
@@ -2848,12 +2863,12 @@ async def chat(request: ChatRequest):
                         elif has_completed:
                             # 완료만 있음
                             selected_meeting = completed_meetings[selected_number - 1]
-                            print(f"[DEBUG] 완료 {selected_number}번 선택 (자동): {selected_meeting.get('title')}")
+                            logger.debug("완료 %s번 선택 (자동): %s", selected_number, selected_meeting.get('title'))
                         
                         elif has_scheduled:
                             # 예정만 있음
                             selected_meeting = scheduled_meetings[selected_number - 1]
-                            print(f"[DEBUG] 예정 {selected_number}번 선택 (자동): {selected_meeting.get('title')}")
+                            logger.debug("예정 %s번 선택 (자동): %s", selected_number, selected_meeting.get('title'))
                         
                         else:
                             # 둘 다 없음
@@ -2875,31 +2890,23 @@ async def chat(request: ChatRequest):
                         'shown_completed': context.get('shown_completed', 3),
                         'shown_scheduled': context.get('shown_scheduled', 3),
                     }
-                    save_context(session_id, new_context)
+                    save_context_async(session_id, new_context)
 
                     return ChatResponse(
                         answer=answer,
                         history=request.history + [
-                            {"role": "user", "content": user_query},
-                            {"role": "assistant", "content": answer}
+                            {"role": ROLE_USER, "content": user_query},
+                            {"role": ROLE_ASSISTANT, "content": answer}
                         ],
                         source="meeting_selection_by_number",
                         session_id=session_id
                     )
                 
                 # ========== 0-2. "나머지", "더" 요청 감지 (완료/예정 분리 + 정규식) ==========
-                query_lower = user_query.lower().replace(' ', '')  # 띄어쓰기 제거
 
                 # 1. 완료된 회의 나머지 요청 (정규식 + 오타 허용)
-                completed_patterns = [
-                    r'완료.*나머',
-                    r'완료.*더',
-                    r'완료.*추가',
-                    r'완료.*남',
-                ]
-
-                if any(re.search(pattern, query_lower) for pattern in completed_patterns):
-                    print(f"[DEBUG] 완료된 회의 나머지 요청")
+                if followup == 'more_completed':
+                    logger.debug("완료된 회의 나머지 요청")
                     
                     completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
                     shown_completed = context.get('shown_completed', 3)
@@ -2913,7 +2920,7 @@ async def chat(request: ChatRequest):
                         )
                     
                     next_batch = remaining[:5]
-                    answer = "나머지 완료된 회의예요! 📋\n\n"
+                    parts = ["나머지 완료된 회의예요! 📋\n\n"]
                     
                     # ========== 완료된 회의만 표시, 번호는 shown_completed + 1부터 ==========
                     start_number = shown_completed + 1
@@ -2921,40 +2928,36 @@ async def chat(request: ChatRequest):
                     for i, meeting in enumerate(next_batch):
                         actual_number = start_number + i  # 4, 5, 6, 7, 8
                         
-                        scheduled_at = meeting.get('scheduled_at')
-                        if isinstance(scheduled_at, str):
-                            scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                        
-                        date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+                        date_str = meeting.get('scheduled_at_display', '')  # get_context에서 미리 포맷
                         title = meeting.get('title', '제목 없음')
                         
                         summary = meeting.get('summary', '')
                         if not summary or summary.strip() == '':
                             summary = meeting.get('description', '내용 없음')
                         
-                        lines = summary.split('.')[:2]
-                        display_text = '. '.join([line.strip() for line in lines if line.strip()])
+                        display_text = first_two_sentences(summary)
                         if len(display_text) > 80:
                             display_text = display_text[:80] + "..."
                         
-                        answer += f"📌 {actual_number}. {title} {date_str}\n"
-                        answer += f"   - {display_text}\n\n"
+                        parts.append(f"📌 {actual_number}. {title} {date_str}\n")
+                        parts.append(f"   - {display_text}\n\n")
                     
                     total_shown = shown_completed + len(next_batch)
                     remaining_count = len(completed_meetings) - total_shown
                     
                     if remaining_count > 0:
-                        answer += f"💡 완료된 회의가 {remaining_count}개 더 있어요!\n"
-                        answer += "\"완료된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
+                        parts.append(f"💡 완료된 회의가 {remaining_count}개 더 있어요!\n")
+                        parts.append("\"완료된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
                     else:
-                        answer += "✅ 완료된 회의를 모두 보여드렸어요!\n\n"
+                        parts.append("✅ 완료된 회의를 모두 보여드렸어요!\n\n")
                     
-                    answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                    answer += f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊"
+                    parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+                    parts.append(f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊")
+                    answer = ''.join(parts)
                     
                     # 컨텍스트 업데이트
                     context['shown_completed'] = total_shown
-                    save_context(session_id, context)
+                    update_context_fields(session_id, shown_completed=total_shown)
                     
                     return ChatResponse(
                         answer=answer,
@@ -2963,15 +2966,8 @@ async def chat(request: ChatRequest):
                     )
 
                 # 2. 예정된 회의 나머지 요청 (정규식 + 오타 허용)
-                scheduled_patterns = [
-                    r'예정.*나머',
-                    r'예정.*더',
-                    r'예정.*추가',
-                    r'예정.*남',
-                ]
-
-                if any(re.search(pattern, query_lower) for pattern in scheduled_patterns):
-                    print(f"[DEBUG] 예정된 회의 나머지 요청")
+                if followup == 'more_scheduled':
+                    logger.debug("예정된 회의 나머지 요청")
                     
                     scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
                     shown_scheduled = context.get('shown_scheduled', 3)
@@ -2985,7 +2981,7 @@ async def chat(request: ChatRequest):
                         )
                     
                     next_batch = remaining[:5]
-                    answer = "나머지 예정된 회의예요! 📋\n\n"
+                    parts = ["나머지 예정된 회의예요! 📋\n\n"]
                     
                     # ========== 예정된 회의만 표시, 번호는 shown_scheduled + 1부터 ==========
                     start_number = shown_scheduled + 1
@@ -2993,40 +2989,36 @@ async def chat(request: ChatRequest):
                     for i, meeting in enumerate(next_batch):
                         actual_number = start_number + i  # 4, 5, 6, 7, 8
                         
-                        scheduled_at = meeting.get('scheduled_at')
-                        if isinstance(scheduled_at, str):
-                            scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                        
-                        date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+                        date_str = meeting.get('scheduled_at_display', '')  # get_context에서 미리 포맷
                         title = meeting.get('title', '제목 없음')
                         
                         summary = meeting.get('summary', '')
                         if not summary or summary.strip() == '':
                             summary = meeting.get('description', '내용 없음')
                         
-                        lines = summary.split('.')[:2]
-                        display_text = '. '.join([line.strip() for line in lines if line.strip()])
+                        display_text = first_two_sentences(summary)
                         if len(display_text) > 80:
                             display_text = display_text[:80] + "..."
                         
-                        answer += f"📌 {actual_number}. {title} {date_str}\n"
-                        answer += f"   - {display_text}\n\n"
+                        parts.append(f"📌 {actual_number}. {title} {date_str}\n")
+                        parts.append(f"   - {display_text}\n\n")
                     
                     total_shown = shown_scheduled + len(next_batch)
                     remaining_count = len(scheduled_meetings) - total_shown
                     
                     if remaining_count > 0:
-                        answer += f"💡 예정된 회의가 {remaining_count}개 더 있어요!\n"
-                        answer += "\"예정된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
+                        parts.append(f"💡 예정된 회의가 {remaining_count}개 더 있어요!\n")
+                        parts.append("\"예정된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
                     else:
-                        answer += "✅ 예정된 회의를 모두 보여드렸어요!\n\n"
+                        parts.append("✅ 예정된 회의를 모두 보여드렸어요!\n\n")
                     
-                    answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                    answer += f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊"
+                    parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+                    parts.append(f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊")
+                    answer = ''.join(parts)
                     
                     # 컨텍스트 업데이트
                     context['shown_scheduled'] = total_shown
-                    save_context(session_id, context)
+                    update_context_fields(session_id, shown_scheduled=total_shown)
                     
                     return ChatResponse(
                         answer=answer,
@@ -3035,34 +3027,8 @@ async def chat(request: ChatRequest):
                     )
 
                 # 3. 일반 "나머지" - 키워드 + 정규식 + 오타 허용
-                more_keywords = ['나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여', 
-                                '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서', 
-                                '다음', '또', '그외', '외', '그밖', '더있나', '더있니', 
-                                '또뭐', '또있어', '나머', '남머', '나미', '더보']
-
-                more_patterns = [
-                    r'나머.*',
-                    r'남은.*',
-                    r'더.*[보줘있알려]',
-                    r'추가.*',
-                    r'계속|이어서|다음',
-                    r'또.*[있뭐어]',
-                    r'그\s*외',
-                    r'더\s*[보줘]'
-                ]
-
-                wants_more = any(keyword in user_query for keyword in more_keywords) or \
-                            any(re.search(pattern, user_query) for pattern in more_patterns)
-
-                # 오타 허용 (띄어쓰기 제거 버전에서도 체크)
-                if not wants_more:
-                    fuzzy_more = ['나머', '남머', '나미', '너머', '더보', '더줘', '더있', '더알']
-                    if any(x in query_lower for x in fuzzy_more):
-                        wants_more = True
-                        print(f"[DEBUG] 유사 단어 감지 (오타 허용)")
-
-                if wants_more:
-                    print(f"[DEBUG] 일반 '나머지' 요청")
+                if followup == 'more':
+                    logger.debug("일반 '나머지' 요청")
                     
                     completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
                     scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
@@ -3088,7 +3054,7 @@ async def chat(request: ChatRequest):
                     
                     # ========== 완료된 회의만 나머지 있음 → 자동 표시 ==========
                     elif has_more_completed:
-                        print(f"[DEBUG] 완료된 회의만 나머지 있음 → 자동 표시")
+                        logger.debug("완료된 회의만 나머지 있음 → 자동 표시")
                         
                         remaining = completed_meetings[shown_completed:]
                         next_batch = remaining[:5]
@@ -3096,44 +3062,40 @@ async def chat(request: ChatRequest):
                         # 시작 번호 계산: 완료 shown + 1
                         start_number = shown_completed + 1
                         
-                        answer = "나머지 완료된 회의예요! 📋\n\n"
+                        parts = ["나머지 완료된 회의예요! 📋\n\n"]
                         
                         for i, meeting in enumerate(next_batch):
                             actual_number = start_number + i
                             
-                            scheduled_at = meeting.get('scheduled_at')
-                            if isinstance(scheduled_at, str):
-                                scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                            
-                            date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+                            date_str = meeting.get('scheduled_at_display', '')  # get_context에서 미리 포맷
                             title = meeting.get('title', '제목 없음')
                             
                             summary = meeting.get('summary', '')
                             if not summary or summary.strip() == '':
                                 summary = meeting.get('description', '내용 없음')
                             
-                            lines = summary.split('.')[:2]
-                            display_text = '. '.join([line.strip() for line in lines if line.strip()])
+                            display_text = first_two_sentences(summary)
                             if len(display_text) > 80:
                                 display_text = display_text[:80] + "..."
                             
-                            answer += f"📌 {actual_number}. {title} {date_str}\n"
-                            answer += f"   - {display_text}\n\n"
+                            parts.append(f"📌 {actual_number}. {title} {date_str}\n")
+                            parts.append(f"   - {display_text}\n\n")
                         
                         total_shown = shown_completed + len(next_batch)
                         remaining_count = len(completed_meetings) - total_shown
                         
                         if remaining_count > 0:
-                            answer += f"💡 완료된 회의가 {remaining_count}개 더 있어요!\n"
-                            answer += "\"나머지\" 또는 \"완료된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
+                            parts.append(f"💡 완료된 회의가 {remaining_count}개 더 있어요!\n")
+                            parts.append("\"나머지\" 또는 \"완료된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
                         else:
-                            answer += "✅ 완료된 회의를 모두 보여드렸어요!\n\n"
+                            parts.append("✅ 완료된 회의를 모두 보여드렸어요!\n\n")
                         
-                        answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                        answer += f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊"
+                        parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+                        parts.append(f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊")
+                        answer = ''.join(parts)
                         
                         context['shown_completed'] = total_shown
-                        save_context(session_id, context)
+                        update_context_fields(session_id, shown_completed=total_shown)
                         
                         return ChatResponse(
                             answer=answer,
@@ -3143,7 +3105,7 @@ async def chat(request: ChatRequest):
                         
                     # ========== 예정된 회의만 나머지 있음 → 자동 표시 ==========
                     elif has_more_scheduled:
-                        print(f"[DEBUG] 예정된 회의만 나머지 있음 → 자동 표시")
+                        logger.debug("예정된 회의만 나머지 있음 → 자동 표시")
                         
                         remaining = scheduled_meetings[shown_scheduled:]
                         next_batch = remaining[:5]
@@ -3151,44 +3113,40 @@ async def chat(request: ChatRequest):
                         # 시작 번호 계산: 완료 전체 + 예정 shown + 1
                         start_number = shown_scheduled + 1
 
-                        answer = "나머지 예정된 회의예요! 📋\n\n"
+                        parts = ["나머지 예정된 회의예요! 📋\n\n"]
                         
                         for i, meeting in enumerate(next_batch):
                             actual_number = start_number + i
                             
-                            scheduled_at = meeting.get('scheduled_at')
-                            if isinstance(scheduled_at, str):
-                                scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                            
-                            date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+                            date_str = meeting.get('scheduled_at_display', '')  # get_context에서 미리 포맷
                             title = meeting.get('title', '제목 없음')
                             
                             summary = meeting.get('summary', '')
                             if not summary or summary.strip() == '':
                                 summary = meeting.get('description', '내용 없음')
                             
-                            lines = summary.split('.')[:2]
-                            display_text = '. '.join([line.strip() for line in lines if line.strip()])
+                            display_text = first_two_sentences(summary)
                             if len(display_text) > 80:
                                 display_text = display_text[:80] + "..."
                             
-                            answer += f"📌 {actual_number}. {title} {date_str}\n"
-                            answer += f"   - {display_text}\n\n"
+                            parts.append(f"📌 {actual_number}. {title} {date_str}\n")
+                            parts.append(f"   - {display_text}\n\n")
                         
                         total_shown = shown_scheduled + len(next_batch)
                         remaining_count = len(scheduled_meetings) - total_shown
                         
                         if remaining_count > 0:
-                            answer += f"💡 예정된 회의가 {remaining_count}개 더 있어요!\n"
-                            answer += "\"나머지\" 또는 \"예정된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n"
+                            parts.append(f"💡 예정된 회의가 {remaining_count}개 더 있어요!\n")
+                            parts.append("\"나머지\" 또는 \"예정된 나머지\" 라고 하시면 계속 볼 수 있어요.\n\n")
                         else:
-                            answer += "✅ 예정된 회의를 모두 보여드렸어요!\n\n"
+                            parts.append("✅ 예정된 회의를 모두 보여드렸어요!\n\n")
                         
-                        answer += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-                        answer += f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊"
+                        parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+                        parts.append(f"예: 번호({start_number}, {start_number+1}), 날짜, 제목 😊")
+                        answer = ''.join(parts)
                         
                         context['shown_scheduled'] = total_shown
-                        save_context(session_id, context)
+                        update_context_fields(session_id, shown_scheduled=total_shown)
                         
                         return ChatResponse(
                             answer=answer,
@@ -3206,114 +3164,78 @@ async def chat(request: ChatRequest):
     
         # ========== 1. 상태 키워드 감지 ==========
             if meetings:
-                # ========== "나머지" 요청 먼저 체크 ==========
-                if any(word in user_query.lower() for word in ['나머지', '더', '더보기', '추가', '계속']):
-                    print("[DEBUG] '나머지' 회의 요청 감지")
-                    shown_count = context.get('shown_count', 5)
-                    remaining = meetings[shown_count:]
-                    
-                    if remaining:
-                        print(f"[DEBUG] 나머지 {len(remaining)}개 회의 반환")
-                        response_text = f"나머지 {len(remaining)}개 회의입니다:\n\n"
-                        for idx, meeting in enumerate(remaining, start=shown_count+1):
-                            response_text += f"{idx}. {meeting['title']}\n"
-                            response_text += f"   📅 {meeting['scheduled_at']}\n"
-                            if meeting.get('participants'):
-                                response_text += f"   👥 {', '.join(meeting['participants'])}\n"
-                            response_text += "\n"
-                        
-                        # shown_count 업데이트
-                        context['shown_count'] = len(meetings)
-                        save_context(session_id, context)
-                        
-                        return ChatResponse(
-                            answer=response_text,
-                            history=request.history + [
-                                {"role": "user", "content": user_query},
-                                {"role": "assistant", "content": response_text}
-                            ],
-                            source="remaining_meetings",
-                            session_id=session_id
-                        )
-                    else:
-                        no_more = "이미 모든 회의를 보여드렸습니다."
-                        return ChatResponse(
-                            answer=no_more,
-                            history=request.history + [
-                                {"role": "user", "content": user_query},
-                                {"role": "assistant", "content": no_more}
-                            ],
-                            source="no_more_meetings",
-                            session_id=session_id
-                        )
-    
                 # ========== 1. 상태 키워드 감지 (최우선!) ==========
-                status_keywords = ['예정', '완료', '진행중', '취소', 'scheduled', 'completed', 'recording']
-                has_status_keyword = any(keyword in user_query for keyword in status_keywords)
-                
-                if has_status_keyword:
-                    print(f"[DEBUG] 상태 키워드 감지 → 새로운 검색: '{user_query}'")
+                if followup == 'new_search':
+                    logger.debug("상태 키워드 감지 → 새로운 검색: '%s'", user_query)
                     delete_context(session_id)
                     # 아래 MySQL 검색으로 진행
                 
                 # ========== 2. 검색 의도 있는지 체크 ==========
-                elif any(keyword in user_query for keyword in ['찾아', '검색', '있어', '있었어', '있나', '뭐', '어떤', '미팅']) or intent == 'meeting_search':
-                    print(f"[DEBUG] 검색 의도 감지: '{user_query}'")
+                elif followup == 'search_intent':
+                    logger.debug("검색 의도 감지: '%s'", user_query)
 
                     # 컨텍스트 매칭 점수 계산
-                    korean_tokens = re.findall(r'[가-힣]{2,}', user_query)
-                    english_tokens = re.findall(r'[A-Za-z0-9]+', user_query)
+                    korean_tokens = _RE_KOR_TOKENS.findall(user_query)
+                    english_tokens = _RE_EN_TOKENS.findall(user_query)
                     all_tokens = korean_tokens + english_tokens
                     
                     # 불용어/검색어 제거
-                    excluded = ['회의', '알려', '알려줘', '보여', '보여줘', '찾아', '검색', '있어', '있었어', '있나', '관련', '뭐가', '어떤']
-                    meaningful_tokens = [t for t in all_tokens if len(t) >= 2 and t not in excluded]
+                    meaningful_tokens = [t for t in all_tokens if len(t) >= 2 and t not in _EXCLUDED]
                     
-                    # 컨텍스트와 매칭 시도
+                    # 컨텍스트와 매칭 시도 (저장된 토큰 집합 교집합 → 안 맞은 토큰만 부분 문자열 검사)
                     best_match_score = 0
-                    for meeting in meetings:
-                        title = meeting.get('title', '').lower()
-                        description = (meeting.get('description') or '').lower()
-                        
-                        if meaningful_tokens:
-                            match_count = sum(1 for token in meaningful_tokens if token in title or token in description)
-                            score = match_count / len(meaningful_tokens) if meaningful_tokens else 0
+                    if meaningful_tokens:
+                        query_tokens = frozenset(meaningful_tokens)
+                        substring_re = _token_substring_re(query_tokens)  # 쿼리당 한 번만 컴파일
+                        for meeting in meetings:
+                            tokens = meeting.get('_tokens')
+                            if tokens is None:
+                                tokens = meeting_tokens(meeting)
+                            hits = query_tokens.intersection(tokens)
+                            
+                            if len(hits) < len(query_tokens):
+                                # 예: '마케팅' ⊂ '마케팅회의' 같은 부분 일치 (제목+설명 한 번만 스캔)
+                                text = f"{meeting_title_lc(meeting)}\n{meeting_desc_lc(meeting)}"
+                                hits = hits.union(substring_re.findall(text))
+                                # 같은 위치에서 더 긴 토큰이 잡히면 짧은 토큰은 그 안에 포함됨
+                                hits = hits.union(t for t in query_tokens - hits if any(t in h for h in hits))
+                            
+                            score = len(hits) / len(query_tokens)
                             best_match_score = max(best_match_score, score)
                     
                     # 매칭 점수가 높으면 (80% 이상) → 선택 시도
                     if best_match_score >= 0.8:
-                        print(f"[DEBUG] 검색 의도 있지만 강한 매칭 ({best_match_score:.2f}) → 선택 시도: '{user_query}'")
+                        logger.debug("검색 의도 있지만 강한 매칭 (%.2f) → 선택 시도: '%s'", best_match_score, user_query)
                         selection_result = handle_selection(user_query, context, request, session_id)
                         
                         # None이면 선택 실패 → 새로운 검색
                         if selection_result is None:
-                            print(f"[DEBUG] 선택 실패 → 새로운 검색 시작")
+                            logger.debug("선택 실패 → 새로운 검색 시작")
                             delete_context(session_id)
                             # 아래 검색 로직으로 계속 진행
                         else:
                             return selection_result
                     else:
                         # 매칭 점수 낮음 → 새로운 검색
-                        print(f"[DEBUG] 검색 의도 감지 + 약한 매칭 ({best_match_score:.2f}) → 새로운 검색: '{user_query}'")
+                        logger.debug("검색 의도 감지 + 약한 매칭 (%.2f) → 새로운 검색: '%s'", best_match_score, user_query)
                         delete_context(session_id)
                         # 아래 MySQL 검색으로 진행
                 
                 # 3. 검색 의도 없음 → 날짜/키워드로 선택 시도
                 else:
                     # 날짜 범위 표현이면 새로운 검색
-                    date_range_keywords = ['부터', '까지', '사이', '동안', '이후', '이전']
-                    if any(keyword in user_query for keyword in date_range_keywords):
-                        print(f"[DEBUG] 날짜 범위 검색 감지 → 새로운 검색: '{user_query}'")
+                    if _DATE_RANGE_RE.search(user_query):
+                        logger.debug("날짜 범위 검색 감지 → 새로운 검색: '%s'", user_query)
                         delete_context(session_id)
                         # 아래 MySQL 검색으로 진행
                     
                     # 단일 날짜 패턴 (범위 아님)
-                    elif re.search(r'^\d{1,2}월\s*\d{1,2}일$|^\d{1,2}일$', user_query.strip()):
-                        print(f"[DEBUG] 단일 날짜 감지 → 선택 시도: '{user_query}'")
+                    elif _RE_SINGLE_DATE.search(user_query.strip()):
+                        logger.debug("단일 날짜 감지 → 선택 시도: '%s'", user_query)
                         selection_result = handle_selection(user_query, context, request, session_id)
                         
                         if selection_result is None:
-                            print(f"[DEBUG] 선택 실패 → 새로운 검색 시작")
+                            logger.debug("선택 실패 → 새로운 검색 시작")
                             delete_context(session_id)
                             # 아래 검색 로직으로 계속 진행
                         else:
@@ -3324,27 +3246,27 @@ async def chat(request: ChatRequest):
                     user_query_lower = user_query.lower()
                     
                     for meeting in meetings:
-                        title = meeting.get('title', '').lower()
-                        description = (meeting.get('description') or '').lower()
+                        title = meeting_title_lc(meeting)
+                        description = meeting_desc_lc(meeting)
                         
                         # 입력이 제목/설명에 포함되면 선택
                         if user_query_lower in title or user_query_lower in description:
-                            print(f"[DEBUG] 컨텍스트 직접 매칭 → 선택 시도: '{user_query}'")
+                            logger.debug("컨텍스트 직접 매칭 → 선택 시도: '%s'", user_query)
                             selection_result = handle_selection(user_query, context, request, session_id)
                             
                             if selection_result is None:
-                                print(f"[DEBUG] 선택 실패 → 새로운 검색 시작")
+                                logger.debug("선택 실패 → 새로운 검색 시작")
                                 delete_context(session_id)
                                 # 아래 검색 로직으로 계속 진행
                             else:
                                 return selection_result
     
                     # 매칭 실패 → 선택 시도
-                    print(f"[DEBUG] 컨텍스트 있음 + 검색 의도 없음 → 선택 시도: '{user_query}'")
+                    logger.debug("컨텍스트 있음 + 검색 의도 없음 → 선택 시도: '%s'", user_query)
                     selection_result = handle_selection(user_query, context, request, session_id)
 
                     if selection_result is None:
-                        print(f"[DEBUG] 선택 실패 → 새로운 검색 시작")
+                        logger.debug("선택 실패 → 새로운 검색 시작")
                         delete_context(session_id)
                         # 아래 검색 로직으로 계속 진행
                     else:
@@ -3352,30 +3274,11 @@ async def chat(request: ChatRequest):
 
         # === 0단계: 오프토픽 필터링 ===
         # ========== 페이지네이션 키워드 정규식 패턴 ==========
-        pagination_keywords = ['나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여', 
-                            '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서', 
-                            '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니', 
-                            '또뭐', '또있어', '나머', '남머', '나미', '더보',
-                            '줘봐', '줘', '보여줘']
-
-        pagination_patterns = [
-            r'나머.*',
-            r'남은.*',
-            r'더.*[보줘있알려]',
-            r'추가.*',
-            r'계속|이어서|다음',
-            r'또.*[있뭐어]',
-            r'그\s*외',
-            r'더\s*[보줘]',
-            r'줘\s*봐',
-            r'보여\s*줘'
-        ]
-
-        has_pagination = (any(kw in user_query for kw in pagination_keywords) or 
-                        any(re.search(pattern, user_query) for pattern in pagination_patterns))
+        has_pagination = bool(_PAGINATION_KEYWORDS_RE.search(user_query) or
+                              _PAGINATION_PATTERNS_RE.search(user_query))
 
         if context and context.get('meetings') and has_pagination:
-            print(f"[DEBUG] 페이지네이션 키워드 감지 → 오프토픽 체크 스킵")
+            logger.debug("페이지네이션 키워드 감지 → 오프토픽 체크 스킵")
             # 오프토픽 체크 건너뛰고 아래로 진행
         else:
             # 인사말이나 의미 없는 입력 체크
@@ -3385,8 +3288,8 @@ async def chat(request: ChatRequest):
                 return ChatResponse(
                     answer=answer,
                     history=request.history + [
-                        {"role": "user", "content": user_query},
-                        {"role": "assistant", "content": answer}
+                        {"role": ROLE_USER, "content": user_query},
+                        {"role": ROLE_ASSISTANT, "content": answer}
                     ],
                     source="greeting",
                     session_id=session_id
@@ -3395,16 +3298,16 @@ async def chat(request: ChatRequest):
             if is_off_topic_query(user_query):
                 # 예외: 키워드가 있고 "회의" 단어가 포함되어 있으면 회의 검색 시도
                 if ('회의' in user_query or '미팅' in user_query) and (keywords and len(keywords) > 0):
-                    print(f"[DEBUG] 오프토픽이지만 회의 키워드 있음 → 회의 검색 계속 진행")
+                    logger.debug("오프토픽이지만 회의 키워드 있음 → 회의 검색 계속 진행")
                 else:
-                    print(f"\n🚫 오프토픽 → 회의록 검색 전용 안내")
+                    logger.debug("🚫 오프토픽 → 회의록 검색 전용 안내")
                     answer = get_off_topic_response()
                     
                     return ChatResponse(
                         answer=answer,
                         history=request.history + [
-                            {"role": "user", "content": user_query},
-                            {"role": "assistant", "content": answer}
+                            {"role": ROLE_USER, "content": user_query},
+                            {"role": ROLE_ASSISTANT, "content": answer}
                         ],
                         source="off_topic",
                         session_id=session_id
@@ -3427,42 +3330,25 @@ async def chat(request: ChatRequest):
         if search_response and search_response.startswith("[FALLBACK_SUCCESS]"):
             # 마커 제거
             final_message = search_response.replace("[FALLBACK_SUCCESS]", "")
-            print(f"[DEBUG] 단계적 완화 성공 감지 → 컨텍스트 저장 후 반환")
+            logger.debug("단계적 완화 성공 감지 → 컨텍스트 저장 후 반환")
             
             # ========== 컨텍스트 저장 (선택 가능하도록!) ==========
             if meetings and len(meetings) > 0:
-                # datetime → str 변환
-                meetings_serializable = []
-                for meeting in meetings:
-                    meeting_copy = {}
-                    for key, value in meeting.items():
-                        if isinstance(value, datetime):
-                            meeting_copy[key] = value.isoformat()
-                        else:
-                            meeting_copy[key] = value
-                    meetings_serializable.append(meeting_copy)
-                
-                shown_completed, shown_scheduled = calculate_shown_counts(meetings[:5])
-
-                # 컨텍스트 저장
-                context_data = {
-                    'state': 'awaiting_selection',
-                    'shown_completed': shown_completed,
-                    'shown_scheduled': shown_scheduled,
-                    'meetings': meetings_serializable,
-                    'total_count': len(meetings),
-                    'shown_completed': 3,
-                    'shown_scheduled': 3,
-                    'original_query': user_query
-                }
-                save_context(session_id, context_data)
-                print(f"[DEBUG] 완화 성공 → 컨텍스트 저장: {len(meetings)}개")
+                # 컨텍스트 저장 (shown 개수는 완화 검색 결과 표시 기준 3개씩)
+                build_and_save_meeting_context(
+                    session_id, meetings, 'awaiting_selection',
+                    total_count=len(meetings),
+                    shown_completed=3,
+                    shown_scheduled=3,
+                    original_query=user_query
+                )
+                logger.debug("완화 성공 → 컨텍스트 저장: %s개", len(meetings))
             
             return ChatResponse(
                 answer=final_message,
                 history=request.history + [
-                    {"role": "user", "content": user_query},
-                    {"role": "assistant", "content": final_message}
+                    {"role": ROLE_USER, "content": user_query},
+                    {"role": ROLE_ASSISTANT, "content": final_message}
                 ],
                 source="fallback_success",
                 session_id=session_id
@@ -3475,8 +3361,8 @@ async def chat(request: ChatRequest):
             return ChatResponse(
                 answer=default_msg,
                 history=request.history + [
-                    {"role": "user", "content": user_query},
-                    {"role": "assistant", "content": default_msg}
+                    {"role": ROLE_USER, "content": user_query},
+                    {"role": ROLE_ASSISTANT, "content": default_msg}
                 ],
                 source="error",
                 session_id=session_id
@@ -3485,7 +3371,7 @@ async def chat(request: ChatRequest):
         # === 2단계: 실패 메시지 체크 ===
         # meetings 리스트로만 판단 (메시지 텍스트 체크 X)
         if not meetings or len(meetings) == 0:
-            print(f"⚠️ MySQL 검색 실패 (결과 없음)")
+            logger.warning("⚠️ MySQL 검색 실패 (결과 없음)")
             
             # 컨텍스트가 있었다면 후속 질문으로 처리
             if context and context.get('state') == 'meeting_selected' and selected_meeting_id:
@@ -3497,8 +3383,8 @@ async def chat(request: ChatRequest):
             return ChatResponse(
                 answer=fallback_msg,
                 history=request.history + [
-                    {"role": "user", "content": original_query},
-                    {"role": "assistant", "content": fallback_msg}
+                    {"role": ROLE_USER, "content": original_query},
+                    {"role": ROLE_ASSISTANT, "content": fallback_msg}
                 ],
                 source="not_found",
                 session_id=session_id
@@ -3508,7 +3394,7 @@ async def chat(request: ChatRequest):
         total = len(meetings)
 
         if total > 1:
-            print(f"[DEBUG] {total}개 회의 발견 → 컨텍스트 저장")
+            logger.debug("%s개 회의 발견 → 컨텍스트 저장", total)
             
             # ========== 상태별 분리 후 재정렬 ==========
             completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
@@ -3517,17 +3403,6 @@ async def chat(request: ChatRequest):
             # 완료 + 예정 순서로 병합
             reordered_meetings = completed_meetings + scheduled_meetings
             
-            # datetime → str 변환
-            meetings_serializable = []
-            for meeting in reordered_meetings:  # 재정렬된 순서로 저장
-                meeting_copy = {}
-                for key, value in meeting.items():
-                    if isinstance(value, datetime):
-                        meeting_copy[key] = value.isoformat()
-                    else:
-                        meeting_copy[key] = value
-                meetings_serializable.append(meeting_copy)
-            
             # ========== 상태별 분리 포맷팅 적용 (컨텍스트 저장 전에) ==========
             final_answer, shown_completed, shown_scheduled = format_multiple_meetings_short(
                 meetings,
@@ -3537,28 +3412,25 @@ async def chat(request: ChatRequest):
                 status
             )
 
-            # 컨텍스트 저장 (실제 표시된 개수로!)
-            context = {
-                'state': 'awaiting_selection',
-                'shown_completed': shown_completed,
-                'shown_scheduled': shown_scheduled,
-                'meeting_list': meetings_serializable,
-                'meetings': meetings_serializable,
-                'last_shown_index': min(5, total),
-                'offset': min(5, total),
-                'shown_count': min(5, total),
-                'total_count': total,
-                'original_query': user_query
-            }
-
-            save_context(session_id, context)
-            print(f"[DEBUG] 컨텍스트 저장 완료: {len(meetings_serializable)}개 회의 (shown_completed={shown_completed}, shown_scheduled={shown_scheduled})")
+            # 컨텍스트 저장 (실제 표시된 개수로!) - 재정렬된 순서로 저장
+            context = build_and_save_meeting_context(
+                session_id, reordered_meetings, 'awaiting_selection',
+                list_keys=('meeting_list', 'meetings'),
+                shown_completed=shown_completed,
+                shown_scheduled=shown_scheduled,
+                last_shown_index=min(5, total),
+                offset=min(5, total),
+                shown_count=min(5, total),
+                total_count=total,
+                original_query=user_query
+            )
+            logger.debug("컨텍스트 저장 완료: %s개 회의 (shown_completed=%s, shown_scheduled=%s)", len(reordered_meetings), shown_completed, shown_scheduled)
 
             return ChatResponse(
                 answer=final_answer,
                 history=request.history + [
-                    {"role": "user", "content": user_query},
-                    {"role": "assistant", "content": final_answer}
+                    {"role": ROLE_USER, "content": user_query},
+                    {"role": ROLE_ASSISTANT, "content": final_answer}
                 ],
                 source="multiple_meetings",
                 session_id=session_id
@@ -3584,8 +3456,8 @@ async def chat(request: ChatRequest):
                 return ChatResponse(
                     answer=count_response,
                     history=request.history + [
-                        {"role": "user", "content": original_query},
-                        {"role": "assistant", "content": count_response}
+                        {"role": ROLE_USER, "content": original_query},
+                        {"role": ROLE_ASSISTANT, "content": count_response}
                     ],
                     source="count_confirmation",
                     session_id=session_id
@@ -3614,15 +3486,15 @@ async def chat(request: ChatRequest):
             return ChatResponse(
                 answer=confirmation_response,
                 history=request.history + [
-                    {"role": "user", "content": original_query},
-                    {"role": "assistant", "content": confirmation_response}
+                    {"role": ROLE_USER, "content": original_query},
+                    {"role": ROLE_ASSISTANT, "content": confirmation_response}
                 ],
                 source="confirmation",
                 session_id=session_id
             )
         
         # === 4단계: 단일 회의 (이미 search.py에서 템플릿 적용됨) ===
-        print(f"\n✅ 단일 회의 발견")
+        logger.debug("✅ 단일 회의 발견")
         final_answer = search_response  # search.py에서 이미 페르소나 템플릿 적용됨
 
         # 단일 회의도 컨텍스트 저장 (meeting_id 저장!)
@@ -3637,45 +3509,52 @@ async def chat(request: ChatRequest):
                 'original_query': user_query,
                 'search_status': status
             }
-            save_context(session_id, context)
-            print(f"[DEBUG] 단일 회의 컨텍스트 저장: meeting_id={meeting_id}")
+            save_context_async(session_id, context)
+            logger.debug("단일 회의 컨텍스트 저장: meeting_id=%s", meeting_id)
 
         return ChatResponse(
             answer=final_answer,
             history=request.history + [
-                {"role": "user", "content": user_query},
-                {"role": "assistant", "content": final_answer}
+                {"role": ROLE_USER, "content": user_query},
+                {"role": ROLE_ASSISTANT, "content": final_answer}
             ],
             source="single_meeting",
             session_id=session_id
         )
                 
     except Exception as e:
-        print(f"❌ 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("오류: %s", e)
         
         error_msg = "서버 오류가 발생했어요. 잠시 후 다시 시도해주세요. 🙏"
         
         return ChatResponse(
             answer=error_msg,
             history=request.history + [
-                {"role": "user", "content": request.message},
-                {"role": "assistant", "content": error_msg}
+                {"role": ROLE_USER, "content": request.message},
+                {"role": ROLE_ASSISTANT, "content": error_msg}
             ],
             source="error"
         )
+    finally:
+        flush_write_batch(batch_token)
     
 def is_obvious_pattern(user_query: str) -> bool:
-    obvious_patterns = [
-        user_query.strip().isdigit(),
-        bool(re.match(r'^\d{1,2}월\s?\d{1,2}일$', user_query.strip())),
-        (len(user_query) > 8 and 
-         ('회의' in user_query or '미팅' in user_query) and 
-         not any(w in user_query for w in ['?', '뭐', '어떤', '있어', '저', '그', '이']) and
-         not ('에서' in user_query and len(user_query) < 15)),  # ← "회의에서" 같은 짧은 질문 제외
-    ]
-    return any(obvious_patterns)
+    """
+    명확한 패턴인지 확인 (LLM 호출 불필요)
+    - 앞 조건이 참이면 뒤 조건은 평가하지 않음
+    """
+    query_strip = user_query.strip()
+    return (
+        # 번호 선택
+        query_strip.isdigit()
+        # 날짜 선택
+        or bool(_RE_OBVIOUS_DATE.match(query_strip))
+        # 명확한 회의명 (길고 질문/지시어 없음)
+        or (len(user_query) > 8
+            and ('회의' in user_query or '미팅' in user_query)
+            and not _RE_OBVIOUS_EXCLUDE.search(user_query)
+            and not ('에서' in user_query and len(user_query) < 15))  # ← "회의에서" 같은 짧은 질문 제외
+    )
 
 def needs_llm_analysis(user_query: str, context: dict) -> bool:
     """
@@ -29,6 +29,9 @@ DB_USER = os.getenv('DB_USER', 'root')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
 DB_NAME = os.getenv('DB_NAME', 'dialog')
 
+# 로그 레벨 (운영 INFO, 개발 중 상세 로그가 필요하면 DEBUG)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
 # ============================================================
 # Phase 2-A: Template 페르소나 설정
 # ============================================================
@@ -38,6 +41,21 @@ ENABLE_PERSONA = os.getenv('ENABLE_PERSONA', 'true').lower() == 'true'
 
 print(f"[CONFIG] Phase 2-A (Template 페르소나): {'✅ 활성화' if ENABLE_PERSONA else '❌ 비활성화'}")
 
+# ============================================================
+# 키워드 검색: MySQL FULLTEXT (ngram) 설정
+# ============================================================
+
+# LIKE '%키워드%'는 인덱스를 못 타서 풀스캔 → 아래 인덱스를 만든 뒤 true로 켜면 FULLTEXT 검색
+#   ALTER TABLE meeting ADD FULLTEXT INDEX ft_meeting_title_desc (title, description) WITH PARSER ngram;
+#   ALTER TABLE meeting_result ADD FULLTEXT INDEX ft_meeting_result_summary (summary) WITH PARSER ngram;
+ENABLE_FULLTEXT_SEARCH = os.getenv('ENABLE_FULLTEXT_SEARCH', 'false').lower() == 'true'
+
+# MySQL ngram_token_size 서버 설정과 같은 값 (이보다 짧은 키워드는 LIKE로 검색)
+FULLTEXT_NGRAM_TOKEN_SIZE = int(os.getenv('FULLTEXT_NGRAM_TOKEN_SIZE', 2))
+
+# 서버 시작 시 검색용 인덱스(복합 인덱스 + 위 FULLTEXT) 중 없는 것을 생성 (database.ensure_search_indexes)
+ENABLE_SEARCH_INDEX_SETUP = os.getenv('ENABLE_SEARCH_INDEX_SETUP', 'false').lower() == 'true'
+
 # ============================================================
 # MySQL Connector Config
 # ============================================================
@@ -2,11 +2,15 @@
 Redis 컨텍스트 관리
 """
 import redis
-import json
+import ujson  # requirements.txt에 포함된 C 구현 JSON (stdlib json보다 빠름)
 import logging
 from .config import REDIS_HOST, REDIS_PORT
-import hashlib
-import time
+import base64
+import os
+import re
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +21,22 @@ logger = logging.getLogger(__name__)
 redis_client = None
 
 def init_redis_client():
-    """Redis 클라이언트 초기화"""
+    """Redis 클라이언트 초기화 (커넥션 풀 사용)"""
     global redis_client
     
     try:
-        redis_client = redis.Redis(
+        pool = redis.ConnectionPool(
             host=REDIS_HOST,
             port=REDIS_PORT,
-            decode_responses=True
+            decode_responses=True,
+            socket_keepalive=True,
+            health_check_interval=30,  # 30초 이상 쉰 연결은 사용 전 PING (끊긴 연결 재사용 방지)
+            max_connections=32
         )
-        redis_client.ping()
-        print(f"[DEBUG] Redis 연결: {REDIS_HOST}:{REDIS_PORT}")
+        client = redis.Redis(connection_pool=pool)
+        client.ping()  # 초기화 시에만 연결 확인
+        redis_client = client
+        logger.debug("Redis 연결: %s:%s", REDIS_HOST, REDIS_PORT)
         logger.info(f"Redis 연결 성공")
         return redis_client
     except Exception as e:
@@ -36,92 +45,538 @@ def init_redis_client():
         return None
 
 def get_redis_client():
-    """Redis 클라이언트 반환"""
+    """
+    Redis 클라이언트 반환
+    - 매 호출마다 PING 하지 않음 (연결 끊김은 실제 명령에서 ConnectionError로 감지)
+    """
+    return redis_client or init_redis_client()
+
+def close_redis():
+    """종료 시 남은 백그라운드 쓰기를 마치고 커넥션 풀 정리"""
     global redis_client
     
-    if redis_client is None:
-        return init_redis_client()
+    _write_executor.shutdown(wait=True)
+    if redis_client is not None:
+        redis_client.connection_pool.disconnect()
+        redis_client = None
+        logger.info("Redis 연결 종료")
+
+def _with_reconnect(operation):
+    """
+    Redis 명령 실행, 연결 끊김이면 한 번 재시도
+    - 끊긴 연결은 풀이 버리고 새 연결을 만들므로 클라이언트(풀)는 그대로 재사용
+    """
+    client = get_redis_client()
+    if not client:
+        raise redis.ConnectionError("Redis 클라이언트 없음")
     
     try:
-        redis_client.ping()
-        return redis_client
-    except redis.ConnectionError as e:  # 더 구체적인 예외
-        logger.warning(f"Redis 연결 끊김, 재연결 시도: {e}")
-        return init_redis_client()
-    except Exception as e:
-        logger.error(f"Redis 예상치 못한 오류: {e}")
-        return init_redis_client()
+        return operation(client)
+    except redis.ConnectionError as e:
+        logger.warning(f"Redis 연결 끊김, 재시도: {e}")
+        return operation(client)
 
 # ============================================================
 # 컨텍스트 관리 함수
 # ============================================================
 
-def get_context(session_id: str) -> dict:
-    """Redis에서 컨텍스트 가져오기"""
-    client = get_redis_client()
-    if not client:
-        return {}
+# 응답 경로에서 Redis 쓰기 왕복을 빼기 위한 백그라운드 writer
+# - 워커 1개: 같은 세션의 쓰기 순서 보장
+# - 세션별 마지막 쓰기 Future를 기억해두고, 조회/삭제 전에 완료를 기다림
+_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-writer")
+_pending_writes = {}
+PENDING_WRITE_TIMEOUT = 2  # 초
+
+def _submit_write(fn, *args):
+    """
+    writer 스레드에 쓰기 제출
+    - close_redis로 writer가 종료된 뒤의 호출은 현재 스레드에서 바로 실행 (완료된 Future 반환)
+    """
+    try:
+        return _write_executor.submit(fn, *args)
+    except RuntimeError:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+# 요청 단위 쓰기 배치: {session_id: (context_json, ttl, meta)}
+# - context_json이 None이면 삭제, _UNCHANGED면 본문은 그대로 두고 meta만 갱신
+# - 한 요청에서 여러 번 저장/삭제해도 응답 시점에 파이프라인 한 번으로 전송
+_write_batch = ContextVar('context_write_batch', default=None)
+_UNCHANGED = object()
+_EXTRA_KEYS = object()  # 배치 안에서 세션 컨텍스트 외의 키 {key: (value, ttl)}를 모아두는 자리
+
+# 자주 바뀌는 커서 필드(last_shown_index, state, shown_count 등)는 별도 hash에 저장
+# - "더 보여줘"마다 회의 목록 전체(수십 KB)를 다시 직렬화하지 않도록
+# - 본문 전체 저장 시에는 meta hash를 지움 (본문에 최신 값이 들어 있음)
+def _meta_key(session_id: str) -> str:
+    return f"context:{session_id}:meta"
+
+def _apply_meta(context: dict, meta: dict) -> dict:
+    """meta hash 값(JSON 문자열)을 컨텍스트에 덮어쓰기"""
+    for field, value in (meta or {}).items():
+        context[field] = ujson.loads(value)
+    return context
+
+def _track_pending(session_id: str, future):
+    """세션별 마지막 백그라운드 쓰기 Future 기록 (완료되면 자동 제거)"""
+    _pending_writes[session_id] = future
     
+    def _clear(done, session_id=session_id):
+        if _pending_writes.get(session_id) is done:
+            _pending_writes.pop(session_id, None)
+    future.add_done_callback(_clear)
+
+def _wait_pending_write(session_id: str):
+    """해당 세션의 백그라운드 저장이 남아 있으면 완료될 때까지 대기"""
+    future = _pending_writes.get(session_id)
+    if future is None:
+        return
     try:
-        context_json = client.get(f"context:{session_id}")
-        if context_json:
-            return json.loads(context_json)
+        future.result(timeout=PENDING_WRITE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"이전 컨텍스트 저장 대기 실패: {e}")
+
+def _preformat_meeting_dates(context: dict) -> dict:
+    """
+    컨텍스트 로드 시 회의 날짜를 한 번만 파싱해서 표시용 문자열로 저장
+    - 렌더링 루프에서는 meeting['scheduled_at_display']만 읽으면 됨
+    """
+    for key in ('meetings', 'meeting_list'):
+        for meeting in context.get(key) or []:
+            if not isinstance(meeting, dict) or 'scheduled_at_display' in meeting:
+                continue
+            scheduled_at = meeting.get('scheduled_at')
+            if not scheduled_at:
+                meeting['scheduled_at_display'] = ''
+                continue
+            try:
+                if isinstance(scheduled_at, str):
+                    scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
+                meeting['scheduled_at_display'] = scheduled_at.strftime('(%Y년 %m월 %d일)')
+            except (ValueError, AttributeError):
+                meeting['scheduled_at_display'] = ''
+    return context
+
+def _build_context(context_json, meta: dict, entry=None) -> dict:
+    """Redis에서 읽은 본문/meta + 같은 요청에서 아직 전송 안 된 쓰기(entry) → 컨텍스트 dict"""
+    if entry is not None and entry[0] is not _UNCHANGED:
+        # 같은 요청에서 저장/삭제한 값이 있으면 그 값을 사용
+        context_json, _, meta = entry
+        if context_json is None:
+            return {}
+        return _preformat_meeting_dates(_apply_meta(ujson.loads(context_json), meta))
+    
+    if not context_json:
         return {}
+    context = _apply_meta(ujson.loads(context_json), meta)
+    if entry is not None:
+        _apply_meta(context, entry[2])  # 아직 전송 안 된 meta 갱신
+    return _preformat_meeting_dates(context)
+
+def _queue_context_read(pipe, session_id: str):
+    """컨텍스트 본문 + meta hash 조회 명령을 파이프라인에 추가 (결과 2개)"""
+    pipe.get(f"context:{session_id}")
+    pipe.hgetall(_meta_key(session_id))
+
+def get_contexts(session_ids: list) -> dict:
+    """
+    여러 세션의 컨텍스트를 파이프라인 한 번으로 조회
+    - 반환: {session_id: context} (컨텍스트가 있는 세션만)
+    """
+    batch = _write_batch.get() or {}
+    contexts = {}
+    to_read = []
+    for session_id in session_ids:
+        entry = batch.get(session_id)
+        if entry is not None and entry[0] is not _UNCHANGED:
+            # 같은 요청에서 저장/삭제한 값은 Redis 조회 불필요
+            context = _build_context(None, None, entry)
+            if context:
+                contexts[session_id] = context
+        else:
+            _wait_pending_write(session_id)
+            to_read.append(session_id)
+    
+    if not to_read:
+        return contexts
+    
+    def read(client):
+        pipe = client.pipeline(transaction=False)
+        for session_id in to_read:
+            _queue_context_read(pipe, session_id)
+        return pipe.execute()
+    
+    try:
+        raw = _with_reconnect(read)
     except Exception as e:
         logger.error(f"컨텍스트 조회 실패: {e}")
-        return {}
+        return contexts
+    
+    # 세션당 결과 2개 (본문, meta)
+    for i, session_id in enumerate(to_read):
+        context = _build_context(raw[2 * i], raw[2 * i + 1], batch.get(session_id))
+        if context:
+            contexts[session_id] = context
+    return contexts
 
-def save_context(session_id: str, context: dict, ttl: int = 600):
-    """Redis에 컨텍스트 저장 (기본 TTL: 10분)"""
-    client = get_redis_client()
-    if not client:
-        return False
+def get_context(session_id: str) -> dict:
+    """Redis에서 컨텍스트 가져오기"""
+    return get_contexts([session_id]).get(session_id, {})
+
+def touch_context(session_id: str, ttl: int = 600):
+    """
+    컨텍스트 내용은 그대로 두고 TTL만 연장 (본문 재직렬화/SETEX 없이 EXPIRE만)
+    - 이미 로드한 컨텍스트를 "유지"만 하려고 save_context 하던 곳에서 사용
+    """
+    batch = _write_batch.get()
+    if batch is not None:
+        context_json, _, pending_meta = batch.get(session_id, (_UNCHANGED, ttl, None))
+        if context_json is None:
+            return None  # 같은 요청에서 이미 삭제됨
+        batch[session_id] = (context_json, ttl, pending_meta)
+        return None
+    
+    future = _submit_write(_write_context, session_id, _UNCHANGED, ttl)
+    _track_pending(session_id, future)
+    return future
+
+# ============================================================
+# 요청 시작 시 상태 조회 (컨텍스트 + 사용자 정보)
+# ============================================================
+
+USER_META_TTL = 600  # 사용자 정보 캐시 (직무/직급 변경이 늦어도 10분 내 반영)
+
+def _user_meta_key(user_name: str) -> str:
+    return f"user_meta:{user_name}"
+
+def load_request_state(session_id: str, user_name: str) -> tuple:
+    """
+    요청 시작 시 필요한 Redis 조회를 파이프라인 한 번으로 처리
+    
+    Returns:
+        (context, user_meta)
+        - context: get_context와 동일
+        - user_meta: 캐시된 사용자 정보 {'id', 'job', 'position'}, 없으면 None
+    """
+    batch = _write_batch.get()
+    entry = batch.get(session_id) if batch else None
+    _wait_pending_write(session_id)
+    
+    def read(client):
+        pipe = client.pipeline(transaction=False)
+        _queue_context_read(pipe, session_id)
+        pipe.get(_user_meta_key(user_name))
+        return pipe.execute()
     
     try:
-        # datetime과 bytes를 JSON 직렬화 가능하게 변환
-        def convert_to_json_serializable(obj):
-            """JSON 직렬화 가능한 형태로 변환"""
-            from datetime import datetime
-            
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, bytes):
-                return obj.decode('utf-8', errors='ignore')
-            elif isinstance(obj, dict):
-                return {k: convert_to_json_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_json_serializable(item) for item in obj]
-            else:
-                return obj
-        
-        # 컨텍스트 전체를 변환
-        serializable_context = convert_to_json_serializable(context)
-        
-        context_json = json.dumps(serializable_context, ensure_ascii=False)
-        client.setex(f"context:{session_id}", ttl, context_json)
+        context_json, meta, user_meta_json = _with_reconnect(read)
+    except Exception as e:
+        logger.error(f"요청 상태 조회 실패: {e}")
+        return _build_context(None, None, entry), None
+    
+    user_meta = ujson.loads(user_meta_json) if user_meta_json else None
+    return _build_context(context_json, meta, entry), user_meta
+
+def save_user_meta(user_name: str, user_meta: dict):
+    """사용자 정보 캐시 저장 (요청 배치가 있으면 컨텍스트와 같은 파이프라인으로 전송)"""
+    return _save_entries({}, {_user_meta_key(user_name): user_meta}, USER_META_TTL)
+
+def _dump_context(context: dict) -> str:
+    """컨텍스트 → JSON 문자열 (datetime, bytes 변환 포함)"""
+    # 대부분의 컨텍스트는 이미 직렬화 가능 (회의 목록은 normalize_meeting에서 isoformat 변환됨)
+    # → 파이썬 재귀 변환 없이 C 인코더로 바로 직렬화하고, 실패할 때만 변환 후 재시도
+    try:
+        return ujson.dumps(context, ensure_ascii=False, escape_forward_slashes=False)
+    except (TypeError, OverflowError, UnicodeError):
+        pass
+    
+    # datetime과 bytes를 JSON 직렬화 가능하게 변환
+    def convert_to_json_serializable(obj):
+        """JSON 직렬화 가능한 형태로 변환"""
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        elif isinstance(obj, bytes):
+            return obj.decode('utf-8', errors='ignore')
+        elif isinstance(obj, dict):
+            return {k: convert_to_json_serializable(v) for k, v in obj.items()}
+        elif isinstance(obj, list):
+            return [convert_to_json_serializable(item) for item in obj]
+        else:
+            return obj
+    
+    # 컨텍스트 전체를 변환
+    serializable_context = convert_to_json_serializable(context)
+    
+    return ujson.dumps(serializable_context, ensure_ascii=False, escape_forward_slashes=False)
+
+def _queue_write(pipe, session_id: str, context_json, ttl: int, meta: dict = None):
+    """컨텍스트 본문/meta 쓰기 명령을 파이프라인에 추가"""
+    key = f"context:{session_id}"
+    meta_key = _meta_key(session_id)
+    
+    if context_json is None:
+        pipe.delete(key, meta_key)
+        return
+    
+    if context_json is _UNCHANGED:
+        pipe.expire(key, ttl)  # 본문은 그대로, TTL만 연장
+        if not meta:
+            pipe.expire(meta_key, ttl)
+    else:
+        pipe.setex(key, ttl, context_json)
+        pipe.delete(meta_key)
+    
+    if meta:
+        pipe.hset(meta_key, mapping=meta)
+        pipe.expire(meta_key, ttl)
+
+def _write_context(session_id: str, context_json, ttl: int, meta: dict = None) -> bool:
+    """직렬화된 컨텍스트를 Redis에 기록"""
+    def run(client):
+        pipe = client.pipeline(transaction=False)
+        _queue_write(pipe, session_id, context_json, ttl, meta)
+        return pipe.execute()
+    
+    try:
+        _with_reconnect(run)
         logger.info(f"컨텍스트 저장 성공: {session_id}")
         return True
     except Exception as e:
-        logger.error(f"컨텍스트 저장 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("컨텍스트 저장 실패: %s", e)
+        return False
+
+def _execute_batch(batch: dict) -> bool:
+    """모아둔 쓰기/삭제를 파이프라인 한 번으로 전송"""
+    def run(client):
+        pipe = client.pipeline(transaction=False)
+        for session_id, entry in batch.items():
+            if session_id is _EXTRA_KEYS:
+                for key, (value, ttl) in entry.items():
+                    pipe.setex(key, ttl, value)  # SET + EXPIRE 따로 보내지 않음
+            else:
+                context_json, ttl, meta = entry
+                _queue_write(pipe, session_id, context_json, ttl, meta)
+        return pipe.execute()
+    
+    try:
+        _with_reconnect(run)
+        logger.info(f"컨텍스트 일괄 저장 성공: {len(batch)}건")
+        return True
+    except Exception as e:
+        logger.error(f"컨텍스트 일괄 저장 실패: {e}")
+        return False
+
+def begin_write_batch():
+    """현재 요청의 컨텍스트 쓰기를 모으기 시작 (반환된 토큰은 flush_write_batch에 전달)"""
+    return _write_batch.set({})
+
+def flush_write_batch(token=None):
+    """
+    모아둔 쓰기를 한 번에 전송 (응답 직전 finally에서 호출)
+    - 전송은 백그라운드 writer에서 처리하고 Future 반환
+    """
+    batch = _write_batch.get()
+    if token is not None:
+        _write_batch.reset(token)
+    else:
+        _write_batch.set(None)
+    
+    if not batch:
+        return None
+    
+    future = _submit_write(_execute_batch, batch)
+    for session_id in batch:
+        if session_id is not _EXTRA_KEYS:
+            _track_pending(session_id, future)
+    return future
+
+def save_context(session_id: str, context: dict, ttl: int = 600):
+    """Redis에 컨텍스트 저장 (기본 TTL: 10분)"""
+    try:
+        context_json = _dump_context(context)
+    except Exception as e:
+        logger.exception("컨텍스트 저장 실패: %s", e)
         return False
+    
+    batch = _write_batch.get()
+    if batch is not None:
+        batch[session_id] = (context_json, ttl, None)
+        return True
+    
+    _wait_pending_write(session_id)
+    return _write_context(session_id, context_json, ttl)
+
+def save_contexts(contexts: dict, ttl: int = 600):
+    """
+    여러 세션의 컨텍스트를 파이프라인 한 번으로 저장 (백그라운드)
+    - contexts: {session_id: context}
+    - 직렬화는 호출 시점에 바로 수행 (이후 dict가 바뀌어도 영향 없음)
+    - Redis 쓰기만 writer 스레드에서 처리하고 Future 반환
+    """
+    return _save_entries(contexts, None, ttl)
+
+def _save_entries(contexts: dict, extra: dict, ttl: int):
+    """컨텍스트/추가 키 직렬화 후 요청 배치에 넣거나 writer 스레드에서 파이프라인 한 번으로 전송"""
+    entries = {}
+    for session_id, context in contexts.items():
+        try:
+            entries[session_id] = (_dump_context(context), ttl, None)
+        except Exception as e:
+            logger.exception("컨텍스트 저장 실패: %s", e)
+    
+    if extra:
+        entries[_EXTRA_KEYS] = {
+            key: (value if isinstance(value, str) else ujson.dumps(value, ensure_ascii=False), ttl)
+            for key, value in extra.items()
+        }
+    
+    if not entries:
+        return None
+    
+    batch = _write_batch.get()
+    if batch is not None:
+        # 요청 종료 시 flush_write_batch에서 전송
+        extra_entries = entries.pop(_EXTRA_KEYS, None)
+        batch.update(entries)
+        if extra_entries:
+            batch.setdefault(_EXTRA_KEYS, {}).update(extra_entries)
+        return None
+    
+    future = _submit_write(_execute_batch, entries)
+    for session_id in entries:
+        if session_id is not _EXTRA_KEYS:
+            _track_pending(session_id, future)
+    return future
+
+def save_context_async(session_id: str, context: dict, ttl: int = 600):
+    """Redis에 컨텍스트 저장 (백그라운드, Future 반환)"""
+    return save_contexts({session_id: context}, ttl)
+
+def update_context_fields(session_id: str, ttl: int = 600, **fields):
+    """
+    컨텍스트의 일부 필드만 갱신 (meta hash에 HSET)
+    - 회의 목록은 다시 직렬화하지 않음
+    - 예: update_context_fields(session_id, last_shown_index=10)
+    """
+    meta = {field: ujson.dumps(value, ensure_ascii=False) for field, value in fields.items()}
+    
+    batch = _write_batch.get()
+    if batch is not None:
+        context_json, _, pending_meta = batch.get(session_id, (_UNCHANGED, ttl, None))
+        if context_json is None:
+            return None  # 같은 요청에서 이미 삭제됨
+        batch[session_id] = (context_json, ttl, {**(pending_meta or {}), **meta})
+        return None
+    
+    future = _submit_write(_write_context, session_id, _UNCHANGED, ttl, meta)
+    _track_pending(session_id, future)
+    return future
 
 def delete_context(session_id: str):
     """Redis에서 컨텍스트 삭제"""
-    client = get_redis_client()
-    if not client:
-        return False
+    batch = _write_batch.get()
+    if batch is not None:
+        batch[session_id] = (None, 0, None)
+        return True
+    
+    _wait_pending_write(session_id)
     
     try:
-        client.delete(f"context:{session_id}")
+        _with_reconnect(lambda client: client.delete(f"context:{session_id}", _meta_key(session_id)))
         logger.info(f"컨텍스트 삭제 성공: {session_id}")
         return True
     except Exception as e:
         logger.error(f"컨텍스트 삭제 실패: {e}")
         return False
+
+# ============================================================
+# 공유 캐시 (프로세스/재시작 간 유지되는 결과 캐시)
+# ============================================================
+
+def get_shared_cache(key: str):
+    """공유 캐시 조회 (없거나 Redis 오류면 None)"""
+    try:
+        value = _with_reconnect(lambda client: client.get(key))
+    except Exception as e:
+        logger.warning(f"공유 캐시 조회 실패: {e}")
+        return None
+    return ujson.loads(value) if value else None
+
+def save_shared_cache(key: str, value, ttl: int) -> bool:
+    """공유 캐시 저장 (실패해도 호출자 흐름에는 영향 없음)"""
+    try:
+        _with_reconnect(lambda client: client.setex(key, ttl, ujson.dumps(value, ensure_ascii=False)))
+        return True
+    except Exception as e:
+        logger.warning(f"공유 캐시 저장 실패: {e}")
+        return False
+
+# ============================================================
+# 컨텍스트 저장용 직렬화
+# ============================================================
+
+# 회의 제목/설명 토큰 (한글 2글자 이상, 영문/숫자)
+_RE_KOR_TOKENS = re.compile(r'[가-힣]{2,}')
+_RE_EN_TOKENS = re.compile(r'[A-Za-z0-9]+')
+
+# 회의 테이블의 datetime 컬럼 (이 컬럼들만 검사)
+_DATETIME_FIELDS = ('scheduled_at', 'created_at', 'updated_at', 'ended_at')
+
+def meeting_title_lc(meeting: dict) -> str:
+    """소문자 제목 (컨텍스트에 캐시된 값 우선)"""
+    title_lc = meeting.get('_title_lc')
+    return title_lc if title_lc is not None else (meeting.get('title') or '').lower()
+
+def meeting_desc_lc(meeting: dict) -> str:
+    """소문자 설명 (컨텍스트에 캐시된 값 우선)"""
+    desc_lc = meeting.get('_desc_lc')
+    return desc_lc if desc_lc is not None else (meeting.get('description') or '').lower()
+
+def meeting_tokens(meeting: dict) -> list:
+    """제목+설명 소문자 토큰 (컨텍스트 매칭용)"""
+    text = f"{meeting_title_lc(meeting)} {meeting_desc_lc(meeting)}"
+    return _RE_KOR_TOKENS.findall(text) + _RE_EN_TOKENS.findall(text)
+
+def normalize_meeting(meeting: dict) -> dict:
+    """회의 dict 얕은 복사 + datetime 컬럼 → isoformat, 표시용 날짜 문자열/토큰 미리 생성"""
+    out = dict(meeting)
+    for k in _DATETIME_FIELDS:
+        v = out.get(k)
+        if isinstance(v, datetime):
+            out[k] = v.isoformat()
+            out[k + '_display'] = v.strftime('(%Y년 %m월 %d일)')
+    # 매 턴 반복되는 소문자 변환/토큰화는 컨텍스트 저장 시 한 번만
+    out['_title_lc'] = meeting_title_lc(out)
+    out['_desc_lc'] = meeting_desc_lc(out)
+    if '_tokens' not in out:
+        out['_tokens'] = meeting_tokens(out)  # Redis JSON 저장을 위해 list로 보관
+    return out
+
+def build_and_save_meeting_context(session_id: str, meetings: list, state: str = 'awaiting_selection',
+                                   base: dict = None, list_keys: tuple = ('meetings',), **extras) -> dict:
+    """
+    회의 목록 컨텍스트 생성 + 저장 (직렬화는 이 함수 한 곳에서만)
+    - meetings: DB 조회 결과 (datetime 포함 가능), 저장할 만큼만 잘라서 전달
+    - base: 기존 컨텍스트를 이어서 쓸 때 전달 (나머지 필드 유지)
+    - list_keys: 직렬화된 회의 목록을 저장할 키 (예: ('meeting_list', 'meetings'))
+    - extras: 추가 필드 (shown_completed, total_count, original_query 등)
+    """
+    meetings_serializable = [normalize_meeting(meeting) for meeting in meetings]
     
+    context = dict(base) if base else {}
+    context['state'] = state
+    context.update(extras)
+    for key in list_keys:
+        context[key] = meetings_serializable
+    
+    save_context_async(session_id, context)
+    return context
+
 def generate_session_id(user_id: str = "default") -> str:
     """세션 ID 생성"""
-    timestamp = str(time.time())
-    return hashlib.md5(f"{user_id}_{timestamp}".encode()).hexdigest()[:16]
\ No newline at end of file
+    # 해시 없이 난수 12바이트 → URL-safe 16자 (user_id는 호환용 인자)
+    return base64.urlsafe_b64encode(os.urandom(12)).decode().rstrip('=')
\ No newline at end of file
@@ -3,48 +3,99 @@ MySQL 데이터베이스 연결 관리
 """
 import pymysql
 import logging
-from .config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME
+import queue
+import threading
+from .config import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME, ENABLE_SEARCH_INDEX_SETUP, ENABLE_FULLTEXT_SEARCH
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 # ============================================================
-# MySQL 직접 연결 (Connection Pool 없이)
+# MySQL 연결 풀 (요청마다 TCP 연결/인증을 새로 하지 않도록 재사용)
 # ============================================================
 
+DB_POOL_SIZE = 20  # 동시에 사용 중인 연결 최대 개수 = 유휴 연결 최대 보관 개수
+DB_ACQUIRE_TIMEOUT = 10  # 초, 연결이 모두 사용 중일 때 반납을 기다리는 최대 시간
+
+# LIFO: 최근에 쓴 연결부터 재사용 → 오래 쉰 연결은 자연스럽게 뒤로 밀림
+_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+# 큐는 유휴 연결만 담으므로, 사용 중인 연결 수는 세마포어로 제한 (몰릴 때 MySQL max_connections 초과 방지)
+_connection_slots = threading.BoundedSemaphore(DB_POOL_SIZE)
+
+def _create_connection():
+    """새 MySQL 연결 생성"""
+    return pymysql.connect(
+        host=DB_HOST,
+        port=DB_PORT,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        database=DB_NAME,
+        charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=True
+    )
+
+def _acquire_connection():
+    """풀에서 연결 꺼내기 (비어 있으면 새로 생성, 끊긴 연결은 재연결)"""
+    try:
+        connection = _pool.get_nowait()
+    except queue.Empty:
+        return _create_connection()
+    
+    try:
+        connection.ping(reconnect=True)
+        return connection
+    except pymysql.MySQLError as e:
+        logger.warning(f"풀 연결 재사용 실패, 새 연결 생성: {e}")
+        try:
+            connection.close()
+        except Exception:
+            pass
+        return _create_connection()
+
+def _release_connection(connection):
+    """연결을 풀에 반납 (끊긴 연결은 버리고, 풀이 가득 차면 닫음)"""
+    if not connection.open:
+        return
+    try:
+        _pool.put_nowait(connection)
+    except queue.Full:
+        connection.close()
+
 @contextmanager
 def get_db_connection():
-    """Context Manager로 자동 연결 해제"""
+    """
+    Context Manager로 풀에서 연결 획득/반납
+    - 동시 사용 연결이 DB_POOL_SIZE개면 반납을 기다림 (시간 초과 시 연결 실패와 같이 None)
+    """
+    if not _connection_slots.acquire(timeout=DB_ACQUIRE_TIMEOUT):
+        logger.error(f"❌ DB 연결 대기 시간 초과 (사용 중인 연결 {DB_POOL_SIZE}개)")
+        yield None
+        return
+    
     connection = None
     try:
-        # 매번 새로운 연결 생성
-        connection = pymysql.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME,
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor,
-            autocommit=True
-        )
-        logger.debug("✅ DB 연결 획득")
-        yield connection
-        
-    except pymysql.MySQLError as e:
-        logger.error(f"❌ MySQL 연결 실패: {e}")
-        print(f"❌ MySQL 연결 실패: {e}")
-        yield None
+        try:
+            connection = _acquire_connection()
+            logger.debug("✅ DB 연결 획득")
+            
+        except pymysql.MySQLError as e:
+            logger.error(f"❌ MySQL 연결 실패: {e}")
+            print(f"❌ MySQL 연결 실패: {e}")
 
-    except Exception as e:
-        logger.error(f"❌ DB 연결 예상치 못한 오류: {e}")
-        print(f"❌ DB 연결 예상치 못한 오류: {e}")
-        yield None
+        except Exception as e:
+            logger.error(f"❌ DB 연결 예상치 못한 오류: {e}")
+            print(f"❌ DB 연결 예상치 못한 오류: {e}")
         
+        # with 블록 안에서 난 쿼리 에러는 호출자에게 그대로 전달 (끊긴 연결은 다음 획득 시 ping으로 재연결)
+        try:
+            yield connection
+        finally:
+            if connection:
+                _release_connection(connection)
+                logger.debug("✅ DB 연결 반납")
     finally:
-        if connection:
-            connection.close()
-            logger.debug("✅ DB 연결 해제")
+        _connection_slots.release()
 
 def init_db_connection():
     """실제 DB 연결 생성 (컨텍스트 저장용)"""
@@ -64,6 +115,64 @@ def init_db_connection():
         print(f"[ERROR] DB 연결 실패: {e}")
         return None
 
+# ============================================================
+# 검색용 인덱스 (회의 검색 SQL의 WHERE/ORDER BY에 맞춤)
+# ============================================================
+
+# (테이블, 인덱스 이름, 인덱스 정의)
+SEARCH_INDEXES = [
+    # p.name = ? 로 참석 회의를 찾고 meeting_id로 조인
+    ('participant', 'idx_participant_name_meeting', 'INDEX idx_participant_name_meeting (name, meeting_id)'),
+    # 상태 + 기간 필터 후 scheduled_at DESC 정렬 (filesort 없이 역방향 인덱스 스캔)
+    ('meeting', 'idx_meeting_user_status_time', 'INDEX idx_meeting_user_status_time (host_user_id, status, scheduled_at)'),
+    ('meeting', 'idx_meeting_status_time', 'INDEX idx_meeting_status_time (status, scheduled_at)'),
+    # 상태 필터 없는 기간 검색 (오늘 회의, 날짜만 있는 질문)
+    ('meeting', 'idx_meeting_time', 'INDEX idx_meeting_time (scheduled_at)'),
+]
+
+# ENABLE_FULLTEXT_SEARCH용 ngram FULLTEXT 인덱스 (search._keyword_condition)
+FULLTEXT_INDEXES = [
+    ('meeting', 'ft_meeting_title_desc', 'FULLTEXT INDEX ft_meeting_title_desc (title, description) WITH PARSER ngram'),
+    ('meeting_result', 'ft_meeting_result_summary', 'FULLTEXT INDEX ft_meeting_result_summary (summary) WITH PARSER ngram'),
+]
+
+def ensure_search_indexes():
+    """
+    검색용 인덱스 중 없는 것만 생성 (ENABLE_SEARCH_INDEX_SETUP일 때만, 서버 시작 시 한 번)
+    - 운영 DB에 DDL을 실행하므로 기본은 꺼져 있음
+    - 실패해도 검색은 인덱스 없이 동작하므로 경고만 남김
+    """
+    if not ENABLE_SEARCH_INDEX_SETUP:
+        return
+    
+    indexes = SEARCH_INDEXES + (FULLTEXT_INDEXES if ENABLE_FULLTEXT_SEARCH else [])
+    
+    with get_db_connection() as conn:
+        if not conn:
+            return
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT DISTINCT table_name AS table_name, index_name AS index_name "
+                "FROM information_schema.statistics WHERE table_schema = %s",
+                (DB_NAME,)
+            )
+            existing = {(row['table_name'], row['index_name']) for row in cursor.fetchall()}
+        except pymysql.MySQLError as e:
+            logger.warning(f"검색 인덱스 조회 실패: {e}")
+            cursor.close()
+            return
+        
+        for table, name, definition in indexes:
+            if (table, name) in existing:
+                continue
+            try:
+                cursor.execute(f"ALTER TABLE {table} ADD {definition}")
+                logger.info(f"검색 인덱스 생성: {table}.{name}")
+            except pymysql.MySQLError as e:
+                logger.warning(f"검색 인덱스 생성 실패 ({table}.{name}): {e}")
+        cursor.close()
+
 def test_db_connection() -> bool:
     """데이터베이스 연결 테스트"""
     try:
@@ -85,4 +194,4 @@ def test_db_connection() -> bool:
                 
     except Exception as e:
         print(f"[❌] 데이터베이스 연결 테스트 실패: {e}")
-        return False
\ No newline at end of file
+        return False
@@ -5,7 +5,11 @@
 - Phase 2-A: 직업별 페르소나 템플릿
 """
 from datetime import datetime
+from functools import lru_cache
 import re
+import logging
+
+logger = logging.getLogger(__name__)
 
 def format_importance(level: str, reason: str = None) -> str:
     """중요도 포맷팅"""
@@ -31,13 +35,58 @@ def format_date(dt) -> str:
         dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
     return dt.strftime('%Y년 %m월 %d일') if dt else '날짜 정보 없음'
 
+def first_two_sentences(text: str) -> str:
+    """
+    앞의 두 문장만 추출 ('. '.join(text.split('.')[:2])와 같은 결과)
+    - 전체 문장 리스트를 만들지 않고 마침표 위치 두 개만 찾아서 자름
+    """
+    p1 = text.find('.')
+    if p1 == -1:
+        return text.strip()
+    p2 = text.find('.', p1 + 1)
+    first = text[:p1].strip()
+    second = text[p1 + 1:p2 if p2 != -1 else len(text)].strip()
+    if first and second:
+        return f"{first}. {second}"
+    return first or second
+
+@lru_cache(maxsize=1024)
+def _scheduled_at_info(scheduled_at) -> tuple:
+    """
+    scheduled_at(str/datetime) → (datetime 또는 None, '2025년 01월 05일', '01월 05일')
+    - 날짜 없으면 '', 파싱 안 되는 값은 앞 10자(YYYY-MM-DD)만 표시
+    """
+    parsed = scheduled_at
+    if isinstance(parsed, str) and parsed:
+        try:
+            parsed = datetime.fromisoformat(parsed.replace('Z', '+00:00'))
+        except ValueError:
+            pass
+    
+    if isinstance(parsed, datetime):
+        return parsed, parsed.strftime('%Y년 %m월 %d일'), parsed.strftime('%m월 %d일')
+    date_str = str(scheduled_at)[:10] if scheduled_at else ''
+    return None, date_str, date_str
+
+def _meeting_dates(meeting: dict) -> tuple:
+    """
+    회의 날짜 (datetime 또는 None, 전체 날짜 문자열, 짧은 날짜 문자열)
+    - 회의 dict는 수정하지 않음 (컨텍스트에 그대로 저장되므로)
+    - 같은 값은 캐시 → 여러 포맷터를 거쳐도 파싱은 한 번
+    """
+    scheduled_at = meeting.get('scheduled_at')
+    try:
+        return _scheduled_at_info(scheduled_at)
+    except TypeError:  # 해시할 수 없는 값
+        return _scheduled_at_info.__wrapped__(scheduled_at)
+
+def _fmt_scheduled_at(meeting: dict) -> str:
+    """직군별/기본 템플릿용 날짜 문자열 ('2025년 01월 05일', 없으면 '날짜 없음')"""
+    return _meeting_dates(meeting)[1] or '날짜 없음'
+
 def format_single_meeting(meeting: dict) -> str:
     """단일 회의 기본 템플릿"""
-    scheduled_at = meeting.get('scheduled_at')
-    if isinstance(scheduled_at, str):
-        scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-    
-    date_str = scheduled_at.strftime('%Y년 %m월 %d일') if scheduled_at else '날짜 정보 없음'
+    date_str = _meeting_dates(meeting)[1] or '날짜 정보 없음'
     
     # 추가 정보 추출
     participants = meeting.get('participants', [])
@@ -64,22 +113,23 @@ def format_single_meeting(meeting: dict) -> str:
 
 def format_multiple_meetings_short(results: list, user_query: str, total: int = None, date_info: dict = None, status: str = None) -> str:
     """여러 회의를 상태별로 분리하여 간단히 포맷팅 (완료 3개 + 예정 3개)"""
-    from datetime import datetime
-    
-    # ========== 상태별 분리 ==========
-    completed = [m for m in results if m.get('status') == 'COMPLETED']
-    scheduled = [m for m in results if m.get('status') == 'SCHEDULED']
+    # ========== 상태별 분리 (한 번 순회) ==========
+    completed, scheduled = [], []
+    for m in results:
+        status_value = m.get('status')
+        if status_value == 'COMPLETED':
+            completed.append(m)
+        elif status_value == 'SCHEDULED':
+            scheduled.append(m)
     
-    print(f"[DEBUG] 상태별 분리: 완료 {len(completed)}개, 예정 {len(scheduled)}개")
+    logger.debug("상태별 분리: 완료 %s개, 예정 %s개", len(completed), len(scheduled))
     
     # 조건 텍스트 생성
     condition_text = ""
     if date_info and date_info.get('original'):
         condition_text = f"{date_info['original']} "
     
-    response = f"네, {condition_text}회의로는 다음과 같은 것들이 있어요! 📋\n\n"
-    
-    idx = 1  # 연속 번호 시작
+    parts = [f"네, {condition_text}회의로는 다음과 같은 것들이 있어요! 📋\n\n"]
     
     # ========== 완료와 예정 개수 결정 ==========
     if len(completed) > 0 and len(scheduled) > 0:
@@ -94,15 +144,17 @@ def format_multiple_meetings_short(results: list, user_query: str, total: int =
         # 예정만 있으면: 예정 5개
         completed_limit = 0
         scheduled_limit = 5
+    
+    # 나머지 개수는 한 번만 계산
+    remaining_completed = len(completed) - completed_limit
+    remaining_scheduled = len(scheduled) - scheduled_limit
 
     # ========== 완료된 회의 ==========
     if completed:
-        response += "✅ 완료된 회의:\n\n"
+        parts.append("✅ 완료된 회의:\n\n")
         for i, meeting in enumerate(completed[:completed_limit], 1):
-            scheduled_at = meeting.get('scheduled_at')
-            if isinstance(scheduled_at, str):
-                scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-            date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+            date_full = _meeting_dates(meeting)[1]
+            date_str = f"({date_full})" if date_full else ''
             
             title = meeting.get('title', '제목 없음')
             
@@ -110,28 +162,25 @@ def format_multiple_meetings_short(results: list, user_query: str, total: int =
             if not summary.strip():
                 summary = meeting.get('description') or '내용 없음'
                 
-            lines = summary.split('.')[:2]
-            display_text = '. '.join([line.strip() for line in lines if line.strip()])
+            display_text = first_two_sentences(summary)
             
-            response += f"📌{i}. {title} {date_str}\n"
-            response += f"   - {display_text}\n\n"
+            parts.append(f"📌{i}. {title} {date_str}\n")
+            parts.append(f"   - {display_text}\n\n")
         
         # 완료된 회의 나머지 개수
-        remaining_completed = len(completed) - completed_limit
         if remaining_completed > 0:
-            response += f"💡 완료된 회의가 {remaining_completed}개 더 있어요!\n\n"
+            parts.append(f"💡 완료된 회의가 {remaining_completed}개 더 있어요!\n\n")
 
     # ========== 예정된 회의 ==========
     if scheduled:
-        response += "📅 예정된 회의:\n\n"
+        parts.append("📅 예정된 회의:\n\n")
         for i, meeting in enumerate(scheduled[:scheduled_limit], 1):
-            scheduled_at = meeting.get('scheduled_at')
-            if isinstance(scheduled_at, str):
-                scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-            date_str = scheduled_at.strftime('(%Y년 %m월 %d일)') if scheduled_at else ''
+            date_full = _meeting_dates(meeting)[1]
+            date_str = f"({date_full})" if date_full else ''
             
             # 날짜 지남 체크
             is_past = False
+            scheduled_at = _meeting_dates(meeting)[0]
             if scheduled_at and scheduled_at.date() < datetime.now().date():
                 is_past = True
                 date_str = date_str.replace(')', ' - 일정 지남)')
@@ -142,30 +191,25 @@ def format_multiple_meetings_short(results: list, user_query: str, total: int =
             if not summary.strip():
                 summary = meeting.get('description') or '내용 없음'
 
-            lines = summary.split('.')[:2]
-            display_text = '. '.join([line.strip() for line in lines if line.strip()])
+            display_text = first_two_sentences(summary)
             
             emoji = '⚠️' if is_past else '📌'
-            response += f"{emoji}{i}. {title} {date_str}\n"
-            response += f"   - {display_text}\n\n"
+            parts.append(f"{emoji}{i}. {title} {date_str}\n")
+            parts.append(f"   - {display_text}\n\n")
         
         # 예정된 회의 나머지 개수
-        remaining_scheduled = len(scheduled) - scheduled_limit
         if remaining_scheduled > 0:
-            response += f"💡 예정된 회의가 {remaining_scheduled}개 더 있어요!\n\n"
+            parts.append(f"💡 예정된 회의가 {remaining_scheduled}개 더 있어요!\n\n")
             
     # ========== 마지막 안내 ==========
     # 나머지가 실제로 있을 때만 "나머지 보여줘" 멘트 표시
-    remaining_completed = len(completed) - completed_limit
-    remaining_scheduled = len(scheduled) - scheduled_limit
-
     if remaining_completed > 0 or remaining_scheduled > 0:
-        response += "💬 \"나머지 보여줘\" 라고 하시면 계속 볼 수 있어요!\n\n"
+        parts.append("💬 \"나머지 보여줘\" 라고 하시면 계속 볼 수 있어요!\n\n")
 
-    response += "더 자세히 알고 싶은 회의를 선택해주세요!\n"
-    response += "예: 번호(완료 1, 예정 2), 제목(디자인 회의) 😊"
+    parts.append("더 자세히 알고 싶은 회의를 선택해주세요!\n")
+    parts.append("예: 번호(완료 1, 예정 2), 제목(디자인 회의) 😊")
 
-    return response, completed_limit, scheduled_limit
+    return ''.join(parts), completed_limit, scheduled_limit
 
 # ============================================================
 # Phase 2-A: 페르소나 템플릿 (5개 직업군만)
@@ -173,379 +217,227 @@ def format_multiple_meetings_short(results: list, user_query: str, total: int =
 # DB의 실제 job: 'NONE', 'PROJECT_MANAGER', 'FRONTEND_DEVELOPER', 
 #                'BACKEND_DEVELOPER', 'DATABASE_ADMINISTRATOR', 'SECURITY_DEVELOPER'
 
-def extract_pm_tech_stack(meeting: dict) -> list:
-    """프로젝트 관리 도구 추출 (PM용)"""
-    tech_keywords = ['Jira', 'Asana', 'Trello', 'Notion', 'Confluence', 
-                     'Monday', 'ClickUp', 'Slack', 'Teams', 'GitHub', 
-                     'GitLab', 'Figma', 'Miro']
-    tech_stack = []
+# 직업별 기술 키워드 (import 시점에 alternation 정규식 하나로 컴파일)
+def _tech_keyword_re(keywords: list):
+    """키워드 목록 → 단어 경계 alternation 정규식 (소문자 텍스트 대상, 긴 키워드 우선)"""
+    alternation = '|'.join(re.escape(k.lower()) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(r'\b(' + alternation + r')\b')
+
+PM_TECH_KEYWORDS = [
+    'Jira', 'Asana', 'Trello', 'Notion', 'Confluence', 
+    'Monday', 'ClickUp', 'Slack', 'Teams', 'GitHub', 
+    'GitLab', 'Figma', 'Miro'
+]
+PM_RE = _tech_keyword_re(PM_TECH_KEYWORDS)
+
+FE_TECH_KEYWORDS = [
+    'React', 'Vue', 'Angular', 'Next.js', 'Nuxt.js', 
+    'TypeScript', 'JavaScript', 'Svelte', 'Tailwind', 
+    'CSS', 'HTML', 'Redux', 'Zustand', 'Webpack', 'Vite'
+]
+FE_RE = _tech_keyword_re(FE_TECH_KEYWORDS)
+
+BE_TECH_KEYWORDS = [
+    'Spring Boot', 'Spring', 'Node.js', 'Express', 'FastAPI', 
+    'Django', 'Flask', 'NestJS', 'Java', 'Python', 
+    'Go', 'Rust', 'Kotlin', 'REST', 'GraphQL', 
+    'gRPC', 'Docker', 'Kubernetes', 'AWS', 'Azure'
+]
+BE_RE = _tech_keyword_re(BE_TECH_KEYWORDS)
+
+DBA_TECH_KEYWORDS = [
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 
+    'SQL Server', 'MariaDB', 'Elasticsearch', 'Cassandra', 
+    'DynamoDB', 'SQLite', 'Neo4j', 'Snowflake'
+]
+DBA_RE = _tech_keyword_re(DBA_TECH_KEYWORDS)
+
+SEC_TECH_KEYWORDS = [
+    'SSL', 'TLS', 'OAuth', 'JWT', 'SAML', 
+    'Firewall', 'WAF', 'IDS', 'IPS', 'VPN', 
+    'Nessus', 'Burp Suite', 'Wireshark', 'Metasploit', 
+    'OpenSSL', 'Snort'
+]
+SEC_RE = _tech_keyword_re(SEC_TECH_KEYWORDS)
+
+_WORD_CHAR_RE = re.compile(r'\w')
+
+# 직군 카테고리 → (키워드 목록, 컴파일된 패턴)
+_TECH_CATEGORIES = {
+    'pm': (PM_TECH_KEYWORDS, PM_RE),
+    'fe': (FE_TECH_KEYWORDS, FE_RE),
+    'be': (BE_TECH_KEYWORDS, BE_RE),
+    'dba': (DBA_TECH_KEYWORDS, DBA_RE),
+    'sec': (SEC_TECH_KEYWORDS, SEC_RE),
+}
+
+def _tech_text(meeting: dict) -> str:
+    """설명+요약 소문자 텍스트 (둘 다 비었으면 '')"""
+    description = meeting.get('description') or ''
+    summary = meeting.get('summary') or ''
+    return f"{description}\n{summary}".lower() if description or summary else ''
+
+def extract_tech_stack(meeting: dict, category: str, text: str = None) -> list:
+    """
+    카테고리별 기술 스택 추출 ('pm' | 'fe' | 'be' | 'dba' | 'sec')
+    설명+요약을 findall 한 번으로 스캔해서 등장한 키워드를 키워드 목록 순서대로 반환
+    - text: 미리 만든 _tech_text(meeting) (여러 카테고리를 볼 때 재사용, 회의 dict는 건드리지 않음)
+    """
+    if text is None:
+        text = _tech_text(meeting)
+    if not text:
+        return []  # 요약 전(SCHEDULED 등) 회의는 스캔 생략
     
-    description = meeting.get('description', '')
-    summary = meeting.get('summary', '')
+    keywords, pattern = _TECH_CATEGORIES[category]
+    hits = set(pattern.findall(text))
+    if not hits:
+        return []
     
-    for keyword in tech_keywords:
-        # 단어 경계 사용 (\b)
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, description.lower()) or re.search(pattern, summary.lower()):
+    tech_stack = []
+    for keyword in keywords:
+        keyword_lower = keyword.lower()
+        # 'Spring'처럼 더 긴 키워드('Spring Boot')의 앞부분으로만 등장한 경우도 포함
+        if keyword_lower in hits or any(
+            h.startswith(keyword_lower) and not _WORD_CHAR_RE.match(h, len(keyword_lower))
+            for h in hits if len(h) > len(keyword_lower)
+        ):
             tech_stack.append(keyword)
-    
     return tech_stack
 
+def extract_pm_tech_stack(meeting: dict) -> list:
+    """프로젝트 관리 도구 추출 (PM용)"""
+    return extract_tech_stack(meeting, 'pm')
+
 def extract_frontend_tech_stack(meeting: dict) -> list:
     """프론트엔드 기술 스택 추출"""
-    tech_keywords = ['React', 'Vue', 'Angular', 'Next.js', 'Nuxt.js', 
-                     'TypeScript', 'JavaScript', 'Svelte', 'Tailwind', 
-                     'CSS', 'HTML', 'Redux', 'Zustand', 'Webpack', 'Vite']
-    tech_stack = []
-    
-    description = meeting.get('description', '')
-    summary = meeting.get('summary', '')
-    
-    for keyword in tech_keywords:
-        # 단어 경계 사용 (\b)
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, description.lower()) or re.search(pattern, summary.lower()):
-            tech_stack.append(keyword)
-    
-    return tech_stack
+    return extract_tech_stack(meeting, 'fe')
 
 def extract_backend_tech_stack(meeting: dict) -> list:
     """백엔드 기술 스택 추출"""
-    tech_keywords = ['Spring Boot', 'Spring', 'Node.js', 'Express', 'FastAPI', 
-                     'Django', 'Flask', 'NestJS', 'Java', 'Python', 
-                     'Go', 'Rust', 'Kotlin', 'REST', 'GraphQL', 
-                     'gRPC', 'Docker', 'Kubernetes', 'AWS', 'Azure']
-    tech_stack = []
-    
-    description = meeting.get('description', '')
-    summary = meeting.get('summary', '')
-    
-    for keyword in tech_keywords:
-        # 단어 경계 사용 (\b)
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, description.lower()) or re.search(pattern, summary.lower()):
-            tech_stack.append(keyword)
-    
-    return tech_stack
+    return extract_tech_stack(meeting, 'be')
 
 def extract_dba_tech_stack(meeting: dict) -> list:
     """데이터베이스 기술 스택 추출"""
-    tech_keywords = ['MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 
-                     'SQL Server', 'MariaDB', 'Elasticsearch', 'Cassandra', 
-                     'DynamoDB', 'SQLite', 'Neo4j', 'Snowflake']
-    tech_stack = []
-    
-    description = meeting.get('description', '')
-    summary = meeting.get('summary', '')
-    
-    for keyword in tech_keywords:
-        # 단어 경계 사용 (\b)
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, description.lower()) or re.search(pattern, summary.lower()):
-            tech_stack.append(keyword)
-    
-    return tech_stack
+    return extract_tech_stack(meeting, 'dba')
 
 def extract_security_tech_stack(meeting: dict) -> list:
     """보안 도구/기술 추출"""
-    tech_keywords = ['SSL', 'TLS', 'OAuth', 'JWT', 'SAML', 
-                     'Firewall', 'WAF', 'IDS', 'IPS', 'VPN', 
-                     'Nessus', 'Burp Suite', 'Wireshark', 'Metasploit', 
-                     'OpenSSL', 'Snort']
-    tech_stack = []
-    
-    description = meeting.get('description', '')
-    summary = meeting.get('summary', '')
-    
-    for keyword in tech_keywords:
-        # 단어 경계 사용 (\b)
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, description.lower()) or re.search(pattern, summary.lower()):
-            tech_stack.append(keyword)
-    
-    return tech_stack
+    return extract_tech_stack(meeting, 'sec')
 
-def extract_simple_info(meeting: dict, keywords: list) -> str:
-    """간단한 정보 추출"""
+def _info_keyword_re(keywords: list):
+    """간단 정보 키워드 목록 → 대소문자 구분 substring 패턴"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+_PM_INFO_RE = _info_keyword_re(['기획', '전략', '로드맵', '목표', '계획', '일정', '마일스톤'])
+_FE_INFO_RE = _info_keyword_re(['ui', 'ux', '화면', '컴포넌트', 'react', 'vue', 'frontend', '프론트'])
+_BE_INFO_RE = _info_keyword_re(['api', '서버', '백엔드', 'backend', '데이터베이스', '배포'])
+_DBA_INFO_RE = _info_keyword_re(['데이터베이스', 'database', 'db', 'sql', '쿼리', '최적화', '인덱스', 'mysql'])
+_SEC_INFO_RE = _info_keyword_re(['보안', 'security', '취약점', '암호화', '인증', '권한'])
+
+def extract_simple_info(meeting: dict, keywords) -> str:
+    """간단한 정보 추출 (keywords: 컴파일된 패턴 또는 키워드 목록)"""
     description = meeting.get('description') or ''
-    lines = description.split('\n')
-    
-    results = []
-    for line in lines:
-        if any(keyword in line for keyword in keywords):
-            results.append(f"{line.strip()}")
+    if not description:
+        return '   없음'
     
+    pattern = keywords if hasattr(keywords, 'search') else _info_keyword_re(keywords)
+    results = [line.strip() for line in description.split('\n') if pattern.search(line)]
     return '\n'.join(results) if results else '   없음'
 
 # ============================================================
-def format_project_manager_meeting(meeting: dict) -> str:
-    """PROJECT_MANAGER용 회의 템플릿"""
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
-    
-    # 추가 정보 추출
+def _persona_template(tech_label: str, section_label: str) -> str:
+    """직군별 템플릿 문자열 생성 (라벨만 다르고 구성은 동일)"""
+    return (
+        "📌 {title}\n"
+        "📅 날짜: {date_str}\n"
+        "👥 참가자: {participants}\n"
+        f"{tech_label}: {{tech}}\n"
+        "\n"
+        "🎯 회의 목적:\n"
+        "{purpose}\n"
+        "\n"
+        "📋 안건:\n"
+        "{agenda}\n"
+        "\n"
+        "⭐ 중요도: {importance}\n"
+        "\n"
+        "💡 요약:\n"
+        "{summary}\n"
+        "\n"
+        f"{section_label}:\n"
+        "{section}\n"
+    )
+
+# 모듈 로드 시 한 번만 만들어 두고 format_map으로 채움
+_PM_TEMPLATE = _persona_template('📊 사용 도구', '📊 PM 주요사항')
+_FE_TEMPLATE = _persona_template('💻 기술 스택', '🎨 UI/UX 작업사항')
+_BE_TEMPLATE = _persona_template('💻 기술 스택', '🔧 백엔드 작업사항')
+_DBA_TEMPLATE = _persona_template('🗄️ DB 기술', '💾 데이터베이스 작업사항')
+_SEC_TEMPLATE = _persona_template('🔒 보안 도구', '🛡️ 보안 작업사항')
+
+def _persona_fields(meeting: dict, tech_stack: list, section: str) -> dict:
+    """직군별 템플릿에 채울 값"""
     participants = meeting.get('participants', [])
-    participants_str = ', '.join(participants) if participants else '정보 없음'
-    purpose = meeting.get('purpose') or '정보 없음'
-    agenda = meeting.get('agenda') or '정보 없음'
-    importance_str = format_importance(meeting.get('importance_level'), meeting.get('importance_reason'))
-    
-    summary = meeting.get('summary', '')
-    goal = summary.split('.')[0].strip() if summary else '없음'
-    
-    tech_stack = extract_pm_tech_stack(meeting)
-    planning_info = extract_simple_info(meeting, ['기획', '전략', '로드맵', '목표', '계획', '일정', '마일스톤'])
-    
-    template = f"""📌 {meeting.get('title', '제목 없음')}
-📅 날짜: {date_str}
-👥 참가자: {participants_str}
-📊 사용 도구: {', '.join(tech_stack) if tech_stack else '정보 없음'}
-
-🎯 회의 목적:
-{purpose}
-
-📋 안건:
-{agenda}
-
-⭐ 중요도: {importance_str}
-
-💡 요약:
-{meeting.get('summary') or '없음'}
+    return {
+        'title': meeting.get('title', '제목 없음'),
+        'date_str': _fmt_scheduled_at(meeting),
+        'participants': ', '.join(participants) if participants else '정보 없음',
+        'tech': ', '.join(tech_stack) if tech_stack else '정보 없음',
+        'purpose': meeting.get('purpose') or '정보 없음',
+        'agenda': meeting.get('agenda') or '정보 없음',
+        'importance': format_importance(meeting.get('importance_level'), meeting.get('importance_reason')),
+        'summary': meeting.get('summary') or '없음',
+        'section': section,
+    }
 
-📊 PM 주요사항:
-{planning_info}
-"""
-    return template
+def format_project_manager_meeting(meeting: dict) -> str:
+    """PROJECT_MANAGER용 회의 템플릿"""
+    return _PM_TEMPLATE.format_map(_persona_fields(
+        meeting, extract_pm_tech_stack(meeting), extract_simple_info(meeting, _PM_INFO_RE)))
 
-# ============================================================
 def format_frontend_developer_meeting(meeting: dict) -> str:
     """FRONTEND_DEVELOPER용 회의 템플릿"""
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
-    
-    # 추가 정보 추출
-    participants = meeting.get('participants', [])
-    participants_str = ', '.join(participants) if participants else '정보 없음'
-    purpose = meeting.get('purpose') or '정보 없음'
-    agenda = meeting.get('agenda') or '정보 없음'
-    importance_str = format_importance(meeting.get('importance_level'), meeting.get('importance_reason'))
-    
-    tech_stack = extract_frontend_tech_stack(meeting)
-    ui_info = extract_simple_info(meeting, ['ui', 'ux', '화면', '컴포넌트', 'react', 'vue', 'frontend', '프론트'])
-    
-    template = f"""📌 {meeting.get('title', '제목 없음')}
-📅 날짜: {date_str}
-👥 참가자: {participants_str}
-💻 기술 스택: {', '.join(tech_stack) if tech_stack else '정보 없음'}
-
-🎯 회의 목적:
-{purpose}
-
-📋 안건:
-{agenda}
-
-⭐ 중요도: {importance_str}
-
-💡 요약:
-{meeting.get('summary') or '없음'}
-
-🎨 UI/UX 작업사항:
-{ui_info}
-"""
-    return template
+    return _FE_TEMPLATE.format_map(_persona_fields(
+        meeting, extract_frontend_tech_stack(meeting), extract_simple_info(meeting, _FE_INFO_RE)))
 
-# ============================================================
 def format_backend_developer_meeting(meeting: dict) -> str:
     """BACKEND_DEVELOPER용 회의 템플릿"""
-    tech_stack = extract_backend_tech_stack(meeting)
-    
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
-    
-    # 추가 정보 추출
-    participants = meeting.get('participants', [])
-    participants_str = ', '.join(participants) if participants else '정보 없음'
-    purpose = meeting.get('purpose') or '정보 없음'
-    agenda = meeting.get('agenda') or '정보 없음'
-    importance_str = format_importance(meeting.get('importance_level'), meeting.get('importance_reason'))
-    
-    backend_tasks = extract_simple_info(meeting, ['api', '서버', '백엔드', 'backend', '데이터베이스', '배포'])
-    
-    template = f"""📌 {meeting.get('title', '제목 없음')}
-📅 날짜: {date_str}
-👥 참가자: {participants_str}
-💻 기술 스택: {', '.join(tech_stack) if tech_stack else '정보 없음'}
+    return _BE_TEMPLATE.format_map(_persona_fields(
+        meeting, extract_backend_tech_stack(meeting), extract_simple_info(meeting, _BE_INFO_RE)))
 
-🎯 회의 목적:
-{purpose}
-
-📋 안건:
-{agenda}
-
-⭐ 중요도: {importance_str}
-
-💡 요약:
-{meeting.get('summary') or '없음'}
-
-🔧 백엔드 작업사항:
-{backend_tasks}
-"""
-    return template
-
-# ============================================================
 def format_database_administrator_meeting(meeting: dict) -> str:
     """DATABASE_ADMINISTRATOR용 회의 템플릿"""
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
-    
-    # 추가 정보 추출
-    participants = meeting.get('participants', [])
-    participants_str = ', '.join(participants) if participants else '정보 없음'
-    purpose = meeting.get('purpose') or '정보 없음'
-    agenda = meeting.get('agenda') or '정보 없음'
-    importance_str = format_importance(meeting.get('importance_level'), meeting.get('importance_reason'))
-    
-    tech_stack = extract_dba_tech_stack(meeting)
-    db_tasks = extract_simple_info(meeting, ['데이터베이스', 'database', 'db', 'sql', '쿼리', '최적화', '인덱스', 'mysql'])
-    
-    template = f"""📌 {meeting.get('title', '제목 없음')}
-📅 날짜: {date_str}
-👥 참가자: {participants_str}
-🗄️ DB 기술: {', '.join(tech_stack) if tech_stack else '정보 없음'}
+    return _DBA_TEMPLATE.format_map(_persona_fields(
+        meeting, extract_dba_tech_stack(meeting), extract_simple_info(meeting, _DBA_INFO_RE)))
 
-🎯 회의 목적:
-{purpose}
-
-📋 안건:
-{agenda}
-
-⭐ 중요도: {importance_str}
-
-💡 요약:
-{meeting.get('summary') or '없음'}
-
-💾 데이터베이스 작업사항:
-{db_tasks}
-"""
-    return template
-
-# ============================================================
 def format_security_developer_meeting(meeting: dict) -> str:
     """SECURITY_DEVELOPER용 회의 템플릿"""
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
-    
-    # 추가 정보 추출
-    participants = meeting.get('participants', [])
-    participants_str = ', '.join(participants) if participants else '정보 없음'
-    purpose = meeting.get('purpose') or '정보 없음'
-    agenda = meeting.get('agenda') or '정보 없음'
-    importance_str = format_importance(meeting.get('importance_level'), meeting.get('importance_reason'))
-    
-    tech_stack = extract_security_tech_stack(meeting)
-    security_tasks = extract_simple_info(meeting, ['보안', 'security', '취약점', '암호화', '인증', '권한'])
-    
-    template = f"""📌 {meeting.get('title', '제목 없음')}
-📅 날짜: {date_str}
-👥 참가자: {participants_str}
-🔒 보안 도구: {', '.join(tech_stack) if tech_stack else '정보 없음'}
-
-🎯 회의 목적:
-{purpose}
-
-📋 안건:
-{agenda}
-
-⭐ 중요도: {importance_str}
-
-💡 요약:
-{meeting.get('summary') or '없음'}
-
-🛡️ 보안 작업사항:
-{security_tasks}
-"""
-    return template
+    return _SEC_TEMPLATE.format_map(_persona_fields(
+        meeting, extract_security_tech_stack(meeting), extract_simple_info(meeting, _SEC_INFO_RE)))
 
 # ============================================================
 
+# DB의 실제 job ENUM 값 → 직무별 템플릿
+_PERSONA_DISPATCH = {
+    'PROJECT_MANAGER': format_project_manager_meeting,
+    'FRONTEND_DEVELOPER': format_frontend_developer_meeting,
+    'BACKEND_DEVELOPER': format_backend_developer_meeting,
+    'DATABASE_ADMINISTRATOR': format_database_administrator_meeting,
+    'SECURITY_DEVELOPER': format_security_developer_meeting,
+}
+
 def format_single_meeting_with_persona(meeting: dict, user_job: str) -> str:
-    """Job에 따라 다른 템플릿 적용 (실제 DB job enum에 맞춤)"""
-    
-    """직무별 페르소나 템플릿 적용"""
+    """직무별 페르소나 템플릿 적용 (실제 DB job enum에 맞춤)"""
     # NONE이면 기본 템플릿 사용
     if not user_job or user_job == 'NONE':
         return format_single_meeting_basic(meeting)
     
-    # 정규화 (대문자 변환)
-    user_job = user_job.upper() if user_job else 'NONE'
-
-    # 유효한 직무만 허용
-    valid_jobs = ['NONE', 'PROJECT_MANAGER', 'FRONTEND_DEVELOPER', 
-                'BACKEND_DEVELOPER', 'DATABASE_ADMINISTRATOR', 'SECURITY_DEVELOPER']
-    if user_job not in valid_jobs:
-        user_job = 'NONE'
-    
-    # DB의 실제 ENUM 값에 맞춤
-    if user_job == 'PROJECT_MANAGER':
-        return format_project_manager_meeting(meeting)
-    elif user_job == 'FRONTEND_DEVELOPER':
-        return format_frontend_developer_meeting(meeting)
-    elif user_job == 'BACKEND_DEVELOPER':
-        return format_backend_developer_meeting(meeting)
-    elif user_job == 'DATABASE_ADMINISTRATOR':
-        return format_database_administrator_meeting(meeting)
-    elif user_job == 'SECURITY_DEVELOPER':
-        return format_security_developer_meeting(meeting)
-    else:
-        # NONE이거나 인식 못한 경우 기본 템플릿
-        return format_single_meeting(meeting)
+    # 정규화 (대문자 변환) 후 조회, 인식 못한 직무는 기본 템플릿
+    return _PERSONA_DISPATCH.get(user_job.upper(), format_single_meeting)(meeting)
     
 def format_single_meeting_basic(meeting: dict) -> str:
     """직무가 NONE일 때 사용하는 기본 템플릿"""
-    scheduled_at = meeting.get('scheduled_at', '')
-    try:
-        if isinstance(scheduled_at, str):
-            dt = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        else:
-            dt = scheduled_at
-        date_str = dt.strftime('%Y년 %m월 %d일')
-    except:
-        date_str = str(scheduled_at)[:10] if scheduled_at else '날짜 없음'
+    date_str = _fmt_scheduled_at(meeting)
     
     response = f"""📌 {meeting.get('title', '제목 없음')}
 📅 날짜: {date_str}
@@ -565,9 +457,9 @@ def format_my_tasks(tasks: list, status_text: str = "") -> str:
     total = len(tasks)
     
     if status_text:
-        response = f"📋 {status_text} 일 {total}개:\n\n"
+        parts = [f"📋 {status_text} 일 {total}개:\n\n"]
     else:
-        response = f"📋 {total}개의 할 일이 있어요!\n\n"
+        parts = [f"📋 {total}개의 할 일이 있어요!\n\n"]
     
     for i, task in enumerate(tasks[:10], 1):
         title = task.get('title', '제목 없음')
@@ -582,15 +474,15 @@ def format_my_tasks(tasks: list, status_text: str = "") -> str:
         else:
             due_str = "📅 기한 없음"
         
-        response += f"{status_emoji} {i}. {title}\n"
-        response += f"   회의: {meeting_title}\n"
-        response += f"   {due_str}\n\n"
+        parts.append(f"{status_emoji} {i}. {title}\n")
+        parts.append(f"   회의: {meeting_title}\n")
+        parts.append(f"   {due_str}\n\n")
     
     if total > 10:
-        response += f"💡 최대 10개까지만 보여드려요!\n"
-        response += f"   더 자세히 보려면 '회의 선택 → 할 일 조회'를 이용해주세요.\n"
+        parts.append(f"💡 최대 10개까지만 보여드려요!\n")
+        parts.append(f"   더 자세히 보려면 '회의 선택 → 할 일 조회'를 이용해주세요.\n")
     
-    return response
+    return ''.join(parts)
 
 
 def format_assignee_tasks(tasks: list, name: str, status_text: str = "") -> str:
@@ -598,9 +490,9 @@ def format_assignee_tasks(tasks: list, name: str, status_text: str = "") -> str:
     total = len(tasks)
     
     if status_text:
-        response = f"📋 {name}님이 {status_text} 일 {total}개:\n\n"
+        parts = [f"📋 {name}님이 {status_text} 일 {total}개:\n\n"]
     else:
-        response = f"📋 {name}님이 담당한 일 {total}개:\n\n"
+        parts = [f"📋 {name}님이 담당한 일 {total}개:\n\n"]
     
     for i, task in enumerate(tasks[:10], 1):
         title = task.get('title', '제목 없음')
@@ -615,15 +507,15 @@ def format_assignee_tasks(tasks: list, name: str, status_text: str = "") -> str:
         else:
             due_str = "📅 기한 없음"
         
-        response += f"{status_emoji} {i}. {title}\n"
-        response += f"   회의: {meeting_title}\n"
-        response += f"   {due_str}\n\n"
+        parts.append(f"{status_emoji} {i}. {title}\n")
+        parts.append(f"   회의: {meeting_title}\n")
+        parts.append(f"   {due_str}\n\n")
     
     if total > 10:
-        response += f"💡 최대 10개까지만 보여드려요!\n"
-        response += f"   더 자세히 보려면 '회의 선택 → 할 일 조회'를 이용해주세요.\n"
+        parts.append(f"💡 최대 10개까지만 보여드려요!\n")
+        parts.append(f"   더 자세히 보려면 '회의 선택 → 할 일 조회'를 이용해주세요.\n")
     
-    return response
+    return ''.join(parts)
 
 def format_meeting_tasks(tasks: list, meeting_title: str = None, exclude_self: bool = False) -> str:
     """특정 회의의 할 일 목록 포맷팅"""
@@ -645,9 +537,9 @@ def format_meeting_tasks(tasks: list, meeting_title: str = None, exclude_self: b
             
     # 1개 이상일 때
     if meeting_title:
-        response = f"📋 {meeting_title}에서 정한 할 일: {total}개\n\n"
+        parts = [f"📋 {meeting_title}에서 정한 할 일: {total}개\n\n"]
     else:
-        response = f"📋 이 회의에서 정한 할 일: {total}개\n\n"
+        parts = [f"📋 이 회의에서 정한 할 일: {total}개\n\n"]
 
     for i, task in enumerate(tasks, 1):
         title = task.get('title', '제목 없음')
@@ -662,16 +554,38 @@ def format_meeting_tasks(tasks: list, meeting_title: str = None, exclude_self: b
         else:
             due_str = "📅 기한 없음"
         
-        response += f"{status_emoji} {i}. {title}\n"
-        response += f"   담당: {assignee}\n"
-        response += f"   {due_str}\n\n"
+        parts.append(f"{status_emoji} {i}. {title}\n")
+        parts.append(f"   담당: {assignee}\n")
+        parts.append(f"   {due_str}\n\n")
     
-    return response
+    return ''.join(parts)
 
 # ============================================================
 # Participant 포맷팅
 # ============================================================
 
+# 직무/회의 상태 표시용 변환표
+_JOB_KR = {
+    'PROJECT_MANAGER': '기획자',
+    'FRONTEND_DEVELOPER': '프론트엔드',
+    'BACKEND_DEVELOPER': '백엔드',
+    'DATABASE_ADMINISTRATOR': 'DBA',
+    'SECURITY_DEVELOPER': '보안',
+    'NONE': ''
+}
+
+_STATUS_KR = {
+    'COMPLETED': '완료됨',
+    'SCHEDULED': '예정',
+    'RECORDING': '진행중'
+}
+
+_STATUS_EMOJI = {
+    'COMPLETED': '✅',
+    'SCHEDULED': '📅',
+    'RECORDING': '🔴'
+}
+
 def format_meeting_participants(meeting: dict, participants: list) -> str:
     """
     특정 회의의 참석자 목록 포맷팅
@@ -679,43 +593,20 @@ def format_meeting_participants(meeting: dict, participants: list) -> str:
     meeting: {'title': ..., 'scheduled_at': ...}
     participants: [{'name': ..., 'speaker_id': ..., 'job': ...}, ...]
     """
-    from datetime import datetime
-    
     title = meeting['title']
-    scheduled_at = meeting['scheduled_at']
     
     # 날짜 포맷팅
-    if isinstance(scheduled_at, str):
-        scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-    date_str = scheduled_at.strftime('%Y년 %m월 %d일')
-    
-    # 메시지 생성
-    message = f"네, {title} 회의 참석자를 알려드릴게요! 👥\n\n"
-    message += f"📅 {date_str}\n\n"
+    date_str = _meeting_dates(meeting)[1]
     
+    # 참석자 한 줄씩: "• 이름 (직무)" (직무 없으면 이름만)
+    lines = []
     for p in participants:
-        name = p['name']
-        speaker_id = p.get('speaker_id', '')
-        job = p.get('job', 'NONE')
-        
-        # 직무 한글 변환
-        job_kr = {
-            'PROJECT_MANAGER': '기획자',
-            'FRONTEND_DEVELOPER': '프론트엔드',
-            'BACKEND_DEVELOPER': '백엔드',
-            'DATABASE_ADMINISTRATOR': 'DBA',
-            'SECURITY_DEVELOPER': '보안',
-            'NONE': ''
-        }.get(job, '')
-        
-        # 정보 조합
-        info_parts = [name]
-        if job_kr:
-            info_parts.append(f"({job_kr})")
-        participant_info = " ".join(info_parts)
-        message += f"• {participant_info}\n"
+        job_kr = _JOB_KR.get(p.get('job', 'NONE'), '')
+        lines.append(f"• {p['name']} ({job_kr})" if job_kr else f"• {p['name']}")
     
-    return message.strip()
+    # 메시지 생성
+    header = f"네, {title} 회의 참석자를 알려드릴게요! 👥\n\n📅 {date_str}\n\n"
+    return (header + '\n'.join(lines)).strip()
 
 
 def format_person_meetings(user: dict, meetings: list) -> str:
@@ -725,68 +616,52 @@ def format_person_meetings(user: dict, meetings: list) -> str:
     user: {'id': ..., 'name': ..., 'job': ...}
     meetings: [{'id': ..., 'title': ..., 'scheduled_at': ..., 'status': ..., 'role': ...}, ...]
     """
-    from datetime import datetime
-    
     name = user['name']
     
     # 단일 회의 부분 수정
     if len(meetings) == 1:
         meeting = meetings[0]
         title = meeting['title']
-        scheduled_at = meeting['scheduled_at']
         status = meeting['status']
         # role 관련 코드 삭제!
         
         # 날짜 포맷팅
-        if isinstance(scheduled_at, str):
-            scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-        date_str = scheduled_at.strftime('%Y년 %m월 %d일')
+        date_str = _meeting_dates(meeting)[1]
         
         # 상태 한글 변환
-        status_kr = {
-            'COMPLETED': '완료됨',
-            'SCHEDULED': '예정',
-            'RECORDING': '진행중'
-        }.get(status, status)
+        status_kr = _STATUS_KR.get(status, status)
         
-        message = f"네, {name}님이 참석한 회의가 있어요! 📌\n\n"
-        message += f"{title}\n"
-        message += f"📅 {date_str} ({status_kr})\n\n"
+        parts = [f"네, {name}님이 참석한 회의가 있어요! 📌\n\n"]
+        parts.append(f"{title}\n")
+        parts.append(f"📅 {date_str} ({status_kr})\n\n")
         
         if meeting.get('description'):
-            message += f"💡 {meeting['description']}"
+            parts.append(f"💡 {meeting['description']}")
         
-        return message.strip()
+        return ''.join(parts).strip()
     
     else:
         # 여러 회의
-        message = f"네, {name}님이 참석한 회의는 총 {len(meetings)}개예요! 📋\n\n"
+        parts = [f"네, {name}님이 참석한 회의는 총 {len(meetings)}개예요! 📋\n\n"]
         
         for i, meeting in enumerate(meetings[:10], 1):
             title = meeting['title']
-            scheduled_at = meeting['scheduled_at']
             status = meeting['status']
             
             # 날짜 포맷팅
-            if isinstance(scheduled_at, str):
-                scheduled_at = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-            date_str = scheduled_at.strftime('%m월 %d일')
+            date_str = _meeting_dates(meeting)[2]
             
             # 상태 이모지
-            status_emoji = {
-                'COMPLETED': '✅',
-                'SCHEDULED': '📅',
-                'RECORDING': '🔴'
-            }.get(status, '📌')
+            status_emoji = _STATUS_EMOJI.get(status, '📌')
             
-            message += f"{i}. {status_emoji} {title} ({date_str})\n"
+            parts.append(f"{i}. {status_emoji} {title} ({date_str})\n")
         
         if len(meetings) > 10:
-            message += f"\n💡 이 외에도 {len(meetings) - 10}개가 더 있어요!"
+            parts.append(f"\n💡 이 외에도 {len(meetings) - 10}개가 더 있어요!")
         
-        message += "\n\n번호를 말씀해주시면 자세히 알려드릴게요! 😊"
+        parts.append("\n\n번호를 말씀해주시면 자세히 알려드릴게요! 😊")
         
-        return message.strip()
+        return ''.join(parts).strip()
     
 def calculate_shown_counts(meetings: list) -> tuple:
     """
@@ -819,7 +694,7 @@ def format_meeting_tasks(tasks: list, meeting_title: str = None) -> str:
         return "📌 이 회의에서 정한 할 일이 없어요! 😊"
     
     title_text = f"📌 {meeting_title}의 할 일" if meeting_title else "📌 할 일 목록"
-    answer = f"{title_text} ({len(tasks)}개)\n\n"
+    parts = [f"{title_text} ({len(tasks)}개)\n\n"]
     
     for i, task in enumerate(tasks, 1):
         status_emoji = "✅" if task.get('status') == 'COMPLETED' else "⏳"
@@ -827,17 +702,17 @@ def format_meeting_tasks(tasks: list, meeting_title: str = None) -> str:
         assignee = task.get('assignee_name') or task.get('assignee_real_name', '미정')
         due_date = task.get('due_date')
         
-        answer += f"{status_emoji} {i}. {title}\n"
-        answer += f"   담당자: {assignee}\n"
+        parts.append(f"{status_emoji} {i}. {title}\n")
+        parts.append(f"   담당자: {assignee}\n")
         
         if due_date:
             if hasattr(due_date, 'strftime'):
-                answer += f"   마감일: {due_date.strftime('%m월 %d일')}\n"
+                parts.append(f"   마감일: {due_date.strftime('%m월 %d일')}\n")
             else:
-                answer += f"   마감일: {due_date}\n"
+                parts.append(f"   마감일: {due_date}\n")
         else:
-            answer += f"   마감일: 미정\n"
+            parts.append(f"   마감일: 미정\n")
         
-        answer += "\n"
+        parts.append("\n")
     
-    return answer.strip()
\ No newline at end of file
+    return ''.join(parts).strip()
\ No newline at end of file
@@ -1,29 +1,64 @@
 """
 HyperCLOVA X API 호출
 """
+import asyncio
 import requests
 import uuid
+import ujson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import copy
+import hashlib
+import re
+import time
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from .config import CLOVA_STUDIO_URL, CLOVA_API_KEY
 
 logger = logging.getLogger(__name__)
 
-def call_hyperclova_rag(user_query: str, lambda_result: str):
-    """Lambda 검색 결과를 바탕으로 HyperCLOVA X RAG 답변 생성"""
-    import requests
-    import uuid
-    import traceback
-    from datetime import datetime
-    
-    # 오늘 날짜 동적 생성
-    today = datetime.now()
-    today_str = today.strftime('%Y년 %m월 %d일')
-    today_iso = today.strftime('%Y-%m-%d')
-    
-    system_prompt = f"""🚨 회의록 검색 챗봇
-
-    ## 오늘: {today_str} ({today_iso})
+# ============================================================
+# HyperCLOVA X HTTP 세션 (keep-alive로 매 호출 TCP/TLS 핸드셰이크 생략)
+# ============================================================
+
+_CLOVA_HEADERS = {
+    'Authorization': f'Bearer {CLOVA_API_KEY}',
+    'Content-Type': 'application/json',
+}
+
+def _clova_headers() -> dict:
+    """고정 헤더 + 호출마다 새 요청 ID"""
+    return {**_CLOVA_HEADERS, 'X-NCP-CLOVASTUDIO-REQUEST-ID': str(uuid.uuid4())}
+
+# 호출 종류별 최대 생성 토큰 (출력이 짧은 분류/JSON 호출은 작게)
+MAX_TOKENS_DEFAULT = 500
+MAX_TOKENS_INTENT_JSON = 150    # parse_query_intent JSON
+MAX_TOKENS_PREPROCESS_JSON = 200  # preprocess_query_with_llm JSON
+MAX_TOKENS_CLASSIFY = 20        # RAG / NEW_SEARCH / CONTEXT_DEPENDENT 한 단어
+MAX_TOKENS_SHORT_ANSWER = 200   # 2-3문장 답변
+
+def _dump_body(body: dict) -> bytes:
+    """요청 본문 → UTF-8 JSON (한글을 \\uXXXX로 이스케이프하지 않아 본문이 작음)"""
+    return ujson.dumps(body, ensure_ascii=False).encode('utf-8')
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # 게이트웨이 오류(502/503/504)만 짧게 재시도, 마지막 응답은 그대로 반환 (status_code 검사는 호출부에서)
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                      allowed_methods=['POST'], raise_on_status=False),
+))
+
+# ============================================================
+# 고정 시스템 프롬프트 (모듈 로드 시 한 번만 생성)
+# - 매 호출 같은 문자열이 앞(prefix)에 오도록 날짜 등 바뀌는 값은 사용자 메시지 끝에 둠
+# ============================================================
+
+RAG_SYSTEM_PROMPT = """🚨 회의록 검색 챗봇
 
     ## 규칙
 
@@ -52,9 +87,9 @@ def call_hyperclova_rag(user_query: str, lambda_result: str):
     💡 핵심 내용:
     [2-3문장 자세히] 했습니다
 
-    ## 시제
-    - 날짜 < {today_iso} → 과거형
-    - 날짜 >= {today_iso} → 미래형
+    ## 시제 (오늘 날짜는 사용자 메시지에 있음)
+    - 날짜 < 오늘 → 과거형
+    - 날짜 >= 오늘 → 미래형
 
     ## 예시
 
@@ -93,6 +128,253 @@ def call_hyperclova_rag(user_query: str, lambda_result: str):
     - 날짜는 검색 결과에 표시된 그대로만 사용하세요
     """.strip()
 
+QUERY_INTENT_SYSTEM_PROMPT = """당신은 회의록 검색 시스템의 질문 분석 전문가입니다.
+            사용자의 질문을 분석해서 다음 정보를 추출하세요:
+
+            1. intent: 질문 유형
+            - "search_meetings": 회의 검색
+            - "count_meetings": 회의 개수/횟수 질문  
+            - "off_topic": 회의와 관련 없는 질문
+
+            2. keywords: 검색 키워드 리스트 (명사만, 불용어 제외)
+            - 불용어: 회의, 미팅, 알려줘, 보여줘, 찾아줘, 있어, 뭐, 거, 이번주, 지난주, 오늘, 어제, 줘, 아줘, 해줘  # ← 추가!
+
+            3. date_range: 날짜 표현
+            - "오늘", "어제", "이번주", "지난주", "최근", "10월", "10월 20일" 등
+            - 없으면 null
+
+            4. status: 회의 상태 (매우 중요!)
+            - "COMPLETED": 과거형
+                * 어미: ~했어, ~한, ~있었어, ~였어, ~된, ~됐어
+                * 오타: "회의함" → "회의한" (과거)
+            - "SCHEDULED": 미래형
+                * 어미: ~할, ~있을, ~될, ~예정
+            - null: 명시 안 됨
+
+            🚨 오타 처리 규칙:
+            - "회의함 거" → "회의한 거" (과거형)
+            - "미팅 했던거" → "미팅 했던 거" (과거형)
+            - "회의할거" → "회의할 거" (미래형)
+            - "회의 ㅈ아줘" → "회의 찾아줘" → keywords=[] (불용어)
+
+            반드시 JSON 형식으로만 답변하세요. 설명 없이 JSON만 출력하세요.
+
+            예시:
+            질문: "이번주 회의함 거 뭐있어?"
+            JSON: {"intent": "search_meetings", "keywords": [], "date_range": "이번주", "status": "COMPLETED"}
+
+            질문: "회의한 거 보여줘"
+            JSON: {"intent": "search_meetings", "keywords": [], "date_range": null, "status": "COMPLETED"}
+
+            질문: "다음주 회의 있을까?"
+            JSON: {"intent": "search_meetings", "keywords": [], "date_range": "다음주", "status": "SCHEDULED"}
+
+            질문: "회의 ㅈ아줘"
+            JSON: {"intent": "search_meetings", "keywords": [], "date_range": null, "status": null}"""
+
+PREPROCESS_PROMPT_STATIC = """사용자 질문을 분석하여 JSON으로 답변하세요.
+
+분석할 내용:
+1. corrected_query: 오타를 수정한 질문 (오타 없으면 원본 그대로)
+   ⚠️ 중요: "저회의", "그회의"는 "저 회의", "그 회의"로 보정 (띄어쓰기 추가)
+   ⚠️ 절대 "저희"로 바꾸지 마세요!
+2. intent: 질문 의도 (다음 중 하나)
+   - "meeting_search": 회의 검색 ("기획 회의", "회의 뭐있어")
+   - "task_search": 할일 검색 ("내가 할일", "다른 사람은", "누가 담당")
+   - "participant_search": 참석자 검색 ("누가 참석", "누구랑 회의", "회의 멤버")
+   - "meeting_detail_rag": 선택된 회의의 상세 질문 ("이 회의 예산은?", "주요 결론은?", "몇 분 진행?")
+   - "keyword_search": 키워드 검색 ("'예산' 키워드 있는 회의", "'리팩토링' 포함된 회의")
+   - "meeting_select": 선택 ("1", "10월 20일", "디자인")
+   - "confirmation": 확인 질문 ("그거야?", "맞아?")
+   - "off_topic": 회의와 무관한 질문
+3. is_contextual: 이전 회의 정보를 사용해야 하는가? (true/false)
+4. scope_expansion: 범위 확장 질문인가? (true/false)
+   - "전체적으로", "전부", "모두", "다", "전체에서", "전체적" 등 → true
+   - "아니 전체에서" 같은 범위 확장 표현 → true
+
+🎯 의도 구분 가이드:
+- "누가 참석했어?" → participant_search (회의 멤버 질문)
+- "누구랑 회의했어?" → participant_search (함께한 사람)
+- "김철수 회의에 있었어?" → participant_search (특정인 참석 여부)
+- "회의 멤버는?" → participant_search (참석자 목록)
+- "누가 뭐해?" → task_search (할일/업무)
+- "다른 사람은?" → task_search (다른 사람 할일)
+- "누가 담당?" → task_search (담당자)
+- "이 회의 예산은?" → meeting_detail_rag (선택된 회의 상세)
+- "이 회의 몇 분 진행?" → meeting_detail_rag (선택된 회의 시간)
+- "회의 분위기는?" → meeting_detail_rag (선택된 회의 내용)
+- "'예산' 키워드 있는 회의?" → keyword_search (회의 검색, 선택 아님)
+- "회의 있었어?" → meeting_search (새로운 검색, 컨텍스트 무시)
+- "회의 뭐있어?" → meeting_search (새로운 검색)
+
+예시:
+질문: "누가 참석했어?"
+{
+    "corrected_query": "누가 참석했어?",
+    "intent": "participant_search",
+    "is_contextual": true,
+    "scope_expansion": false,
+    "key_entities": ["참석"]
+}
+
+질문: "거기서 누가 뭐해?"
+{
+    "corrected_query": "거기서 누가 뭐해?",
+    "intent": "task_search",
+    "is_contextual": true,
+    "scope_expansion": false,
+    "key_entities": ["할일"]
+}
+
+질문: "전체적으로는?"
+현재 컨텍스트: 채용 전략 회의
+{
+    "corrected_query": "전체적으로는?",
+    "intent": "task_search",
+    "is_contextual": false,
+    "scope_expansion": true,
+    "key_entities": ["전체"]
+}
+질문: "아니 전체에서 내 할일"
+현재 컨텍스트: 개발팀 스프린트 회의
+{
+    "corrected_query": "아니 전체에서 내 할일",
+    "intent": "task_search",
+    "is_contextual": false,
+    "scope_expansion": true,
+    "key_entities": ["전체", "할일"]
+}
+
+질문: "누가 참석했어?"
+현재 컨텍스트: 채용 전략 회의
+{
+    "corrected_query": "누가 참석했어?",
+    "intent": "participant_search",
+    "is_contextual": true,
+    "scope_expansion": false,
+    "key_entities": ["참석"]
+}"""
+
+# 요청마다 바뀌지 않는 프롬프트 앞/뒤 부분 (호출 시에는 질문만 이어 붙임)
+_PREPROCESS_PROMPT_HEAD = PREPROCESS_PROMPT_STATIC + '\n\n사용자 질문: "'
+_INTENT_USER_PROMPT_PREFIX = '질문: '
+_INTENT_USER_PROMPT_SUFFIX = '\n\n        JSON:'
+
+_CLASSIFY_INTENT_PROMPT_TAIL = """
+질문의 의도를 다음 중 하나로 분류하세요:
+
+1. **RAG** (선택한 회의 내용에 대한 상세 질문)
+   - 회의 내용, 결정사항, 참석자, 예산, 시간, 분위기 등을 물어보는 경우
+   - 예시: "예산이 얼마야?", "누가 참석했어?", "어떤 결정 했어?", "몇 시간 진행됐어?", "주요 내용은?", "어떤 걸로 하기로 했어?", "왜 선택했어?"
+   
+2. **NEW_SEARCH** (새로운 회의 검색)
+   - 다른 회의를 찾거나 전체 회의 목록을 요청하는 경우
+   - 예시: "다른 회의 뭐있어?", "API 회의 찾아줘", "11월 회의 보여줘", "전체 회의 목록"
+   
+3. **CONTEXT_DEPENDENT** (선택한 회의 관련 확장 질문)
+   - 할일, 담당자, 참석 여부 등 선택한 회의의 부가 정보를 물어보는 경우
+   - 예시: "내 할일은?", "다른 사람 할일은?", "누가 담당해?", "그거 맞지?"
+
+**중요 규칙:**
+- 의문사(어떤, 왜, 얼마, 어떻게, 무엇, 누가 등)로 시작하는 질문은 대부분 **RAG**
+- "회의" 키워드가 있으면서 검색 동사(뭐있어, 찾아, 보여줘)가 있으면 **NEW_SEARCH**
+- "할일", "담당", "맡은" 키워드가 있으면 **CONTEXT_DEPENDENT**
+
+답변 형식: RAG 또는 NEW_SEARCH 또는 CONTEXT_DEPENDENT (하나만 출력, 다른 설명 없이)
+"""
+
+# ============================================================
+# 질문 분석 결과 캐시 (같은 질문이 반복되면 LLM 호출 생략)
+# ============================================================
+
+LLM_CACHE_SIZE = 4096
+LLM_CACHE_TTL = 24 * 60 * 60  # 1일 (프롬프트/모델이 바뀌어도 하루 안에 반영)
+LLM_SHARED_CACHE_TTL = 7 * 24 * 60 * 60  # Redis 공유 캐시 7일 (키에 프롬프트 해시가 들어가므로 프롬프트 변경 시 자동 무효화)
+
+_RE_SPACES = re.compile(r'\s+')
+
+def _normalize_llm_query(user_query: str) -> str:
+    """캐시 키용 질문 정규화 (앞뒤 공백 제거 + 연속 공백 하나로)"""
+    return _RE_SPACES.sub(' ', (user_query or '').strip())
+
+class _LLMResultCache:
+    """
+    LRU + TTL 캐시 (스레드 안전, 꺼낼 때 복사본 반환)
+    - shared_prefix를 주면 Redis 공유 캐시를 2차 캐시로 사용 (재시작/다른 프로세스에서도 재사용)
+    - shared_prefix에 프롬프트 해시를 넣어 프롬프트가 바뀌면 이전 결과를 쓰지 않음
+    """
+    
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE, ttl: int = LLM_CACHE_TTL, shared_prefix: str = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.shared_prefix = shared_prefix
+        self._data = OrderedDict()  # {key: (저장 시각, 결과)}
+        self._lock = threading.Lock()
+    
+    def _shared_key(self, key) -> str:
+        raw = ujson.dumps(key, ensure_ascii=False).encode('utf-8')
+        return f"{self.shared_prefix}:{hashlib.blake2b(raw, digest_size=16).hexdigest()}"
+    
+    def _get_local(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            saved_at, value = item
+            if time.monotonic() - saved_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)  # 호출자가 결과 dict를 수정해도 캐시는 그대로
+    
+    def _put_local(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), copy.deepcopy(value))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def get(self, key):
+        value = self._get_local(key)
+        if value is not None or not self.shared_prefix:
+            return value
+        
+        from .context import get_shared_cache
+        value = get_shared_cache(self._shared_key(key))
+        if value is not None:
+            self._put_local(key, value)  # 다음 조회부터는 프로세스 안에서 바로 반환
+        return value
+    
+    async def get_async(self, key):
+        """get의 비동기 버전 (프로세스 캐시는 바로 확인, Redis 조회만 스레드풀에서 → 이벤트 루프를 막지 않음)"""
+        value = self._get_local(key)
+        if value is not None or not self.shared_prefix:
+            return value
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+    
+    def put(self, key, value):
+        self._put_local(key, value)
+        if self.shared_prefix:
+            from .context import save_shared_cache
+            save_shared_cache(self._shared_key(key), value, LLM_SHARED_CACHE_TTL)
+
+def _prompt_digest(prompt: str) -> str:
+    """프롬프트 버전 식별용 짧은 해시"""
+    return hashlib.blake2b(prompt.encode('utf-8'), digest_size=4).hexdigest()
+
+_intent_cache = _LLMResultCache(shared_prefix=f"llm_cache:intent:{_prompt_digest(QUERY_INTENT_SYSTEM_PROMPT)}")
+_preprocess_cache = _LLMResultCache(shared_prefix=f"llm_cache:preprocess:{_prompt_digest(PREPROCESS_PROMPT_STATIC)}")
+
+@lru_cache(maxsize=2)
+def _today_strs(ordinal: int) -> tuple:
+    """날짜(ordinal) → ('2025년 01월 05일', '2025-01-05') (하루에 한 번만 포맷)"""
+    day = datetime.fromordinal(ordinal)
+    return day.strftime('%Y년 %m월 %d일'), day.strftime('%Y-%m-%d')
+
+def _rag_request_body(user_query: str, lambda_result: str, today_str: str, today_iso: str) -> dict:
+    """RAG 답변 요청 본문 (call_hyperclova_rag용)"""
+    system_prompt = RAG_SYSTEM_PROMPT
+
     user_message = f"""다음은 회의록 검색 결과입니다:
 
 {lambda_result}
@@ -116,7 +398,7 @@ def call_hyperclova_rag(user_query: str, lambda_result: str):
 
 위 형식에 맞춰 답변해주세요."""
 
-    studio_request = {
+    return {
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
@@ -129,60 +411,54 @@ def call_hyperclova_rag(user_query: str, lambda_result: str):
         "stopBefore": [],
         "includeAiFilters": True
     }
-    
-    headers = {
-        'Authorization': f'Bearer {CLOVA_API_KEY}',
-        'Content-Type': 'application/json',
-        'X-NCP-CLOVASTUDIO-REQUEST-ID': str(uuid.uuid4())
-    }
+
+def call_hyperclova_rag(user_query: str, lambda_result: str):
+    """Lambda 검색 결과를 바탕으로 HyperCLOVA X RAG 답변 생성"""
+    # 오늘 날짜 동적 생성
+    today_str, today_iso = _today_strs(datetime.now().toordinal())
+    studio_request = _rag_request_body(user_query, lambda_result, today_str, today_iso)
     
     try:
-        print(f"[DEBUG] HyperCLOVA X 호출 중...")
-        print(f"[DEBUG] 오늘 날짜: {today_str} ({today_iso})")
-        response = requests.post(
+        logger.debug("HyperCLOVA X 호출 중...")
+        logger.debug("오늘 날짜: %s (%s)", today_str, today_iso)
+        response = _SESSION.post(
             CLOVA_STUDIO_URL,
-            headers={
-                'Authorization': f'Bearer {CLOVA_API_KEY}',
-                'Content-Type': 'application/json',
-                'X-NCP-CLOVASTUDIO-REQUEST-ID': str(uuid.uuid4())
-            },
-            json=studio_request,
+            headers=_clova_headers(),
+            data=_dump_body(studio_request),
             timeout=30
         )
         
         if response.status_code != 200:
-            print(f"❌ HyperCLOVA X 오류: {response.status_code}")
-            print(f"응답: {response.text[:500]}")
+            logger.error("❌ HyperCLOVA X 오류: %s", response.status_code)
+            logger.error("응답: %s", response.text[:500])
             response.raise_for_status()
         
-        data = response.json()
+        data = ujson.loads(response.content)
         answer = data.get('result', {}).get('message', {}).get('content', '')
         
         if not answer:
-            print(f"⚠️ 응답 생성 실패 (빈 답변)")
+            logger.warning("⚠️ 응답 생성 실패 (빈 답변)")
             return None
         
-        print(f"✅ RAG 답변 생성 성공: {len(answer)}자")
+        logger.info("✅ RAG 답변 생성 성공: %s자", len(answer))
         return answer
     
     except requests.exceptions.HTTPError as e:
-        print(f"❌ HTTP 오류: {e}")
-        print(traceback.format_exc())
+        logger.exception("❌ HTTP 오류: %s", e)
         return None
     
     except requests.exceptions.Timeout:
-        print(f"❌ 타임아웃 (30초 초과)")
+        logger.error("❌ 타임아웃 (30초 초과)")
         return None
     
     except Exception as e:
-        print(f"❌ RAG 생성 오류: {e}")
-        print(traceback.format_exc())
+        logger.exception("❌ RAG 생성 오류: %s", e)
         return None
     
 # ================== HyperCLOVA X 호출 (일반 대화) ==================
 def call_hyperclova(user_query):
     """오프토픽 안내 메시지"""
-    print(f"\n🚫 [오프토픽] 회의록 검색 전용 챗봇 안내")
+    logger.info("🚫 [오프토픽] 회의록 검색 전용 챗봇 안내")
     
     off_topic_message = """죄송해요, 저는 회의록 검색 전용 챗봇이에요! 🗂️
 
@@ -195,7 +471,7 @@ def call_hyperclova(user_query):
 
 회의록 검색이 필요하시면 "회의", "미팅", "회의록" 같은 단어와 함께 질문해주세요! 😊"""
     
-    print(f"✅ 오프토픽 안내 메시지 반환")
+    logger.info("✅ 오프토픽 안내 메시지 반환")
     return off_topic_message
 
 
@@ -211,253 +487,310 @@ def parse_query_intent(user_query: str) -> dict:
         'status': 'COMPLETED' | 'SCHEDULED' | None
     }
     """
+    user_query = _normalize_llm_query(user_query)
+    # 영문 대소문자만 다른 질문('AI 회의' / 'ai 회의')은 같은 의도이므로 캐시 키에서 통일
+    cache_key = user_query.lower()
+    cached = _intent_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("LLM 의도 파악 캐시 사용: %s", cached)
+        return cached
+    
     try:
-        system_prompt = """당신은 회의록 검색 시스템의 질문 분석 전문가입니다.
-            사용자의 질문을 분석해서 다음 정보를 추출하세요:
-
-            1. intent: 질문 유형
-            - "search_meetings": 회의 검색
-            - "count_meetings": 회의 개수/횟수 질문  
-            - "off_topic": 회의와 관련 없는 질문
-
-            2. keywords: 검색 키워드 리스트 (명사만, 불용어 제외)
-            - 불용어: 회의, 미팅, 알려줘, 보여줘, 찾아줘, 있어, 뭐, 거, 이번주, 지난주, 오늘, 어제, 줘, 아줘, 해줘  # ← 추가!
+        system_prompt = QUERY_INTENT_SYSTEM_PROMPT
+        user_prompt = _INTENT_USER_PROMPT_PREFIX + user_query + _INTENT_USER_PROMPT_SUFFIX
 
-            3. date_range: 날짜 표현
-            - "오늘", "어제", "이번주", "지난주", "최근", "10월", "10월 20일" 등
-            - 없으면 null
-
-            4. status: 회의 상태 (매우 중요!)
-            - "COMPLETED": 과거형
-                * 어미: ~했어, ~한, ~있었어, ~였어, ~된, ~됐어
-                * 오타: "회의함" → "회의한" (과거)
-            - "SCHEDULED": 미래형
-                * 어미: ~할, ~있을, ~될, ~예정
-            - null: 명시 안 됨
-
-            🚨 오타 처리 규칙:
-            - "회의함 거" → "회의한 거" (과거형)
-            - "미팅 했던거" → "미팅 했던 거" (과거형)
-            - "회의할거" → "회의할 거" (미래형)
-            - "회의 ㅈ아줘" → "회의 찾아줘" → keywords=[] (불용어)
-
-            반드시 JSON 형식으로만 답변하세요. 설명 없이 JSON만 출력하세요.
-
-            예시:
-            질문: "이번주 회의함 거 뭐있어?"
-            JSON: {"intent": "search_meetings", "keywords": [], "date_range": "이번주", "status": "COMPLETED"}
-
-            질문: "회의한 거 보여줘"
-            JSON: {"intent": "search_meetings", "keywords": [], "date_range": null, "status": "COMPLETED"}
-
-            질문: "다음주 회의 있을까?"
-            JSON: {"intent": "search_meetings", "keywords": [], "date_range": "다음주", "status": "SCHEDULED"}
-
-            질문: "회의 ㅈ아줘"
-            JSON: {"intent": "search_meetings", "keywords": [], "date_range": null, "status": null}"""
-        user_prompt = f"""질문: {user_query}
-
-        JSON:"""
-
-        response = requests.post(
+        response = _SESSION.post(
             CLOVA_STUDIO_URL,
-            headers={
-                'Authorization': f'Bearer {CLOVA_API_KEY}',
-                'Content-Type': 'application/json',
-                'X-NCP-CLOVASTUDIO-REQUEST-ID': str(uuid.uuid4())
-            },
-            json={
+            headers=_clova_headers(),
+            data=_dump_body({
                 'messages': [
                     {'role': 'system', 'content': system_prompt},
                     {'role': 'user', 'content': user_prompt}
                 ],
                 'topP': 0.6,
                 'topK': 0,
-                'maxTokens': 500,
+                'maxTokens': MAX_TOKENS_INTENT_JSON,
                 'temperature': 0.1,
                 'repeatPenalty': 1.2,
                 'stopBefore': [],
-                'includeAiFilters': True
-            },
+                'includeAiFilters': False  # 내부 JSON 분류 호출
+            }),
             timeout=30
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = ujson.loads(response.content)
             content = result['result']['message']['content']
             
             # JSON 파싱
-            import json
             # ```json 제거
             content = content.replace('```json', '').replace('```', '').strip()
-            parsed = json.loads(content)
+            parsed = ujson.loads(content)
             
-            print(f"[DEBUG] LLM 의도 파악 결과: {parsed}")
+            logger.debug("LLM 의도 파악 결과: %s", parsed)
+            _intent_cache.put(cache_key, parsed)  # 성공한 결과만 캐시
             return parsed
         else:
-            print(f"[ERROR] LLM 호출 실패: {response.status_code}")
+            logger.error("LLM 호출 실패: %s", response.status_code)
             return None
             
     except Exception as e:
-        print(f"[ERROR] LLM 의도 파악 실패: {e}")
+        logger.error("LLM 의도 파악 실패: %s", e)
         return None
     
-def preprocess_query_with_llm(user_query: str, context: dict = None) -> dict:
-    """
-    사용자 질문 전처리 (오타 보정 + 의도 파악)
-    """
+def _preprocess_prompt(user_query: str, context: dict = None) -> tuple:
+    """전처리 프롬프트 + 캐시 키 생성 (동기/비동기 공통)"""
     context_info = ""
     if context and context.get('state') == 'meeting_selected':
         meeting_title = context.get('meeting_title', '알 수 없는 회의')
         context_info = f"\n현재 선택된 회의: {meeting_title}"
     
-    prompt = f"""사용자 질문을 분석하여 JSON으로 답변하세요.
-
-사용자 질문: "{user_query}"{context_info}
-
-분석할 내용:
-1. corrected_query: 오타를 수정한 질문 (오타 없으면 원본 그대로)
-   ⚠️ 중요: "저회의", "그회의"는 "저 회의", "그 회의"로 보정 (띄어쓰기 추가)
-   ⚠️ 절대 "저희"로 바꾸지 마세요!
-2. intent: 질문 의도 (다음 중 하나)
-   - "meeting_search": 회의 검색 ("기획 회의", "회의 뭐있어")
-   - "task_search": 할일 검색 ("내가 할일", "다른 사람은", "누가 담당")
-   - "participant_search": 참석자 검색 ("누가 참석", "누구랑 회의", "회의 멤버")
-   - "meeting_detail_rag": 선택된 회의의 상세 질문 ("이 회의 예산은?", "주요 결론은?", "몇 분 진행?")
-   - "keyword_search": 키워드 검색 ("'예산' 키워드 있는 회의", "'리팩토링' 포함된 회의")
-   - "meeting_select": 선택 ("1", "10월 20일", "디자인")
-   - "confirmation": 확인 질문 ("그거야?", "맞아?")
-   - "off_topic": 회의와 무관한 질문
-3. is_contextual: 이전 회의 정보를 사용해야 하는가? (true/false)
-4. scope_expansion: 범위 확장 질문인가? (true/false)
-   - "전체적으로", "전부", "모두", "다", "전체에서", "전체적" 등 → true
-   - "아니 전체에서" 같은 범위 확장 표현 → true
+    # 고정 안내문을 앞에, 질문/선택된 회의는 끝에 (고정 부분은 미리 만들어 둔 문자열에 이어 붙이기만)
+    prompt = _PREPROCESS_PROMPT_HEAD + user_query + '"' + context_info
+    
+    # 선택된 회의에 따라 결과가 달라지므로 (질문, 회의 제목) 단위로 캐시
+    return prompt, (user_query, context_info)
 
-🎯 의도 구분 가이드:
-- "누가 참석했어?" → participant_search (회의 멤버 질문)
-- "누구랑 회의했어?" → participant_search (함께한 사람)
-- "김철수 회의에 있었어?" → participant_search (특정인 참석 여부)
-- "회의 멤버는?" → participant_search (참석자 목록)
-- "누가 뭐해?" → task_search (할일/업무)
-- "다른 사람은?" → task_search (다른 사람 할일)
-- "누가 담당?" → task_search (담당자)
-- "이 회의 예산은?" → meeting_detail_rag (선택된 회의 상세)
-- "이 회의 몇 분 진행?" → meeting_detail_rag (선택된 회의 시간)
-- "회의 분위기는?" → meeting_detail_rag (선택된 회의 내용)
-- "'예산' 키워드 있는 회의?" → keyword_search (회의 검색, 선택 아님)
-- "회의 있었어?" → meeting_search (새로운 검색, 컨텍스트 무시)
-- "회의 뭐있어?" → meeting_search (새로운 검색)
+def _preprocess_default(user_query: str) -> dict:
+    """전처리 실패 시 기본값"""
+    return {
+        "corrected_query": user_query,
+        "intent": "meeting_search",
+        "is_contextual": False,
+        "key_entities": []
+    }
 
-예시:
-질문: "누가 참석했어?"
-{{
-    "corrected_query": "누가 참석했어?",
-    "intent": "participant_search",
-    "is_contextual": true,
-    "scope_expansion": false,
-    "key_entities": ["참석"]
-}}
+def _parse_preprocess_response(response: str, user_query: str, cache_key) -> dict:
+    """LLM 응답에서 JSON 추출 (혹시 마크다운으로 감싸져 있을 수 있음)"""
+    json_match = re.search(r'\{.*\}', response, re.DOTALL)
+    if not json_match:
+        # 파싱 실패 시 기본값
+        return _preprocess_default(user_query)
+    
+    parsed = ujson.loads(json_match.group())
+    # 번호/날짜 선택은 직전 목록에 따라 뜻이 달라지므로 캐시하지 않음
+    if isinstance(parsed, dict) and parsed.get('intent') != 'meeting_select':
+        _preprocess_cache.put(cache_key, parsed)
+    return parsed
+
+# ============================================================
+# 규칙 기반 전처리 (확실한 질문은 LLM 호출 없이 바로 판단)
+# ============================================================
+
+_RE_RULE_NUMBER = re.compile(r'^\d{1,3}$')
+_RE_RULE_PARTICIPANT = re.compile(r'누가.*(참석|멤버)|참석자|회의 멤버')
+_RE_RULE_KEYWORD = re.compile(r"['\"‘“].+['\"’”].*(키워드|포함)")
+_RE_RULE_THIS_MEETING = re.compile(r'이 회의|이거|저 회의|그 회의')
+_RE_RULE_MEETING_WORD = re.compile(r'회의|미팅')
+# 할일/참석/범위 확장 표현이 있으면 규칙으로 판단하지 않음 (LLM에 맡김)
+_RE_RULE_AMBIGUOUS = re.compile(r'할\s?일|담당|맡은|누가|누구|참석|전체|전부|모두|다른')
+# 자모 오타가 있으면 규칙으로 판단하지 않음 (LLM 오타 보정이 필요, needs_llm_analysis와 같은 기준)
+_RE_RULE_TYPO = re.compile(r'[ㅅㅈㄱㄴㅏㅓㅗㅜ]')
+
+_rule_stats = {'hit': 0, 'miss': 0}
+
+def _rule_result(user_query: str, intent: str, is_contextual: bool, key_entities: list) -> dict:
+    return {
+        "corrected_query": user_query,
+        "intent": intent,
+        "is_contextual": is_contextual,
+        "scope_expansion": False,
+        "key_entities": key_entities,
+    }
 
-질문: "거기서 누가 뭐해?"
-{{
-    "corrected_query": "거기서 누가 뭐해?",
-    "intent": "task_search",
-    "is_contextual": true,
-    "scope_expansion": false,
-    "key_entities": ["할일"]
-}}
+def _try_rule_based_preprocess(user_query: str, context: dict = None) -> dict:
+    """
+    패턴이 확실한 질문은 규칙으로 의도 판단 (맞는 규칙이 없으면 None → LLM 호출)
+    - 숫자만 → meeting_select
+    - "누가 참석", "참석자" → participant_search
+    - "'예산' 키워드/포함" → keyword_search
+    - 회의 선택 상태에서 "이 회의", "이거" → meeting_detail_rag
+    - 날짜/상태 표현 + "회의" (할일/참석/범위 표현 없음) → meeting_search
+    - 자모 오타가 있으면 규칙을 적용하지 않음 (보정 없이 검색하면 엉뚱한 키워드로 찾게 됨)
+    """
+    from .search import parse_date_from_query, parse_status_from_query
+    
+    query = user_query.strip()
+    meeting_selected = bool(context and context.get('state') == 'meeting_selected')
+    
+    result = None
+    if _RE_RULE_TYPO.search(query):
+        result = None  # 오타 보정은 LLM에서
+    elif _RE_RULE_NUMBER.match(query):
+        result = _rule_result(query, 'meeting_select', True, [])
+    elif _RE_RULE_PARTICIPANT.search(query) and not _RE_RULE_AMBIGUOUS.search(_RE_RULE_PARTICIPANT.sub('', query)):
+        result = _rule_result(query, 'participant_search', meeting_selected, ['참석'])
+    elif _RE_RULE_KEYWORD.search(query):
+        result = _rule_result(query, 'keyword_search', False, [])
+    elif meeting_selected and _RE_RULE_THIS_MEETING.search(query) and not _RE_RULE_AMBIGUOUS.search(query):
+        result = _rule_result(query, 'meeting_detail_rag', True, [])
+    elif (_RE_RULE_MEETING_WORD.search(query) and not _RE_RULE_AMBIGUOUS.search(query)
+          and (parse_date_from_query(query).get('type') or parse_status_from_query(query))):
+        result = _rule_result(query, 'meeting_search', False, [])
+    
+    _rule_stats['hit' if result else 'miss'] += 1
+    total = _rule_stats['hit'] + _rule_stats['miss']
+    logger.debug("규칙 기반 전처리 %s (적중률 %s/%s)", '적중' if result else '미적중', _rule_stats['hit'], total)
+    return result
 
-질문: "전체적으로는?"
-현재 컨텍스트: 채용 전략 회의
-{{
-    "corrected_query": "전체적으로는?",
-    "intent": "task_search",
-    "is_contextual": false,
-    "scope_expansion": true,
-    "key_entities": ["전체"]
-}}
-질문: "아니 전체에서 내 할일"
-현재 컨텍스트: 개발팀 스프린트 회의
-{{
-    "corrected_query": "아니 전체에서 내 할일",
-    "intent": "task_search",
-    "is_contextual": false,
-    "scope_expansion": true,
-    "key_entities": ["전체", "할일"]
-}}
+def preprocess_query_with_llm(user_query: str, context: dict = None) -> dict:
+    """
+    사용자 질문 전처리 (오타 보정 + 의도 파악)
+    """
+    user_query = _normalize_llm_query(user_query)
+    rule_result = _try_rule_based_preprocess(user_query, context)
+    if rule_result is not None:
+        return rule_result
+    
+    prompt, cache_key = _preprocess_prompt(user_query, context)
+    cached = _preprocess_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("LLM 전처리 캐시 사용: %s", cached)
+        return cached
 
-질문: "누가 참석했어?"
-현재 컨텍스트: 채용 전략 회의
-{{
-    "corrected_query": "누가 참석했어?",
-    "intent": "participant_search",
-    "is_contextual": true,
-    "scope_expansion": false,
-    "key_entities": ["참석"]
-}}"""
+    try:
+        response = call_hyperclova_simple(prompt, MAX_TOKENS_PREPROCESS_JSON, ai_filters=False)
+        return _parse_preprocess_response(response, user_query, cache_key)
+    except Exception as e:
+        logger.warning("[LLM 전처리 실패] %s", e)
+        return _preprocess_default(user_query)
+
+async def preprocess_query_with_llm_async(user_query: str, context: dict = None) -> dict:
+    """preprocess_query_with_llm의 비동기 버전 (이벤트 루프를 막지 않음)"""
+    user_query = _normalize_llm_query(user_query)
+    rule_result = _try_rule_based_preprocess(user_query, context)
+    if rule_result is not None:
+        return rule_result
+    
+    prompt, cache_key = _preprocess_prompt(user_query, context)
+    cached = await _preprocess_cache.get_async(cache_key)
+    if cached is not None:
+        logger.debug("LLM 전처리 캐시 사용: %s", cached)
+        return cached
 
     try:
-        response = call_hyperclova_simple(prompt)
-        # JSON 추출 (혹시 마크다운으로 감싸져 있을 수 있음)
-        import re
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            import json
-            return json.loads(json_match.group())
-        else:
-            # 파싱 실패 시 기본값
-            return {
-                "corrected_query": user_query,
-                "intent": "meeting_search",
-                "is_contextual": False,
-                "key_entities": []
-            }
+        response = await call_hyperclova_simple_async(prompt, MAX_TOKENS_PREPROCESS_JSON, ai_filters=False)
+        # 결과 캐시 저장에 Redis 쓰기가 포함되므로 스레드풀에서
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _parse_preprocess_response, response, user_query, cache_key
+        )
     except Exception as e:
-        print(f"[LLM 전처리 실패] {e}")
-        return {
-            "corrected_query": user_query,
-            "intent": "meeting_search",
-            "is_contextual": False,
-            "key_entities": []
-        }
-    
-def call_hyperclova_simple(prompt: str) -> str:
+        logger.warning("[LLM 전처리 실패] %s", e)
+        return _preprocess_default(user_query)
+
+def _simple_request_body(prompt: str, max_tokens: int = MAX_TOKENS_DEFAULT, ai_filters: bool = True) -> dict:
+    """
+    시스템 프롬프트 없는 단순 호출 요청 본문
+    - ai_filters: 사용자에게 그대로 보여주지 않는 내부 분류/JSON 호출은 False (필터 지연 생략)
+    """
+    return {
+        'messages': [
+            {'role': 'user', 'content': prompt}
+        ],
+        'topP': 0.6,
+        'topK': 0,
+        'maxTokens': max_tokens,
+        'temperature': 0.1,
+        'repeatPenalty': 1.2,
+        'stopBefore': [],
+        'includeAiFilters': ai_filters
+    }
+
+def call_hyperclova_simple(prompt: str, max_tokens: int = MAX_TOKENS_DEFAULT, ai_filters: bool = True) -> str:
     """
     간단한 HyperCLOVA X 호출 (시스템 프롬프트 없이)
     """
     try:
-        response = requests.post(
+        response = _SESSION.post(
             CLOVA_STUDIO_URL,
-            headers={
-                'Authorization': f'Bearer {CLOVA_API_KEY}',
-                'Content-Type': 'application/json',
-                'X-NCP-CLOVASTUDIO-REQUEST-ID': str(uuid.uuid4())
-            },
-            json={
-                'messages': [
-                    {'role': 'user', 'content': prompt}
-                ],
-                'topP': 0.6,
-                'topK': 0,
-                'maxTokens': 500,
-                'temperature': 0.1,
-                'repeatPenalty': 1.2,
-                'stopBefore': [],
-                'includeAiFilters': True
-            },
+            headers=_clova_headers(),
+            data=_dump_body(_simple_request_body(prompt, max_tokens, ai_filters)),
             timeout=30
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = ujson.loads(response.content)
             content = result['result']['message']['content']
             return content
         else:
-            print(f"[ERROR] LLM 호출 실패: {response.status_code}")
+            logger.error("LLM 호출 실패: %s", response.status_code)
             return ""
             
     except Exception as e:
-        print(f"[ERROR] LLM 호출 실패: {e}")
+        logger.error("LLM 호출 실패: %s", e)
+        return ""
+
+# ============================================================
+# 비동기 호출 (FastAPI 이벤트 루프에서 await)
+# ============================================================
+
+_async_client = None
+
+def _get_async_client():
+    """공유 httpx.AsyncClient (첫 사용 시 생성, keep-alive 연결 재사용)"""
+    global _async_client
+    if _async_client is None:
+        import httpx
+        _async_client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=16),
+        )
+    return _async_client
+
+async def close_llm_client():
+    """종료 시 비동기 HTTP 클라이언트 정리"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+# 동시 호출 제어
+# - 같은 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 기다림 (동시 접속 시 같은 질문 몰림)
+# - 전체 동시 호출 수는 CLOVA 처리율 제한에 맞춰 제한
+LLM_MAX_CONCURRENCY = 8
+_llm_semaphore = None
+_inflight_simple = {}  # {(prompt, max_tokens, ai_filters): Task}
+
+def _get_llm_semaphore():
+    """이벤트 루프 안에서 처음 사용할 때 생성"""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _llm_semaphore
+
+async def call_hyperclova_simple_async(prompt: str, max_tokens: int = MAX_TOKENS_DEFAULT, ai_filters: bool = True) -> str:
+    """call_hyperclova_simple의 비동기 버전 (대기 중에도 다른 요청 처리)"""
+    key = (prompt, max_tokens, ai_filters)
+    task = _inflight_simple.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_post_simple_async(prompt, max_tokens, ai_filters))
+        _inflight_simple[key] = task
+        task.add_done_callback(lambda _t: _inflight_simple.pop(key, None))
+    else:
+        logger.debug("진행 중인 동일 LLM 호출 결과 공유")
+    
+    # 기다리던 요청 하나가 취소돼도 같은 호출을 기다리는 다른 요청에는 영향 없도록
+    return await asyncio.shield(task)
+
+async def _post_simple_async(prompt: str, max_tokens: int, ai_filters: bool) -> str:
+    """실제 HTTP 호출 (동시 호출 수 제한)"""
+    try:
+        async with _get_llm_semaphore():
+            response = await _get_async_client().post(
+                CLOVA_STUDIO_URL,
+                headers=_clova_headers(),
+                content=_dump_body(_simple_request_body(prompt, max_tokens, ai_filters)),
+            )
+        
+        if response.status_code == 200:
+            result = ujson.loads(response.content)
+            return result['result']['message']['content']
+        else:
+            logger.error("LLM 호출 실패: %s", response.status_code)
+            return ""
+            
+    except Exception as e:
+        logger.error("LLM 호출 실패: %s", e)
         return ""
     
 def answer_meeting_question(meeting_content: dict, question: str) -> str:
@@ -471,8 +804,6 @@ def answer_meeting_question(meeting_content: dict, question: str) -> str:
     Returns:
         답변
     """
-    from datetime import datetime
-    
     # 날짜 포맷팅
     scheduled_at = meeting_content.get('scheduled_at', '알 수 없음')
     if isinstance(scheduled_at, datetime):
@@ -505,13 +836,11 @@ def answer_meeting_question(meeting_content: dict, question: str) -> str:
 """
     
     try:
-        response = call_hyperclova_simple(prompt)
+        response = call_hyperclova_simple(prompt, MAX_TOKENS_SHORT_ANSWER)
         return response.strip()
     
     except Exception as e:
-        logger.error(f"RAG 답변 생성 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"RAG 답변 생성 실패: {e}")
         return "죄송해요, 답변 생성 중 오류가 발생했어요. 😢"
     
 
@@ -526,8 +855,6 @@ def answer_with_context(user_query: str, context: dict) -> str:
     Returns:
         답변
     """
-    from datetime import datetime
-    
     # 컨텍스트 정보 포맷팅
     context_info = ""
     
@@ -584,7 +911,7 @@ def answer_with_context(user_query: str, context: dict) -> str:
 """
     
     try:
-        response = call_hyperclova_simple(prompt)
+        response = call_hyperclova_simple(prompt, MAX_TOKENS_SHORT_ANSWER)
         return response.strip()
     
     except Exception as e:
@@ -603,46 +930,23 @@ def classify_query_intent(user_query: str, meeting_title: str) -> str:
     Returns:
         "RAG" | "NEW_SEARCH" | "CONTEXT_DEPENDENT"
     """
-    prompt = f"""사용자가 이전에 선택한 회의: "{meeting_title}"
-사용자 질문: "{user_query}"
-
-질문의 의도를 다음 중 하나로 분류하세요:
-
-1. **RAG** (선택한 회의 내용에 대한 상세 질문)
-   - 회의 내용, 결정사항, 참석자, 예산, 시간, 분위기 등을 물어보는 경우
-   - 예시: "예산이 얼마야?", "누가 참석했어?", "어떤 결정 했어?", "몇 시간 진행됐어?", "주요 내용은?", "어떤 걸로 하기로 했어?", "왜 선택했어?"
-   
-2. **NEW_SEARCH** (새로운 회의 검색)
-   - 다른 회의를 찾거나 전체 회의 목록을 요청하는 경우
-   - 예시: "다른 회의 뭐있어?", "API 회의 찾아줘", "11월 회의 보여줘", "전체 회의 목록"
-   
-3. **CONTEXT_DEPENDENT** (선택한 회의 관련 확장 질문)
-   - 할일, 담당자, 참석 여부 등 선택한 회의의 부가 정보를 물어보는 경우
-   - 예시: "내 할일은?", "다른 사람 할일은?", "누가 담당해?", "그거 맞지?"
-
-**중요 규칙:**
-- 의문사(어떤, 왜, 얼마, 어떻게, 무엇, 누가 등)로 시작하는 질문은 대부분 **RAG**
-- "회의" 키워드가 있으면서 검색 동사(뭐있어, 찾아, 보여줘)가 있으면 **NEW_SEARCH**
-- "할일", "담당", "맡은" 키워드가 있으면 **CONTEXT_DEPENDENT**
-
-답변 형식: RAG 또는 NEW_SEARCH 또는 CONTEXT_DEPENDENT (하나만 출력, 다른 설명 없이)
-"""
+    prompt = f'사용자가 이전에 선택한 회의: "{meeting_title}"\n사용자 질문: "{user_query}"\n' + _CLASSIFY_INTENT_PROMPT_TAIL
     
     try:
-        response = call_hyperclova_simple(prompt)
+        response = call_hyperclova_simple(prompt, MAX_TOKENS_CLASSIFY, ai_filters=False)
         intent = response.strip().upper()
         
         # 유효성 검사
         if intent in ["RAG", "NEW_SEARCH", "CONTEXT_DEPENDENT"]:
-            print(f"[LLM 의도 분류] '{user_query}' → {intent}")
+            logger.debug("[LLM 의도 분류] '%s' → %s", user_query, intent)
             return intent
         else:
             # 기본값: 질문형이면 RAG, 아니면 NEW_SEARCH
             if user_query.strip().endswith('?') or any(user_query.endswith(e) for e in ['야', '니', '나', '까']):
-                print(f"[LLM 의도 분류 실패] 기본값 → RAG (질문형)")
+                logger.warning("[LLM 의도 분류 실패] 기본값 → RAG (질문형)")
                 return "RAG"
             else:
-                print(f"[LLM 의도 분류 실패] 기본값 → NEW_SEARCH")
+                logger.warning("[LLM 의도 분류 실패] 기본값 → NEW_SEARCH")
                 return "NEW_SEARCH"
     
     except Exception as e:
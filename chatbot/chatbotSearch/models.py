@@ -1,9 +1,36 @@
 """
 Pydantic 데이터 모델
 """
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from typing import List, Optional
 
+# history 메시지 role 값
+ROLE_USER = 'user'
+ROLE_ASSISTANT = 'assistant'
+
+# ============================================================
+# 답변 종류 판단 (history의 어시스턴트 답변 본문 기준)
+# ============================================================
+
+def classify_response_kind(content: str) -> str:
+    """어시스턴트 답변 본문 → 'task' | 'meeting_detail' | 'task_meeting_detail' | 'other'"""
+    is_task = '할 일' in content or '담당:' in content
+    is_meeting_detail = '📌' in content and '회의' in content
+
+    if is_task and is_meeting_detail:
+        return 'task_meeting_detail'
+    if is_task:
+        return 'task'
+    if is_meeting_detail:
+        return 'meeting_detail'
+    return 'other'
+
+def get_response_kind(message: dict) -> str:
+    """history 메시지의 답변 종류 (클라이언트가 보낸 값이므로 태그는 믿지 않고 항상 본문으로 판단)"""
+    if message.get('role') != ROLE_ASSISTANT:
+        return 'other'
+    return classify_response_kind(message.get('content', ''))
+
 class ChatRequest(BaseModel):
     message: str
     history: List[dict] = []
@@ -13,9 +40,20 @@ class ChatRequest(BaseModel):
     user_name: str                        # 필수 (로그인했으므로)
 
 class ChatResponse(BaseModel):
-    model_config = ConfigDict(exclude_none=True)  # None 필드 제외
-    
+    # 응답 스키마(OpenAPI 문서)용, 실제 전송 본문은 chat_response_content로 None 필드를 뺀 dict
     answer: str
     source: str
     history: Optional[List[dict]] = None
-    session_id: Optional[str] = None
\ No newline at end of file
+    session_id: Optional[str] = None
+
+def chat_response_content(response: ChatResponse) -> dict:
+    """
+    응답 전송용 dict (None 필드 제외)
+    - model_dump/response_model 재검증 없이 필드만 바로 꺼내 직렬화 비용 절감
+    """
+    content = {'answer': response.answer, 'source': response.source}
+    if response.history is not None:
+        content['history'] = response.history
+    if response.session_id is not None:
+        content['session_id'] = response.session_id
+    return content
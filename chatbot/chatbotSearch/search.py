@@ -9,9 +9,10 @@
 """
 import re
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+from functools import lru_cache
 from .database import get_db_connection
-from .config import ENABLE_PERSONA
+from .config import ENABLE_PERSONA, ENABLE_FULLTEXT_SEARCH, FULLTEXT_NGRAM_TOKEN_SIZE
 from .formatting import format_single_meeting, format_single_meeting_with_persona, format_my_tasks, format_meeting_tasks, format_assignee_tasks
 
 logger = logging.getLogger(__name__)
@@ -19,13 +20,15 @@ logger = logging.getLogger(__name__)
 # ============================================================
 # 조사 처리 함수
 # ============================================================
+_JOSA_EUN_RE = re.compile('오늘|어제|내일|모레')
+
 def get_location_josa(date_str):
     """날짜 표현에 맞는 위치 조사 반환"""
     if not date_str:
         return date_str
     
     # "은" 사용 (오늘, 어제, 내일, 모레)
-    if any(x in date_str for x in ['오늘', '어제', '내일', '모레']):
+    if _JOSA_EUN_RE.search(date_str):
         return f"{date_str}은"
     
     # "에는" 사용 (나머지: 이번주, 이번달, 10월, 10월 20일 등)
@@ -36,7 +39,40 @@ def get_location_josa(date_str):
 # 날짜 파싱
 # ============================================================
 
+# 날짜 패턴 (모듈 로드 시 한 번만 컴파일)
+# 여러 패턴을 하나의 정규식으로 합쳐 쿼리를 한 번만 스캔 (어느 분기인지는 그룹으로 판별)
+# - 10월 27일부터 10월 31일까지 / 10월 27일부터 오늘(까지) / 10월 27일 - 10월 31일 / 10월 27일 ~ 오늘
+_DAY_RANGE_RE = re.compile(
+    r'(?P<sm>\d{1,2})월\s*(?P<sd>\d{1,2})일\s*(?:부터|[-~])\s*'
+    r'(?:(?P<em>\d{1,2})월\s*(?P<ed>\d{1,2})일|(?P<today>오늘))'
+)
+# 하루의 시작/끝 시각 (microsecond까지 명시해서 호출 시각과 무관한 값으로)
+_MIDNIGHT_KWARGS = {'hour': 0, 'minute': 0, 'second': 0, 'microsecond': 0}
+_EOD_KWARGS = {'hour': 23, 'minute': 59, 'second': 59, 'microsecond': 0}
+_ONE_DAY = timedelta(days=1)
+
+_MONTH_ONLY_RE = re.compile(r'(\d{1,2})월')
+# 숫자 날짜 표현("N월") 존재 여부 - 없으면 아래 정규식 패턴은 전부 건너뜀
+_HAS_NUMERIC_DATE_RE = re.compile(r'\d월')
+_MONTH_DAY_GUARD_RE = re.compile(r'\d{1,2}월\s*\d{1,2}일')
+# 2025년 1월 15일 / 1월 15일 (연도 생략 시 올해)
+_DATE_RE = re.compile(r'(?:(?P<year>\d{4})년\s*)?(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일')
+# 11월~12월 / 11월부터 12월까지
+_MONTH_RANGE_RE = re.compile(
+    r'(?P<sm>\d{1,2})월(?:\s*~\s*(?P<em>\d{1,2})월|부터\s*(?P<em2>\d{1,2})월까지)'
+)
+
+# 같은 쿼리("오늘 회의", "이번주 회의 알려줘" 등)가 반복되므로 결과 캐시
+# - 상대 날짜("오늘", "이번주")와 연도 없는 날짜가 오늘 기준이라 날짜를 캐시 키에 포함
+@lru_cache(maxsize=4096)
+def _parse_date_cached(query: str, day: date) -> dict:
+    return _parse_date_from_query(query)
+
 def parse_date_from_query(query: str) -> dict:
+    """쿼리에서 날짜 정보 추출 (캐시 사용, 호출자가 수정해도 되도록 복사본 반환)"""
+    return dict(_parse_date_cached(query, date.today()))
+
+def _parse_date_from_query(query: str) -> dict:
     """
     쿼리에서 날짜 정보 추출
     
@@ -56,187 +92,118 @@ def parse_date_from_query(query: str) -> dict:
     }
     
     today = datetime.now()
+    today_start = today.replace(**_MIDNIGHT_KWARGS)
+    today_end = today.replace(**_EOD_KWARGS)
+    
+    # 모든 범위/절대 날짜 패턴은 "N월"을 포함하므로 한 번만 검사
+    has_numeric_date = _HAS_NUMERIC_DATE_RE.search(query) is not None
     
     # ========== 1. 범위 패턴 (최우선!) ==========
     # "N월 N일부터 ~ 까지" 범위 패턴
-    range_patterns = [
-        r'(\d{1,2})월\s*(\d{1,2})일\s*부터\s*(\d{1,2})월\s*(\d{1,2})일',
-        r'(\d{1,2})월\s*(\d{1,2})일\s*부터\s*오늘(?:까지)?',
-        r'(\d{1,2})월\s*(\d{1,2})일\s*[-~]\s*(\d{1,2})월\s*(\d{1,2})일',
-        r'(\d{1,2})월\s*(\d{1,2})일\s*[-~]\s*오늘',
-    ]
-    
-    for pattern in range_patterns:
-        match = re.search(pattern, query)
-        if match:
-            groups = match.groups()
+    for match in (_DAY_RANGE_RE.finditer(query) if has_numeric_date else ()):
+        start_month = int(match.group('sm'))
+        start_day = int(match.group('sd'))
+        year = today.year
+        
+        try:
+            start_date = datetime(year, start_month, start_day, 0, 0, 0)
             
             # "N월 N일부터 오늘" 패턴
-            if '오늘' in match.group(0):
-                start_month = int(groups[0])
-                start_day = int(groups[1])
-                year = today.year
-                
-                try:
-                    start_date = datetime(year, start_month, start_day, 0, 0, 0)
-                    end_date = today.replace(hour=23, minute=59, second=59)
-                    
-                    result['type'] = 'range'
-                    result['start_date'] = start_date
-                    result['end_date'] = end_date
-                    result['original'] = f'{start_month}월 {start_day}일부터 오늘'
-                    return result
-                except ValueError:
-                    pass
+            if match.group('today'):
+                end_date = today_end
+                original = f'{start_month}월 {start_day}일부터 오늘'
             else:
                 # "N월 N일부터 M월 M일" 패턴
-                start_month, start_day, end_month, end_day = map(int, groups)
-                year = today.year
-                
-                try:
-                    start_date = datetime(year, start_month, start_day, 0, 0, 0)
-                    end_date = datetime(year, end_month, end_day, 23, 59, 59)
-                    
-                    result['type'] = 'range'
-                    result['start_date'] = start_date
-                    result['end_date'] = end_date
-                    result['original'] = f'{start_month}월 {start_day}일부터 {end_month}월 {end_day}일'
-                    return result
-                except ValueError:
-                    pass
+                end_month = int(match.group('em'))
+                end_day = int(match.group('ed'))
+                end_date = datetime(year, end_month, end_day, 23, 59, 59)
+                original = f'{start_month}월 {start_day}일부터 {end_month}월 {end_day}일'
+            
+            result['type'] = 'range'
+            result['start_date'] = start_date
+            result['end_date'] = end_date
+            result['original'] = original
+            return result
+        except ValueError:
+            pass
     
     # ========== 2. 상대적 날짜 ==========
     # "오늘"
     if '오늘' in query:
         result['type'] = 'relative'
-        result['start_date'] = today.replace(hour=0, minute=0, second=0)
-        result['end_date'] = today.replace(hour=23, minute=59, second=59)
+        result['start_date'] = today_start
+        result['end_date'] = today_end
         result['original'] = '오늘'
         return result
     
     # "어제"
     if '어제' in query:
-        yesterday = today - timedelta(days=1)
         result['type'] = 'relative'
-        result['start_date'] = yesterday.replace(hour=0, minute=0, second=0)
-        result['end_date'] = yesterday.replace(hour=23, minute=59, second=59)
+        result['start_date'] = today_start - _ONE_DAY
+        result['end_date'] = today_end - _ONE_DAY
         result['original'] = '어제'
         return result
     
     # "이번주"
     if '이번주' in query or '이번 주' in query:
-        start_of_week = today - timedelta(days=today.weekday())
-        end_of_week = start_of_week + timedelta(days=6)
+        weekday = today.weekday()
         result['type'] = 'relative'
-        result['start_date'] = start_of_week.replace(hour=0, minute=0, second=0)
-        result['end_date'] = end_of_week.replace(hour=23, minute=59, second=59)
+        result['start_date'] = today_start - timedelta(days=weekday)
+        result['end_date'] = today_end + timedelta(days=6 - weekday)
         result['original'] = '이번주'
         return result
     
     # "지난주"
     if '지난주' in query or '지난 주' in query or '저번주' in query or '저번 주' in query:
-        start_of_last_week = today - timedelta(days=today.weekday() + 7)
-        end_of_last_week = start_of_last_week + timedelta(days=6)
+        weekday = today.weekday()
         result['type'] = 'relative'
-        result['start_date'] = start_of_last_week.replace(hour=0, minute=0, second=0)
-        result['end_date'] = end_of_last_week.replace(hour=23, minute=59, second=59)
+        result['start_date'] = today_start - timedelta(days=weekday + 7)
+        result['end_date'] = today_end - timedelta(days=weekday + 1)
         result['original'] = '지난주'
         return result
     
     # "이번달"
     if '이번달' in query or '이번 달' in query:
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0)
         if today.month == 12:
-            end_of_month = today.replace(month=12, day=31, hour=23, minute=59, second=59)
+            end_of_month = today_end.replace(day=31)
         else:
-            next_month = today.replace(month=today.month + 1, day=1)
-            end_of_month = (next_month - timedelta(days=1)).replace(hour=23, minute=59, second=59)
+            end_of_month = today_end.replace(month=today.month + 1, day=1) - _ONE_DAY
         result['type'] = 'relative'
-        result['start_date'] = start_of_month
+        result['start_date'] = today_start.replace(day=1)
         result['end_date'] = end_of_month
         result['original'] = '이번달'
         return result
     
     # "지난달"
     if '지난달' in query or '지난 달' in query or '저번달' in query or '저번 달' in query:
-        if today.month == 1:
-            last_month = today.replace(year=today.year - 1, month=12, day=1)
-        else:
-            last_month = today.replace(month=today.month - 1, day=1)
-        
-        start_of_last_month = last_month.replace(hour=0, minute=0, second=0)
-        end_of_last_month = (today.replace(day=1) - timedelta(days=1)).replace(hour=23, minute=59, second=59)
+        # 이번 달 1일 하루 전 = 지난달 말일
+        end_of_last_month = today_end.replace(day=1) - _ONE_DAY
         result['type'] = 'relative'
-        result['start_date'] = start_of_last_month
+        result['start_date'] = today_start.replace(year=end_of_last_month.year, month=end_of_last_month.month, day=1)
         result['end_date'] = end_of_last_month
         result['original'] = '지난달'
         return result
     
     # "최근" (지난 7일)
     if '최근' in query or '요즘' in query:
-        last_week = today - timedelta(days=14)
         result['type'] = 'relative'
-        result['start_date'] = last_week.replace(hour=0, minute=0, second=0)
-        result['end_date'] = today.replace(hour=23, minute=59, second=59)
+        result['start_date'] = today_start - timedelta(days=14)
+        result['end_date'] = today_end
         result['original'] = '최근'
         result['recent_flag'] = True
         return result
     
+    # 숫자 날짜가 없으면 이후 정규식 검사 생략
+    if not has_numeric_date:
+        return result
+    
     # ========== 2. 절대적 날짜 ==========
     
-    # "N월 N일부터 ~ 까지" 범위 패턴 (최우선!)
-    range_patterns = [
-        r'(\d{1,2})월\s*(\d{1,2})일\s*부터\s*(\d{1,2})월\s*(\d{1,2})일',  # 10월 27일부터 10월 31일까지
-        r'(\d{1,2})월\s*(\d{1,2})일\s*부터\s*오늘(?:까지)?',  # 10월 27일부터 오늘(까지)
-        r'(\d{1,2})월\s*(\d{1,2})일\s*[-~]\s*(\d{1,2})월\s*(\d{1,2})일',  # 10월 27일 - 10월 31일
-        r'(\d{1,2})월\s*(\d{1,2})일\s*[-~]\s*오늘',  # 10월 27일 ~ 오늘
-    ]
-    
-    for pattern in range_patterns:
-        match = re.search(pattern, query)
-        if match:
-            groups = match.groups()
-            
-            # "N월 N일부터 오늘" 패턴
-            if '오늘' in match.group(0):
-                start_month = int(groups[0])
-                start_day = int(groups[1])
-                year = today.year
-                
-                try:
-                    start_date = datetime(year, start_month, start_day, 0, 0, 0)
-                    end_date = today.replace(hour=23, minute=59, second=59)
-                    
-                    result['type'] = 'range'
-                    result['start_date'] = start_date
-                    result['end_date'] = end_date
-                    result['original'] = f'{start_month}월 {start_day}일부터 오늘'
-                    return result
-                except ValueError:
-                    pass
-            else:
-                # "N월 N일부터 M월 M일" 패턴
-                start_month, start_day, end_month, end_day = map(int, groups)
-                year = today.year
-                
-                try:
-                    start_date = datetime(year, start_month, start_day, 0, 0, 0)
-                    end_date = datetime(year, end_month, end_day, 23, 59, 59)
-                    
-                    result['type'] = 'range'
-                    result['start_date'] = start_date
-                    result['end_date'] = end_date
-                    result['original'] = f'{start_month}월 {start_day}일부터 {end_month}월 {end_day}일'
-                    return result
-                except ValueError:
-                    pass
-                
     # "N월" 패턴 (예: "11월", "1월") - 전체 달
-    month_only_pattern = r'(\d{1,2})월'
-    month_match = re.search(month_only_pattern, query)
+    month_match = _MONTH_ONLY_RE.search(query)
     if month_match and '월' in query:
         # "N월 N일" 패턴이 아닌지 확인
-        if not re.search(r'\d{1,2}월\s*\d{1,2}일', query):
+        if not _MONTH_DAY_GUARD_RE.search(query):
             month = int(month_match.group(1))
             year = today.year
             
@@ -254,64 +221,49 @@ def parse_date_from_query(query: str) -> dict:
                 result['end_date'] = end_date
                 result['original'] = f'{month}월'
                 
-                print(f"[DEBUG] '{month}월' 감지 → {start_date.date()} ~ {end_date.date()}")
+                logger.debug("'%s월' 감지 → %s ~ %s", month, start_date.date(), end_date.date())
                 return result
             except ValueError:
                 pass
     
     # "1월 15일", "2025년 1월 15일"
-    date_patterns = [
-        (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', 'year-month-day'),
-        (r'(\d{1,2})월\s*(\d{1,2})일', 'month-day'),
-    ]
-    
-    for pattern, date_type in date_patterns:
-        match = re.search(pattern, query)
-        if match:
-            if date_type == 'year-month-day':
-                year, month, day = map(int, match.groups())
-            else:  # month-day
-                year = today.year
-                month, day = map(int, match.groups())
-            
-            try:
-                target_date = datetime(year, month, day)
-                result['type'] = 'absolute'
-                result['start_date'] = target_date.replace(hour=0, minute=0, second=0)
-                result['end_date'] = target_date.replace(hour=23, minute=59, second=59)
-                result['original'] = match.group(0)
-                return result
-            except ValueError:
-                pass
+    for match in _DATE_RE.finditer(query):
+        year = int(match.group('year')) if match.group('year') else today.year
+        month = int(match.group('month'))
+        day = int(match.group('day'))
+        
+        try:
+            target_date = datetime(year, month, day)
+            result['type'] = 'absolute'
+            result['start_date'] = target_date  # datetime(y, m, d)는 이미 자정
+            result['end_date'] = target_date.replace(**_EOD_KWARGS)
+            result['original'] = match.group(0)
+            return result
+        except ValueError:
+            pass
     
     # ========== 3. 기간 검색 ==========
-    range_patterns = [
-        r'(\d{1,2})월\s*~\s*(\d{1,2})월',
-        r'(\d{1,2})월부터\s*(\d{1,2})월까지',
-    ]
-    
-    for pattern in range_patterns:
-        match = re.search(pattern, query)
-        if match:
-            start_month, end_month = map(int, match.groups())
-            year = today.year
+    for match in _MONTH_RANGE_RE.finditer(query):
+        start_month = int(match.group('sm'))
+        end_month = int(match.group('em') or match.group('em2'))
+        year = today.year
+        
+        try:
+            start_date = datetime(year, start_month, 1, 0, 0, 0)
             
-            try:
-                start_date = datetime(year, start_month, 1, 0, 0, 0)
-                
-                if end_month == 12:
-                    end_date = datetime(year, 12, 31, 23, 59, 59)
-                else:
-                    next_month = datetime(year, end_month + 1, 1)
-                    end_date = (next_month - timedelta(days=1)).replace(hour=23, minute=59, second=59)
-                
-                result['type'] = 'range'
-                result['start_date'] = start_date
-                result['end_date'] = end_date
-                result['original'] = match.group(0)
-                return result
-            except ValueError:
-                pass
+            if end_month == 12:
+                end_date = datetime(year, 12, 31, 23, 59, 59)
+            else:
+                next_month = datetime(year, end_month + 1, 1)
+                end_date = (next_month - timedelta(days=1)).replace(hour=23, minute=59, second=59)
+            
+            result['type'] = 'range'
+            result['start_date'] = start_date
+            result['end_date'] = end_date
+            result['original'] = match.group(0)
+            return result
+        except ValueError:
+            pass
     
     # 날짜 정보 없음
     return result
@@ -320,6 +272,29 @@ def parse_date_from_query(query: str) -> dict:
 # 상태 파싱
 # ============================================================
 
+# 과거형/미래형 어미 패턴 (카테고리마다 정규식 하나, 문장 끝 어미는 공통 "?$" 앞에 묶음)
+_PAST_TENSE_RE = re.compile(
+    r'(?:했어|있었어|였어|더라|했나|있었나|였나|됐어|했는지|있었는지)\??$'  # 했어? 있었나 됐어 했는지?
+    r'|(?:였던|했던)\s'                                                       # 였던 / 했던 + 공백
+)
+_FUTURE_TENSE_RE = re.compile(
+    r'(?:할\s*거야|할까|있을까|될까)\??$'  # 할 거야? 할까? 있을까? 될까?
+    r'|(?:할|있을)\s*예정'                 # 할 예정 / 있을 예정
+)
+
+def _keyword_alternation(keywords: list):
+    """키워드 중 하나라도 포함되면 매치되는 패턴 (긴 키워드 우선)"""
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+# 명시적 상태 키워드 (우선순위 순서, 카테고리마다 search 한 번)
+_STATUS_KEYWORD_RES = [
+    ('SCHEDULED', '예정', _keyword_alternation(['예정', '예정된', '앞으로', '다가오는', '예약', '예약된', '미래', '다음'])),
+    ('COMPLETED', '완료', _keyword_alternation(['완료', '완료된', '끝난', '지난', '과거', '했던', '했었던'])),
+    ('RECORDING', '진행중', _keyword_alternation(['진행중', '진행 중', '현재', '녹화중', '녹화 중', '진행되는', '하는 중'])),
+    ('CANCELLED', '취소', _keyword_alternation(['취소', '취소된', '무산', '무산된'])),
+]
+
+@lru_cache(maxsize=4096)
 def parse_status_from_query(query: str) -> str:
     """
     쿼리에서 회의 상태 추출
@@ -334,61 +309,20 @@ def parse_status_from_query(query: str) -> str:
     query_lower = query.lower()
     
     # ========== 과거형 어미 패턴 (우선순위 1) ==========
-    past_tense_patterns = [
-        r'했어\??$',      # 했어? 했어
-        r'있었어\??$',    # 있었어? 있었어
-        r'였어\??$',      # 였어? 였어
-        r'더라\??$',      # 더라? 더라
-        r'했나\??$',      # 했나? 했나
-        r'있었나\??$',    # 있었나? 있었나
-        r'였나\??$',      # 였나? 였나
-        r'됐어\??$',      # 됐어? 됐어
-        r'했는지\??$',    # 했는지? 했는지
-        r'있었는지\??$',  # 있었는지? 있었는지
-        r'였던\s',        # 였던
-        r'했던\s',        # 했던
-    ]
-    
-    for pattern in past_tense_patterns:
-        if re.search(pattern, query_lower):
-            print(f"[DEBUG] 상태 필터: COMPLETED (과거형 어미 감지)")
-            return 'COMPLETED'
+    if _PAST_TENSE_RE.search(query_lower):
+        logger.debug("상태 필터: COMPLETED (과거형 어미 감지)")
+        return 'COMPLETED'
     
     # ========== 미래형 어미 패턴 (우선순위 2) ==========
-    future_tense_patterns = [
-        r'할\s*거야\??$',   # 할 거야? 할거야?
-        r'할까\??$',        # 할까?
-        r'있을까\??$',      # 있을까?
-        r'될까\??$',        # 될까?
-        r'할\s*예정',       # 할 예정
-        r'있을\s*예정',     # 있을 예정
-    ]
-    
-    for pattern in future_tense_patterns:
-        if re.search(pattern, query_lower):
-            print(f"[DEBUG] 상태 필터: SCHEDULED (미래형 어미 감지)")
-            return 'SCHEDULED'
-    
-    # ========== 명시적 키워드 (우선순위 3) ==========
-    scheduled_keywords = ['예정', '예정된', '앞으로', '다가오는', '예약', '예약된', '미래', '다음']
-    if any(kw in query_lower for kw in scheduled_keywords):
-        print(f"[DEBUG] 상태 필터: SCHEDULED (예정)")
+    if _FUTURE_TENSE_RE.search(query_lower):
+        logger.debug("상태 필터: SCHEDULED (미래형 어미 감지)")
         return 'SCHEDULED'
     
-    completed_keywords = ['완료', '완료된', '끝난', '지난', '과거', '했던', '했었던']
-    if any(kw in query_lower for kw in completed_keywords):
-        print(f"[DEBUG] 상태 필터: COMPLETED (완료)")
-        return 'COMPLETED'
-    
-    recording_keywords = ['진행중', '진행 중', '현재', '녹화중', '녹화 중', '진행되는', '하는 중']
-    if any(kw in query_lower for kw in recording_keywords):
-        print(f"[DEBUG] 상태 필터: RECORDING (진행중)")
-        return 'RECORDING'
-    
-    cancelled_keywords = ['취소', '취소된', '무산', '무산된']
-    if any(kw in query_lower for kw in cancelled_keywords):
-        print(f"[DEBUG] 상태 필터: CANCELLED (취소)")
-        return 'CANCELLED'
+    # ========== 명시적 키워드 (우선순위 3) ==========
+    for status, label, pattern in _STATUS_KEYWORD_RES:
+        if pattern.search(query_lower):
+            logger.debug("상태 필터: %s (%s)", status, label)
+            return status
     
     return None
 
@@ -396,157 +330,247 @@ def parse_status_from_query(query: str) -> str:
 # 키워드 추출
 # ============================================================
 
+# 정규식 없이 비교하는 단어 불용어 (토큰 전체가 일치할 때만, set 조회 한 번으로 판단)
+_STOPWORDS = frozenset({
+    # ========== 시간/기간 표현 ==========
+    '동안', '사이', '중', '때', '무렵', '경', '쯤', '간', '시', '분', '초',
+    
+    # ========== 지시어/대명사 ==========
+    '이렇게', '그렇게', '저렇게', '어떻게',
+    
+    # ========== 부사 (정도/양태) ==========
+    '좀', '약간', '조금', '많이', '아주', '완전', '정말', '진짜', '매우', '꽤', '제법', '대단히', '상당히', '굉장히', '엄청', '너무', '되게', '무척', '퍽', '참',
+    '아마', '혹시', '만약', '절대', '결코', '전혀', '별로',
+    '빨리', '천천히', '갑자기', '슬슬', '서서히',
+    
+    # ========== 접속사/연결어 ==========
+    '그리고', '그러나', '하지만', '그런데', '근데', '그래서', '따라서', '그러므로', '그렇지만', '그치만',
+    '그럼', '그래', '그치', '맞아', '맞지', '응', '네', '예', '아니',
+    
+    # ========== 요청/명령 동사 ==========
+    '줘', '아줘', '해줘',  # 오타 처리용
+    
+    # ========== 존재/상태 동사 ==========
+    '있어', '없어', '없나', '없니',  # '있어', '없어' 단독 제거
+    
+    # ========== 의문/추측 ==========
+    '건가', '건지', '거나', '거든', '거야', '걸까',
+    
+    # ========== 기타 불용어 ==========
+    '관련', '대해', '관해', '대한', '관한',
+    '내용', '정보', '사항', '항목', '자료', '데이터',
+    '전부', '모두', '다', '전체', '모든', '각', '모',
+    '하나', '둘', '셋', '여러', '몇몇',
+    '위해', '위한', '대로', '만큼', '처럼',
+})
+
+# 불용어 어미/조사 (토큰이 이 중 하나로 끝나고 앞에 한 글자 이상 있으면 불용어, 기존 '.+(...)$' 패턴)
+_MEANINGLESS_SUFFIXES = [
+    # ========== 동사/형용사 어미 (과거/현재/미래) ==========
+    '었어', '었나', '었니', '었는지', '었을까', '었을', '었던',
+    '있어', '있나', '있니', '있는지', '있을까', '있을', '있는', '있던',
+    '했어', '했나', '했니', '했는지', '했을까', '했을', '했던', '함',
+    '이야', '이니', '인지', '일까', '인가', '이었', '이었어',
+    '하는', '하니', '할까', '할지', '하지', '한', '하던',
+    '되는', '되니', '될까', '될지', '되지', '된', '되던',
+    '나', '니', '지', '까', '가', '냐', '냐고',
+    '개야', '번이야', '거야', '거니', '뭐야', '뭔가', '뭐지', '있어',
+    
+    # ========== 조사 (모든 조사) ==========
+    '가', '이', '은', '는', '을', '를', '에', '의', '와', '과', '로', '으로', '부터', '까지', '만', '도', '조차', '마저', '부터', '한테', '께', '에게',
+    '라고', '이라고', '라는', '이라는', '처럼', '같이', '마냥', '듯이', '대로',
+    '에서', '에게', '한테서', '로부터',
+    '동안', '사이', '중', '까지',
+    
+    # ========== 회상/기억 ==========
+    '였더라', '였지', '더라', '였나', '였어', '였는지', '었더라', '었지',
+]
+
+def _build_suffix_trie(suffixes: list) -> dict:
+    """어미를 뒤집어서 trie로 (토큰 끝에서부터 한 글자씩 따라가며 검사)"""
+    root = {}
+    for suffix in suffixes:
+        node = root
+        for ch in reversed(suffix):
+            node = node.setdefault(ch, {})
+        node[''] = True  # 어미 끝 표시 (토큰 글자와 겹치지 않는 키)
+    return root
+
+_SUFFIX_TRIE = _build_suffix_trie(_MEANINGLESS_SUFFIXES)
+
+def _has_meaningless_suffix(token: str) -> bool:
+    """토큰이 불용어 어미/조사로 끝나는지 (어미 길이만큼만 거꾸로 따라감)"""
+    node = _SUFFIX_TRIE
+    # 첫 글자(인덱스 0)는 어미가 될 수 없음 (어미 앞에 한 글자 이상 필요)
+    for i in range(len(token) - 1, 0, -1):
+        node = node.get(token[i])
+        if node is None:
+            return False
+        if '' in node:
+            return True
+    return False
+
+# 의미 없는 패턴 (완전판!) - 단어/어미로 나눠 담기 어려운 나머지 형태 패턴
+_MEANINGLESS_PATTERNS = [
+    # ========== 날짜/시간 표현 ==========
+    r'^(오늘|어제|모레|그제|내일).*(은|는|에|의|도|만)?$',
+    r'^(이번주|지난주|다음주|저번주).*(은|는|에|의|도|만)?$',
+    r'^(이번달|지난달|다음달|저번달).*(은|는|에|의|도|만)?$',
+    r'^(최근|요즘|근래|최근에|요즘에).*(은|는|에|의)?$',
+    r'^(올해|작년|내년|재작년).*(은|는|에|의)?$',
+    r'^(이번|지난|다음|저번|그|이|저).*(주|달|년|해)$',
+    
+    # ========== 회의 관련 (단독 사용만 불용어) ==========
+    r'^(회의|미팅|회의록|세미나|워크샵)(가|이|은|는|을|를|에|의|있었|있나|였|인)?$',
+    
+    # ========== 상태/완료 ==========
+    r'^(예정|완료|진행|끝난|지난|과거|미래).*(된|되어|이|인|의)?$',
+    r'^(진행중|진행|완료|예정|끝).*(이|인)?$',
+    
+    # ========== 의문사 (모든 변형) ==========
+    r'^(뭐|무엇|무슨|어떤|어느).*(가|를|에|야|지|야|였지|였어|있었지|인지)?$',
+    r'^(언제|어디|누가|누구|왜|어떻게|어찌).*(가|를|에|서|인지)?$',
+    r'^(몇|얼마|어느).*(개|명|번|시|분|일|인지)?$',
+    
+    # ========== 시간/기간 표현 ==========
+    r'^(년|월|일|주).*(간|동안|사이|중|에|에는|에도)?$',
+    
+    # ========== 지시어/대명사 ==========
+    r'^(이|그|저|요|저것|이것|그것).*(가|이|은|는|을|를)?$',
+    r'^(여기|거기|저기|어디).*(서|에|로|가)?$',
+    
+    # ========== 요청/명령 동사 ==========
+    r'^(찾아|알려|보여|말해|설명|가르쳐|검색|얘기|이야기).*(줘|주세요|봐|주|줄래|주실래)?$',
+    
+    # ========== 존재/상태 동사 ==========
+    r'^(있|없|계시).+(어|었어|나|니|을까|는지|던|다|십니까)$',
+    r'^(하나|둘|셋|한개|두개|몇개).*(밖에|만|뿐)?$',  # 수량 표현
+    
+    # ========== 의문/추측 ==========
+    r'^(거|것|게).*(야|인가|인지|냐|까)?$',
+    
+    # ========== 회상/기억 ==========
+    r'^(기억|생각).*(나|안나|못|해|하니)?$',
+]
+# 토큰마다 패턴 수만큼 match를 돌리지 않도록 하나의 정규식으로 합침 (모듈 로드 시 한 번만 컴파일)
+# - match는 토큰 시작에서만 시도하므로 어느 하나라도 맞으면 매치 (기존 any()와 동일)
+_MEANINGLESS_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _MEANINGLESS_PATTERNS))
+
+# 토큰 추출 패턴 (한글 2글자 이상 / 영문·숫자, 두 문자 집합이 겹치지 않아 한 번의 스캔으로 분류)
+_TOKEN_SCANNER_RE = re.compile(r'(?P<kor>[가-힣]{2,})|(?P<en>[A-Za-z0-9]+)')
+_DATE_NUMBER_RE = re.compile(r'(\d+)\s*[월일년]')  # 뒤에 월/일/년이 붙은 숫자
+# 떼어내고 앞부분만 키워드로 쓰는 2글자 복합어 접미어 (예: '마케팅회의' → '마케팅')
+# 토큰 끝 2글자로 set 조회 한 번 (다른 길이의 접미어가 생기면 길이별 set을 추가)
+_COMPOUND_SUFFIXES_2 = frozenset({'회의', '관련'})
+# 날짜 관련 글자 (키워드에 하나라도 있으면 날짜 표현으로 보고 검색 키워드에서 제외)
+_DATE_CHAR_RE = re.compile('[일월주년]')
+_FILLER_KEYWORDS = frozenset({'있어', '없어', '뭐', '거', '것', '회의'})
+
+def _filter_search_keywords(keywords: list) -> list:
+    """완화 검색에 쓸 키워드만 남김 (불필요한 단어 + 날짜 표현 제외, 한 번의 순회로)"""
+    return [k for k in keywords if k not in _FILLER_KEYWORDS and not _DATE_CHAR_RE.search(k)]
+
+# 같은 질문이 검색/재검색/후속 질문에서 반복 추출되므로 결과 캐시
+@lru_cache(maxsize=1024)
+def _extract_keywords_cached(utterance: str) -> tuple:
+    return tuple(_extract_keywords_from_query(utterance))
+
 def extract_keywords_from_query(utterance):
+    """질문에서 키워드 추출 (캐시 사용, 호출자가 수정해도 되도록 새 list 반환)"""
+    return list(_extract_keywords_cached(utterance))
+
+# 토큰 종류는 한정적이라 (회의, 프로젝트, 있었어 ...) 판정 결과를 토큰 단위로 캐시
+@lru_cache(maxsize=4096)
+def _is_meaningless_token(token: str) -> bool:
+    """불용어 여부 (단어 set → 어미 trie → 나머지 정규식 순서로 싼 검사부터)"""
+    return (
+        token in _STOPWORDS
+        or _has_meaningless_suffix(token)
+        or _MEANINGLESS_RE.match(token) is not None
+    )
+
+def _extract_keywords_from_query(utterance):
     """질문에서 키워드 추출 (패턴 기반 - 완전판)"""
-    import re
-    
-    # 1. 한글 2글자 이상 추출
-    tokens = re.findall(r'[가-힣]{2,}', utterance)
-    
-    # 2. 영문/숫자 키워드 추출 (AI, Q4, CEO 등) - 날짜 숫자 제외!
-    english_tokens = re.findall(r'[A-Za-z0-9]+', utterance)
-    
-    for token in english_tokens:
-        # 숫자인 경우 날짜 패턴 체크 (앞뒤에 월/일/년이 있으면 스킵)
-        if token.isdigit():
-            if re.search(rf'{token}\s*[월일년]', utterance):
-                print(f"[DEBUG] 날짜 숫자 스킵: '{token}'")
-                continue
+    # 토큰 루프 안에서 매번 로깅 호출을 하지 않도록 한 번만 확인
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    removed = [] if debug_enabled else None
+    
+    # 토큰 추출 → 복합어 분리 → 불용어 제거 → 중복 제거를 한 번의 스캔으로
+    # - 한글 키워드가 영문/숫자 키워드보다 앞에 오도록 따로 모았다가 마지막에 합침
+    # - dict를 순서 있는 set으로 사용 (중복 제거)
+    korean_keywords = {}
+    english_keywords = {}
+    date_number_suffixes = None
+    
+    for match in _TOKEN_SCANNER_RE.finditer(utterance):
+        token = match.group()
         
-        # 영문 키워드 중 의미있는 것만 (2글자 이상 또는 대문자)
-        if len(token) >= 2:
-            tokens.append(token.upper())  # 대문자로 통일
-        elif token.isupper():  # 1글자여도 대문자면 약어로 간주
-            tokens.append(token)
-    
-    # ========== 복합어 전처리 (회의, 관련 분리) ==========
-    processed_tokens = []
-    for token in tokens:
-        if token.endswith('회의') and len(token) > 2:
-            base_word = token[:-2]
-            processed_tokens.append(base_word)
-            print(f"[DEBUG] 복합어 분리: '{token}' → '{base_word}'")
-        elif token.endswith('관련') and len(token) > 2:
-            base_word = token[:-2]
-            processed_tokens.append(base_word)
-            print(f"[DEBUG] 복합어 분리: '{token}' → '{base_word}'")
+        if match.lastgroup == 'kor':
+            # ========== 복합어 전처리 (회의, 관련 분리) ==========
+            if len(token) > 2 and token[-2:] in _COMPOUND_SUFFIXES_2:
+                base_word = token[:-2]
+                if debug_enabled:
+                    logger.debug("복합어 분리: '%s' → '%s'", token, base_word)
+                token = base_word
+            keywords = korean_keywords
         else:
-            processed_tokens.append(token)
-    
-    tokens = processed_tokens
-    
-    # 의미 없는 패턴 (완전판!)
-    meaningless_patterns = [
-        # ========== 날짜/시간 표현 ==========
-        r'^(오늘|어제|모레|그제|내일).*(은|는|에|의|도|만)?$',
-        r'^(이번주|지난주|다음주|저번주).*(은|는|에|의|도|만)?$',
-        r'^(이번달|지난달|다음달|저번달).*(은|는|에|의|도|만)?$',
-        r'^(최근|요즘|근래|최근에|요즘에).*(은|는|에|의)?$',
-        r'^(올해|작년|내년|재작년).*(은|는|에|의)?$',
-        r'^(이번|지난|다음|저번|그|이|저).*(주|달|년|해)$',
-        
-        # ========== 회의 관련 (단독 사용만 불용어) ==========
-        r'^(회의|미팅|회의록|세미나|워크샵)(가|이|은|는|을|를|에|의|있었|있나|였|인)?$',
-        
-        # ========== 상태/완료 ==========
-        r'^(예정|완료|진행|끝난|지난|과거|미래).*(된|되어|이|인|의)?$',
-        r'^(진행중|진행|완료|예정|끝).*(이|인)?$',
-        
-        # ========== 의문사 (모든 변형) ==========
-        r'^(뭐|무엇|무슨|어떤|어느).*(가|를|에|야|지|야|였지|였어|있었지|인지)?$',
-        r'^(언제|어디|누가|누구|왜|어떻게|어찌).*(가|를|에|서|인지)?$',
-        r'^(몇|얼마|어느).*(개|명|번|시|분|일|인지)?$',
-        
-        # ========== 동사/형용사 어미 (과거/현재/미래) ==========
-        r'.+(었어|었나|었니|었는지|었을까|었을|었던)$',
-        r'.+(있어|있나|있니|있는지|있을까|있을|있는|있던)$',
-        r'.+(했어|했나|했니|했는지|했을까|했을|했던|함)$',
-        r'.+(이야|이니|인지|일까|인가|이었|이었어)$',
-        r'.+(하는|하니|할까|할지|하지|한|하던)$',
-        r'.+(되는|되니|될까|될지|되지|된|되던)$',
-        r'.+(나|니|지|까|가|냐|냐고)$',
-        r'.+(개야|번이야|거야|거니|뭐야|뭔가|뭐지|있어)$',
-
-        # ========== 시간/기간 표현 ==========
-        r'^(동안|사이|중|때|무렵|경|쯤|간|시|분|초)$',
-        r'^(년|월|일|주).*(간|동안|사이|중|에|에는|에도)?$',
-        
-        # ========== 조사 (모든 조사) ==========
-        r'^.+(가|이|은|는|을|를|에|의|와|과|로|으로|부터|까지|만|도|조차|마저|부터|한테|께|에게)$',
-        r'^.+(라고|이라고|라는|이라는|처럼|같이|마냥|듯이|대로)$',
-        r'^.+(에서|에게|한테서|로부터)$',
-        r'^.+(동안|사이|중|까지)$',
-        
-        # ========== 지시어/대명사 ==========
-        r'^(이|그|저|요|저것|이것|그것).*(가|이|은|는|을|를)?$',
-        r'^(여기|거기|저기|어디).*(서|에|로|가)?$',
-        r'^(이렇게|그렇게|저렇게|어떻게)$',
-        
-        # ========== 부사 (정도/양태) ==========
-        r'^(좀|약간|조금|많이|아주|완전|정말|진짜|매우|꽤|제법|대단히|상당히|굉장히|엄청|너무|되게|무척|퍽|참)$',
-        r'^(아마|혹시|만약|절대|결코|전혀|별로)$',
-        r'^(빨리|천천히|갑자기|슬슬|서서히)$',
-        
-        # ========== 접속사/연결어 ==========
-        r'^(그리고|그러나|하지만|그런데|근데|그래서|따라서|그러므로|그렇지만|그치만)$',
-        r'^(그럼|그래|그치|맞아|맞지|응|네|예|아니)$',
-        
-        # ========== 요청/명령 동사 ==========
-        r'^(찾아|알려|보여|말해|설명|가르쳐|검색|얘기|이야기).*(줘|주세요|봐|주|줄래|주실래)?$',
-        r'^(줘|아줘|해줘)$',  # 오타 처리용
-
-        # ========== 존재/상태 동사 ==========
-        r'^(있|없|계시).+(어|었어|나|니|을까|는지|던|다|십니까)$',
-        r'^(있어|없어|없나|없니)$',  # '있어', '없어' 단독 제거
-        r'^(하나|둘|셋|한개|두개|몇개).*(밖에|만|뿐)?$',  # 수량 표현
-
-        # ========== 의문/추측 ==========
-        r'^(거|것|게).*(야|인가|인지|냐|까)?$',
-        r'^(건가|건지|거나|거든|거야|걸까)$',
-        
-        # ========== 회상/기억 ==========
-        r'.+(였더라|였지|더라|였나|였어|였는지|었더라|었지)$',
-        r'^(기억|생각).*(나|안나|못|해|하니)?$',
-        
-        # ========== 기타 불용어 ==========
-        r'^(관련|대해|관해|대한|관한)$',
-        r'^(내용|정보|사항|항목|자료|데이터)$',
-        r'^(전부|모두|다|전체|모든|각|모)$',
-        r'^(하나|둘|셋|여러|몇몇)$',
-        r'^(위해|위한|대로|만큼|처럼)$',
-    ]
-    
-    keywords = []
-    for token in tokens:
-        # 패턴 매치 확인
-        is_meaningless = any(
-            re.match(pattern, token) 
-            for pattern in meaningless_patterns
-        )
+            # 영문/숫자 키워드 (AI, Q4, CEO 등) - 날짜 숫자 제외!
+            if token.isdigit():
+                # "N월"의 N이 이 숫자로 끝나면 날짜 숫자 (예: '2025년'의 '25'도 포함)
+                # → 날짜 숫자의 모든 접미사를 set으로 한 번 만들어 두고 조회 한 번으로 판정
+                if date_number_suffixes is None:
+                    date_number_suffixes = {
+                        number[i:]
+                        for number in _DATE_NUMBER_RE.findall(utterance)
+                        for i in range(len(number))
+                    }
+                if token in date_number_suffixes:
+                    if debug_enabled:
+                        logger.debug("날짜 숫자 스킵: '%s'", token)
+                    continue
+            
+            # 영문 키워드 중 의미있는 것만 (2글자 이상 또는 대문자)
+            if len(token) >= 2:
+                token = token.upper()  # 대문자로 통일
+            elif not token.isupper():  # 1글자여도 대문자면 약어로 간주
+                continue
+            keywords = english_keywords
         
-        if not is_meaningless:
-            keywords.append(token)
-            print(f"[DEBUG] 추출된 키워드: '{token}'")
-        else:
-            print(f"[DEBUG] 불용어 제거: '{token}'")
+        if not _is_meaningless_token(token):
+            keywords[token] = None
+        elif debug_enabled:
+            removed.append(token)
     
-    # 중복 제거
-    keywords = list(dict.fromkeys(keywords))
+    for token in english_keywords:
+        korean_keywords.setdefault(token, None)
+    keywords = list(korean_keywords)
+    
+    if debug_enabled:
+        logger.debug("추출된 키워드: %s / 불용어 제거: %s", keywords, removed)
 
     return keywords
 
 # ============================================================
 # Lambda 응답 파싱
 # ============================================================
+
+_MEETING_COUNT_RE = re.compile(r'회의록\s*(\d+)개')
+_MEETING_SECTION_SEPARATOR = "━━━━━━━━━━━━━━━━━━━━━━"
+# 회의 섹션 필드 (필드마다 첫 번째 매치 사용)
+_MEETING_FIELD_RES = (
+    ('title', re.compile(r'📌\s*(.+)')),
+    ('date', re.compile(r'📅\s*날짜:\s*(.+)')),
+    ('description', re.compile(r'📝\s*설명:\s*(.+)')),
+    ('summary', re.compile(r'📋\s*요약:\s*(.+)')),
+)
+
 def parse_meeting_count(lambda_response: str) -> int:
     """Lambda 응답에서 회의 개수 추출"""
-    import re
-    
     # "회의록 3개를 찾았습니다" 패턴
-    match = re.search(r'회의록\s*(\d+)개', lambda_response)
+    match = _MEETING_COUNT_RE.search(lambda_response)
     if match:
         count = int(match.group(1))
-        print(f"[DEBUG] 회의 개수: {count}개")
+        logger.debug("회의 개수: %s개", count)
         return count
     
     # 못 찾으면 1개로 간주
@@ -557,7 +581,7 @@ def parse_meetings_list(lambda_response: str) -> list:
     meetings = []
     
     # 구분선으로 섹션 분리
-    sections = lambda_response.split("━━━━━━━━━━━━━━━━━━━━━━")
+    sections = lambda_response.split(_MEETING_SECTION_SEPARATOR)
     
     for section in sections:
         # 📌가 없으면 스킵 (헤더나 빈 섹션)
@@ -566,25 +590,11 @@ def parse_meetings_list(lambda_response: str) -> list:
             
         meeting = {}
         
-        # 제목 추출
-        title_match = re.search(r'📌\s*(.+)', section)
-        if title_match:
-            meeting['title'] = title_match.group(1).strip()
-        
-        # 날짜 추출
-        date_match = re.search(r'📅\s*날짜:\s*(.+)', section)
-        if date_match:
-            meeting['date'] = date_match.group(1).strip()
-        
-        # 설명 추출
-        desc_match = re.search(r'📝\s*설명:\s*(.+)', section)
-        if desc_match:
-            meeting['description'] = desc_match.group(1).strip()
-        
-        # 요약 추출
-        summary_match = re.search(r'📋\s*요약:\s*(.+)', section)
-        if summary_match:
-            meeting['summary'] = summary_match.group(1).strip()
+        # 제목/날짜/설명/요약 추출
+        for key, pattern in _MEETING_FIELD_RES:
+            match = pattern.search(section)
+            if match:
+                meeting[key] = match.group(1).strip()
         
         # 제목이 있으면 추가
         if meeting.get('title'):
@@ -597,71 +607,76 @@ def parse_meetings_list(lambda_response: str) -> list:
 # 페이지네이션 체크
 # ============================================================
 
+# 모듈 로드 시 한 번만 만들어 두고, 키워드와 패턴을 정규식 하나로 합쳐 search 한 번으로 검사
+_PAGINATION_KEYWORDS = (
+    '나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
+    '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
+    '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니',
+    '또뭐', '또있어', '나머', '남머', '나미', '더보',
+    '줘봐', '줘', '보여줘', '보여', '알려줘', '알려'
+)
+_PAGINATION_PATTERNS = (
+    r'나머.*',
+    r'남은.*',
+    r'더.*[보줘있알려]',
+    r'추가.*',
+    r'계속|이어서|다음',
+    r'또.*[있뭐어]',
+    r'그\s*외',
+    r'더\s*[보줘]',
+    r'줘\s*봐',
+    r'보여\s*줘',
+    r'알려\s*줘'
+)
+_PAGINATION_RE = re.compile('|'.join(
+    [re.escape(kw) for kw in _PAGINATION_KEYWORDS] + [f'(?:{p})' for p in _PAGINATION_PATTERNS]
+))
+
 def is_pagination_request(query: str) -> bool:
     """페이지네이션 요청 여부 확인"""
-    pagination_keywords = ['나머지', '나머지도', '남은', '남은거', '더', '더보기', '더보여',
-                          '더있어', '더줘', '더알려', '추가', '추가로', '계속', '이어서',
-                          '다음', '다른', '또', '그외', '외', '그밖', '더있나', '더있니',
-                          '또뭐', '또있어', '나머', '남머', '나미', '더보',
-                          '줘봐', '줘', '보여줘', '보여', '알려줘', '알려']
-    
-    pagination_patterns = [
-        r'나머.*',
-        r'남은.*',
-        r'더.*[보줘있알려]',
-        r'추가.*',
-        r'계속|이어서|다음',
-        r'또.*[있뭐어]',
-        r'그\s*외',
-        r'더\s*[보줘]',
-        r'줘\s*봐',
-        r'보여\s*줘',
-        r'알려\s*줘'
-    ]
-    
-    return (any(kw in query for kw in pagination_keywords) or
-            any(re.search(pattern, query) for pattern in pagination_patterns))
+    return _PAGINATION_RE.search(query) is not None
 
 # ============================================================
 # 오프토픽 체크
 # ============================================================
 
+# 키워드 목록마다 정규식 하나 (키워드 수만큼 `in` 검사 대신 search 한 번)
+_MEETING_KEYWORDS = [
+    '회의', '미팅', 'meeting', '회의록', '논의', '안건',
+    '참석', '참여', '발표', '설명', '결정', '합의',
+    '검토', '승인', '요약', 'discussion', '세미나', '워크샵'
+]
+_TASK_KEYWORDS = ['할 일', '할일', 'task', '업무', '맡은', '담당']
+# 회의/할 일 키워드는 둘 다 "오프토픽 아님"이므로 한 정규식으로 합쳐 한 번만 검사
+_ON_TOPIC_RE = _keyword_alternation(_MEETING_KEYWORDS + _TASK_KEYWORDS)
+_CONTEXT_PRONOUNS = ('그', '저', '이', '거기', '그거', '저거', '이거')
+_OFF_TOPIC_RE = _keyword_alternation([
+    '안녕', '안녕하세요', 'hello', 'hi', '뭐해', '심심',
+    '날씨', '요리', '맛집', '영화', '음악', '게임',
+    '뉴스', '스포츠', '주식', '부동산', '연애', '건강',
+    '농담', '사랑', '운동', '여행', '레시피', '음식'
+])
+
+@lru_cache(maxsize=4096)
 def is_off_topic_query(query: str) -> bool:
     """회의록과 무관한 질문인지 체크"""
     query_lower = query.lower().strip()
 
-    # ========== 1. 회의 관련 핵심 키워드 있으면 무조건 통과 ==========
-    meeting_keywords = [
-        '회의', '미팅', 'meeting', '회의록', '논의', '안건',
-        '참석', '참여', '발표', '설명', '결정', '합의',
-        '검토', '승인', '요약', 'discussion', '세미나', '워크샵'
-    ]
-    if any(keyword in query_lower for keyword in meeting_keywords):
-        return False  # 오프토픽 아님
-    
-    # ========== 2. 할 일 관련 키워드도 통과 ==========
-    task_keywords = ['할 일', '할일', 'task', '업무', '맡은', '담당']
-    if any(keyword in query_lower for keyword in task_keywords):
+    # ========== 0. 빈 입력 / 한 글자 / 숫자만 입력 (회의 선택) ==========
+    # 모든 키워드가 2글자 이상이라 한 글자 이하는 어떤 패턴에도 걸리지 않음
+    if len(query_lower) < 2 or query_lower.isdigit():
         return False
+
+    # ========== 1~2. 회의 관련 핵심 키워드 / 할 일 관련 키워드 있으면 무조건 통과 ==========
+    if _ON_TOPIC_RE.search(query_lower):
+        return False  # 오프토픽 아님
     
     # ========== 3. 대명사로 시작하는 짧은 질문은 컨텍스트 질문으로 간주 ==========
-    pronouns = ['그', '저', '이', '거기', '그거', '저거', '이거']
-    if any(query_lower.startswith(p) for p in pronouns) and len(query) <= 15:
+    if len(query) <= 15 and query_lower.startswith(_CONTEXT_PRONOUNS):
         return False  # 컨텍스트 질문일 가능성 높음
     
-    # ========== 4. 숫자만 입력 (회의 선택) ==========
-    if query_lower.isdigit():
-        return False
-    
-    # ========== 5. 오프토픽 패턴 체크 ==========
-    off_topic_patterns = [
-        '안녕', '안녕하세요', 'hello', 'hi', '뭐해', '심심',
-        '날씨', '요리', '맛집', '영화', '음악', '게임',
-        '뉴스', '스포츠', '주식', '부동산', '연애', '건강',
-        '농담', '사랑', '운동', '여행', '레시피', '음식'
-    ]
-    
-    return any(pattern in query_lower for pattern in off_topic_patterns)
+    # ========== 4. 오프토픽 패턴 체크 ==========
+    return _OFF_TOPIC_RE.search(query_lower) is not None
 
 def get_off_topic_response() -> str:
     """오프토픽 안내 메시지"""
@@ -678,21 +693,120 @@ def get_off_topic_response() -> str:
 
 # ============================================================
 
+_SEARCH_INTENT_RE = _keyword_alternation([
+    '회의', '미팅', '회의록', '찾아', '검색', '알려', '보여',
+    '있어', '있었어', '있나', '있니', '뭐', '어떤', '어디',
+    'meeting', 'search', 'find'
+])
+
 def has_search_intent(query: str) -> bool:
     """검색 의도가 있는지 판단"""
-    search_keywords = [
-        '회의', '미팅', '회의록', '찾아', '검색', '알려', '보여',
-        '있어', '있었어', '있나', '있니', '뭐', '어떤', '어디',
-        'meeting', 'search', 'find'
-    ]
-    
-    query_lower = query.lower()
-    return any(keyword in query_lower for keyword in search_keywords)
+    return _SEARCH_INTENT_RE.search(query.lower()) is not None
 
 # ============================================================
 # MySQL 직접 검색
 # ============================================================
 
+# 키워드 하나당 검색 조건 (제목/설명/요약 중 하나라도 포함)
+_KEYWORD_LIKE_CONDITION = "(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)"
+# FULLTEXT는 테이블별 인덱스라 meeting / meeting_result 두 MATCH로 나눔 (config.py의 인덱스 DDL 참고)
+_KEYWORD_FULLTEXT_CONDITION = (
+    "(MATCH(m.title, m.description) AGAINST (%s IN BOOLEAN MODE)"
+    " OR MATCH(mr.summary) AGAINST (%s IN BOOLEAN MODE))"
+)
+
+def _keyword_condition(keyword: str) -> tuple:
+    """키워드 검색 조건 SQL + 파라미터 반환
+
+    ENABLE_FULLTEXT_SEARCH면 ngram FULLTEXT 인덱스를 타는 구문 검색("키워드")을 사용
+    (ngram 구문 검색 = 부분 문자열 일치라 LIKE '%키워드%'와 같은 결과).
+    ngram 토큰보다 짧은 키워드는 인덱스에 없으므로 LIKE 유지.
+    """
+    if ENABLE_FULLTEXT_SEARCH and len(keyword) >= FULLTEXT_NGRAM_TOKEN_SIZE:
+        phrase = '"' + keyword.replace('"', '') + '"'
+        return _KEYWORD_FULLTEXT_CONDITION, [phrase, phrase]
+    pattern = f'%{keyword}%'
+    return _KEYWORD_LIKE_CONDITION, [pattern, pattern, pattern]
+
+# 키워드 매칭 점수 가중치 (제목 > 요약 > 설명)
+_KEYWORD_SCORE_CASE = (
+    "CASE WHEN m.title LIKE %s THEN 10 ELSE 0 END"
+    " + CASE WHEN mr.summary LIKE %s THEN 5 ELSE 0 END"
+    " + CASE WHEN m.description LIKE %s THEN 3 ELSE 0 END"
+)
+
+def _keyword_score_column(keywords) -> tuple:
+    """SELECT 목록에 붙일 keyword_score 컬럼 SQL + 파라미터 (DB에서 점수 계산 → ORDER BY에 사용)"""
+    params = []
+    for keyword in keywords:
+        pattern = f'%{keyword}%'
+        params.extend([pattern, pattern, pattern])
+    return ", (" + " + ".join([_KEYWORD_SCORE_CASE] * len(keywords)) + ") AS keyword_score", params
+
+def _attach_participants(cursor, meetings):
+    """회의별 참가자 이름을 meeting['participants']에 채움 (회의마다 조회하지 않고 IN 쿼리 한 번)"""
+    if not meetings:
+        return
+    participants_by_meeting = {meeting['id']: [] for meeting in meetings}
+    placeholders = ', '.join(['%s'] * len(participants_by_meeting))
+    cursor.execute(
+        f"SELECT meeting_id, name FROM participant WHERE meeting_id IN ({placeholders})",
+        list(participants_by_meeting)
+    )
+    for row in cursor.fetchall():
+        participants_by_meeting[row['meeting_id']].append(row['name'])
+    for meeting in meetings:
+        meeting['participants'] = participants_by_meeting[meeting['id']]
+
+def _build_status_relaxed_query(user_name, keywords, date_info, with_zero_score: bool = False) -> tuple:
+    """
+    1단계 완화 쿼리 (상태 조건 제거, 키워드는 OR) SQL + 파라미터 반환
+    - with_zero_score: 본 검색과 UNION ALL 할 때 컬럼을 맞추기 위한 keyword_score(0) 컬럼 추가
+    """
+    score_column = ", 0 AS keyword_score" if with_zero_score else ""
+    query = f"""SELECT m.*, mr.summary, mr.agenda, mr.purpose, mr.importance_level, mr.importance_reason{score_column}
+        FROM meeting m
+        LEFT JOIN meeting_result mr ON m.id = mr.meeting_id
+        INNER JOIN participant p ON m.id = p.meeting_id
+        WHERE 1=1"""
+    params = []
+    
+    # user_name 조건 추가!
+    if user_name:
+        query += " AND p.name = %s"
+        params.append(user_name)
+        logger.debug("1단계 완화: user_name 필터 추가: %s", user_name)
+    
+    if keywords:
+        keyword_conditions = []
+        for keyword in keywords:
+            condition, condition_params = _keyword_condition(keyword)
+            keyword_conditions.append(condition)
+            params.extend(condition_params)
+        query += " AND (" + " OR ".join(keyword_conditions) + ")"
+        
+    if date_info and date_info.get('start_date'):
+        query += " AND scheduled_at >= %s"
+        params.append(date_info['start_date'])
+
+    if date_info and date_info.get('end_date'):
+        query += " AND scheduled_at <= %s"
+        params.append(date_info['end_date'])
+        
+    query += " GROUP BY m.id ORDER BY scheduled_at DESC LIMIT 50"
+    return query, params
+
+def _with_search_tier(query: str, tier: int) -> str:
+    """SELECT 목록 앞에 search_tier 컬럼 추가 (UNION ALL 결과를 단계별로 나누기 위함)"""
+    return query.replace("SELECT ", f"SELECT {tier} AS search_tier, ", 1)
+
+def _split_search_tiers(rows) -> tuple:
+    """UNION ALL 결과를 (원래 조건 결과, 상태 제거 결과)로 나눔 (search_tier 컬럼은 제거)"""
+    tiers = {1: [], 2: []}
+    for row in rows:
+        tiers[row.pop('search_tier')].append(row)
+    return tiers[1], tiers[2]
+
 def search_meetings_direct(user_query, date_info=None, status=None, user_job=None, selected_meeting_id=None, user_id=None):
     """MySQL 직접 검색 + 페르소나 적용"""
     from .formatting import format_single_meeting, format_multiple_meetings_short
@@ -716,7 +830,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 result = cursor.fetchone()
                 if result:
                     user_name = result['name']
-                    print(f"[DEBUG] user_id={user_id} → user_name={user_name}")
+                    logger.debug("user_id=%s → user_name=%s", user_id, user_name)
                 
                 # 2. 참가자 이름 감지
                 cursor.execute("SELECT DISTINCT name FROM participant")
@@ -725,9 +839,9 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 for name in all_participant_names:
                     if name in user_query and name != user_name:  # 본인 이름 제외
                         participant_names_in_query.append(name)
-                        print(f"[DEBUG] 참가자 이름 감지: {name}")
+                        logger.debug("참가자 이름 감지: %s", name)
                 
-                print(f"[DEBUG] 감지된 참가자: {participant_names_in_query}")
+                logger.debug("감지된 참가자: %s", participant_names_in_query)
                 cursor.close()
 
         # with get_db_connection() as conn:
@@ -755,11 +869,11 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
             is_short_query = len(user_query) <= 20
 
             if has_meeting_word and has_list_pattern and is_short_query:
-                print(f"[DEBUG] 회의 목록 요청 감지!")
+                logger.debug("회의 목록 요청 감지!")
                 
                 # 키워드 추출 (회의 목록 요청에서도 키워드 필터 적용)
                 list_keywords = extract_keywords_from_query(user_query)
-                print(f"[DEBUG] 회의 목록 키워드: {list_keywords}")
+                logger.debug("회의 목록 키워드: %s", list_keywords)
                 
                 cursor = conn.cursor()
                 
@@ -784,16 +898,17 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                             )
                         """
                         params.extend(participant_names_in_query)
-                        print(f"[DEBUG] 참가자 필터 추가 (서브쿼리): {participant_names_in_query}")
+                        logger.debug("참가자 필터 추가 (서브쿼리): %s", participant_names_in_query)
                         
                 # 키워드 필터 추가!
                 if list_keywords:
                     keyword_conditions = []
                     for kw in list_keywords:
-                        keyword_conditions.append("(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)")
-                        params.extend([f'%{kw}%', f'%{kw}%', f'%{kw}%'])
+                        condition, condition_params = _keyword_condition(kw)
+                        keyword_conditions.append(condition)
+                        params.extend(condition_params)
                     query += " AND (" + " OR ".join(keyword_conditions) + ")"
-                    print(f"[DEBUG] 키워드 필터 추가: {list_keywords}")
+                    logger.debug("키워드 필터 추가: %s", list_keywords)
 
                 if date_info.get('start_date'):
                     query += " AND m.scheduled_at >= %s"
@@ -807,27 +922,24 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 if status:
                     query += " AND m.status = %s"
                     params.append(status)
-                    print(f"[DEBUG] 상태 필터 추가: {status}")
+                    logger.debug("상태 필터 추가: %s", status)
 
                 query += " GROUP BY m.id ORDER BY m.scheduled_at DESC LIMIT 20"
 
-                print(f"[DEBUG] 회의 목록 SQL: {query}")
-                print(f"[DEBUG] 회의 목록 Params: {params}")
-                print(f"[DEBUG] date_info: {date_info}")
-                print(f"[DEBUG] user_id: {user_id}")
+                logger.debug("회의 목록 SQL: %s", query)
+                logger.debug("회의 목록 Params: %s", params)
+                logger.debug("date_info: %s", date_info)
+                logger.debug("user_id: %s", user_id)
                 
                 cursor.execute(query, params)
                 meetings = cursor.fetchall()
                 
                 # 참가자 조회 추가
-                for meeting in meetings:
-                    cursor.execute("SELECT name FROM participant WHERE meeting_id = %s", (meeting['id'],))
-                    participants = cursor.fetchall()
-                    meeting['participants'] = [p['name'] for p in participants]
+                _attach_participants(cursor, meetings)
                 
-                print(f"[DEBUG] 회의 목록 검색 결과: {len(meetings)}개")
+                logger.debug("회의 목록 검색 결과: %s개", len(meetings))
                 if meetings:
-                    print(f"[DEBUG] 첫 번째 회의: {meetings[0].get('title', 'N/A')}")
+                    logger.debug("첫 번째 회의: %s", meetings[0].get('title', 'N/A'))
                      
                 if not meetings:
                     if date_info and date_info.get('original'):  # 날짜 정보 있으면
@@ -839,7 +951,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 # 페르소나 정렬
                 if ENABLE_PERSONA and user_job and len(meetings) > 1:
                     meetings = search_with_persona(meetings, user_job)
-                    print(f"[DEBUG] 회의 목록 페르소나 정렬 완료")
+                    logger.debug("회의 목록 페르소나 정렬 완료")
 
                 # 단일 회의면 상세 정보 바로 표시
                 if len(meetings) == 1:
@@ -847,7 +959,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                         meeting_detail = format_single_meeting_with_persona(meetings[0], user_job)
                     else:
                         meeting_detail = format_single_meeting(meetings[0])
-                    print(f"[DEBUG] 단일 회의 → 상세 정보 표시")
+                    logger.debug("단일 회의 → 상세 정보 표시")
                     return (meeting_detail, meetings)
 
                 # 결과 포맷팅 (여러 회의)
@@ -864,11 +976,11 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
             # ========== 기존 키워드 검색 로직 ==========
             # 1. 키워드 추출
             keywords = extract_keywords_from_query(user_query)
-            print(f"[DEBUG] 추출된 키워드: {keywords}")
+            logger.debug("추출된 키워드: %s", keywords)
 
             # 오프토픽 체크 전에 추가
             if not keywords and not status and date_info:
-                print(f"[DEBUG] 날짜만 있음 → 회의 목록 요청으로 처리")
+                logger.debug("날짜만 있음 → 회의 목록 요청으로 처리")
                 
                 cursor = conn.cursor()
                 
@@ -892,59 +1004,52 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                             )
                         """
                         params.extend(participant_names_in_query)
-                        print(f"[DEBUG] 참가자 필터 추가 (날짜 쿼리, 서브쿼리): {participant_names_in_query}")
+                        logger.debug("참가자 필터 추가 (날짜 쿼리, 서브쿼리): %s", participant_names_in_query)
                         
 
                 if date_info and date_info.get('start_date'):
                     query += " AND scheduled_at >= %s"
                     params.append(date_info['start_date'])
-                    print(f"[DEBUG] start_date: {date_info['start_date']}")
+                    logger.debug("start_date: %s", date_info['start_date'])
 
                 if date_info.get('end_date'):
                     query += " AND scheduled_at <= %s"
                     params.append(date_info['end_date'])
-                    print(f"[DEBUG] end_date: {date_info['end_date']}")
+                    logger.debug("end_date: %s", date_info['end_date'])
 
                 
                 query += " GROUP BY m.id ORDER BY scheduled_at DESC LIMIT 20"
                 
-                print(f"[DEBUG] 날짜만 있음 SQL: {query}")
-                print(f"[DEBUG] 날짜만 있음 Params: {params}")
+                logger.debug("날짜만 있음 SQL: %s", query)
+                logger.debug("날짜만 있음 Params: %s", params)
                 
-                # 실제 실행되는 쿼리 출력!
-                try:
-                    final_query = query
-                    for param in params:
-                        final_query = final_query.replace('%s', f"'{param}'", 1)
-                    print(f"[DEBUG] 최종 쿼리: {final_query}")
-                except:
-                    pass
+                # 실제 실행되는 쿼리 출력! (문자열 치환 비용이 있으므로 DEBUG일 때만)
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        final_query = query
+                        for param in params:
+                            final_query = final_query.replace('%s', f"'{param}'", 1)
+                        logger.debug("최종 쿼리: %s", final_query)
+                    except:
+                        pass
                 
                 # ========== 디버깅 추가 ==========
-                print(f"[DEBUG] 쿼리 실행 직전:")
-                print(f"  - query: {query}")
-                print(f"  - params: {params}")
+                logger.debug("쿼리 실행 직전:")
+                logger.debug("  - query: %s", query)
+                logger.debug("  - params: %s", params)
 
                 cursor.execute(query, params)
                 raw_result = cursor.fetchall()
 
-                print(f"[DEBUG] fetchall() 직후:")
-                print(f"  - type: {type(raw_result)}")
-                print(f"  - len: {len(raw_result) if raw_result else 0}")
+                logger.debug("fetchall() 직후:")
+                logger.debug("  - type: %s", type(raw_result))
+                logger.debug("  - len: %s", len(raw_result) if raw_result else 0)
                 if raw_result:
-                    print(f"  - first item: {raw_result[0]}")
+                    logger.debug("  - first item: %s", raw_result[0])
 
                 meetings = raw_result
-                print(f"[DEBUG] 날짜만 있음 검색 결과: {len(meetings)}개")
-
-                # 에러 체크!
-                if len(meetings) == 0:
-                    # 직접 쿼리로 확인
-                    test_query = f"SELECT COUNT(*) as cnt FROM meeting WHERE host_user_id = 1 AND scheduled_at >= '2025-10-01 00:00:00' AND scheduled_at <= '2025-10-31 23:59:59'"
-                    cursor.execute(test_query)
-                    test_result = cursor.fetchone()
-                    print(f"[DEBUG] 테스트 쿼리 결과: {test_result}")
-                            
+                logger.debug("날짜만 있음 검색 결과: %s개", len(meetings))
+
                 if not meetings:
                     date_str = date_info.get('original', '해당 기간')
                     return (f"❌ {date_str}에 회의가 없어요.", [])
@@ -968,13 +1073,12 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 has_meeting_word = any(kw in user_query for kw in meeting_keywords)
                 
                 if has_meeting_word:
-                    print(f"[DEBUG] 패턴 실패 감지 → HyperCLOVA X 호출 (키워드: {bool(keywords)}, 상태: {bool(status)}, 통계: {is_count})")
-                    from .llm import parse_query_intent
+                    logger.debug("패턴 실패 감지 → HyperCLOVA X 호출 (키워드: %s, 상태: %s, 통계: %s)", bool(keywords), bool(status), is_count)
                     parsed = parse_query_intent(user_query)
                     
                     # 통계 질문이면 count 함수로
                     if parsed.get('intent') == 'count_meetings':
-                        print(f"[DEBUG] 통계 질문 감지 → search_meeting_count 호출")
+                        logger.debug("통계 질문 감지 → search_meeting_count 호출")
                         result = search_meeting_count(
                             keywords=keywords or parsed.get('keywords', []),
                             date_info=date_info,
@@ -997,7 +1101,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                     if not status and parsed.get('status'):
                         status = parsed['status']
                     
-                    print(f"[DEBUG] LLM 보충 결과 - 키워드: {keywords}, 날짜: {date_info}, 상태: {status}")
+                    logger.debug("LLM 보충 결과 - 키워드: %s, 날짜: %s, 상태: %s", keywords, date_info, status)
                 
                 else:
                     # 회의 키워드 없지만 키워드나 상태가 있으면 검색 진행
@@ -1007,28 +1111,29 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
 
             # 2. SQL 쿼리 구성
             cursor = conn.cursor()
+            
+            # 키워드 검색이면 매칭 점수를 DB에서 계산해서 점수순으로 가져옴 (파이썬에서 재계산/재정렬 없음)
+            score_column, params = _keyword_score_column(keywords) if keywords else ("", [])
                         
-            query = """SELECT m.*, mr.summary, mr.agenda, mr.purpose, mr.importance_level, mr.importance_reason
+            query = f"""SELECT m.*, mr.summary, mr.agenda, mr.purpose, mr.importance_level, mr.importance_reason{score_column}
                 FROM meeting m
                 LEFT JOIN meeting_result mr ON m.id = mr.meeting_id
                 INNER JOIN participant p ON m.id = p.meeting_id
                 WHERE 1=1"""
-            params = []
 
             # [추가] user_name 조건 (로그인한 사용자가 참석한 회의만)
             if user_name:
                 query += " AND p.name = %s"
                 params.append(user_name)
-                print(f"[DEBUG] user_name 필터 추가: {user_name}")
+                logger.debug("user_name 필터 추가: %s", user_name)
             
             # 키워드 조건 (날짜 파싱 성공 시 제외)
             if keywords:
                 keyword_conditions = []
                 for keyword in keywords:
-                    keyword_conditions.append(
-                        "(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)"
-                    )
-                    params.extend([f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'])
+                    condition, condition_params = _keyword_condition(keyword)
+                    keyword_conditions.append(condition)
+                    params.extend(condition_params)
                 
                 # 여러 키워드면 AND, 단일 키워드면 OR
                 if len(keywords) > 1:
@@ -1036,7 +1141,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 else:
                     query += " AND (" + " OR ".join(keyword_conditions) + ")"
                 
-                print(f"[DEBUG] 키워드 조건 추가: {keywords}")
+                logger.debug("키워드 조건 추가: %s", keywords)
 
             from datetime import datetime
 
@@ -1055,18 +1160,18 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 
                 if start_date == end_date == today:
                     is_today_query = True
-                    print(f"[DEBUG] 오늘 날짜 쿼리 감지 → 모든 상태 검색")
+                    logger.debug("오늘 날짜 쿼리 감지 → 모든 상태 검색")
 
             # 날짜 조건
             if date_info and date_info.get('start_date'):
                 query += " AND scheduled_at >= %s"
                 params.append(date_info['start_date'])
-                print(f"[DEBUG] start_date: {date_info['start_date']}")
+                logger.debug("start_date: %s", date_info['start_date'])
 
             if date_info and date_info.get('end_date'):
                 query += " AND scheduled_at <= %s"
                 params.append(date_info['end_date'])
-                print(f"[DEBUG] end_date: {date_info['end_date']}")
+                logger.debug("end_date: %s", date_info['end_date'])
 
             # 상태 조건
             if status and not is_today_query:  # 오늘 쿼리가 아닐 때만 상태 필터 적용
@@ -1088,30 +1193,47 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                     params.append(status)
             elif status and is_today_query:
                 # 오늘 쿼리면 상태 무시하고 모든 회의 검색
-                print(f"[DEBUG] 오늘 쿼리 → 상태 필터({status}) 무시")
+                logger.debug("오늘 쿼리 → 상태 필터(%s) 무시", status)
                         
             # ========== 컨텍스트로 특정 회의만 검색 ==========
             if selected_meeting_id:
                 query += " AND m.id = %s"
                 params.append(selected_meeting_id)
-                print(f"[컨텍스트 필터] 회의 ID={selected_meeting_id}만 검색")
+                logger.debug("[컨텍스트 필터] 회의 ID=%s만 검색", selected_meeting_id)
             
-            query += " GROUP BY m.id ORDER BY scheduled_at DESC LIMIT 50"
+            score_order = "keyword_score DESC, " if keywords else ""
+            query += f" GROUP BY m.id ORDER BY {score_order}scheduled_at DESC LIMIT 50"
+
+            # 상태 필터가 걸린 검색은 결과가 없으면 1단계 완화(상태 제거)로 다시 검색하므로
+            # 완화 쿼리를 UNION ALL로 붙여 한 번에 가져옴 (search_tier 1: 원래 조건, 2: 상태 제거)
+            status_relaxed_meetings = None
+            union_relaxed = bool(status) and not is_today_query
+            if union_relaxed:
+                relaxed_query, relaxed_params = _build_status_relaxed_query(
+                    user_name, keywords, date_info, with_zero_score=bool(keywords)
+                )
+                query = (
+                    f"({_with_search_tier(query, 1)}) UNION ALL ({_with_search_tier(relaxed_query, 2)})"
+                    f" ORDER BY search_tier, {score_order}scheduled_at DESC"
+                )
+                params = params + relaxed_params
 
-            print(f"[DEBUG] SQL: {query}")
-            print(f"[DEBUG] Params: {params}")
+            logger.debug("SQL: %s", query)
+            logger.debug("Params: %s", params)
             
             # 3. 쿼리 실행
             cursor.execute(query, params)
             meetings = cursor.fetchall()
+            if union_relaxed:
+                meetings, status_relaxed_meetings = _split_search_tiers(meetings)
             
-            print(f"[DEBUG] 검색 결과: {len(meetings)}개")
+            logger.debug("검색 결과: %s개", len(meetings))
 
             if meetings and len(meetings) > 0:
-                print(f"[DEBUG] ✅ 회의 발견! 첫 번째 회의: {meetings[0].get('title', 'N/A')}")
-                print(f"[DEBUG] 완전 일치 체크 시작")
+                logger.debug("✅ 회의 발견! 첫 번째 회의: %s", meetings[0].get('title', 'N/A'))
+                logger.debug("완전 일치 체크 시작")
             else:
-                print(f"[DEBUG] ❌ meetings 리스트가 비어있음 또는 None")
+                logger.debug("❌ meetings 리스트가 비어있음 또는 None")
 
             # ========== 완전 일치 체크 ==========
             if len(meetings) > 1:
@@ -1119,43 +1241,21 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 for meeting in meetings:
                     meeting_title_lower = meeting.get('title', '').lower().strip()
                     if user_query_lower == meeting_title_lower:
-                        print(f"[DEBUG] 완전 일치 발견: {meeting.get('title')}")
+                        logger.debug("완전 일치 발견: %s", meeting.get('title'))
                         meetings = [meeting]  # 단일 회의로 변경
                         break
-            print(f"[DEBUG] 완전 일치 체크 완료, meetings 개수: {len(meetings)}")
+            logger.debug("완전 일치 체크 완료, meetings 개수: %s", len(meetings))
 
             # ========== Phase 2-A: 페르소나 정렬 적용 ==========
-            # 키워드 검색이 있으면 키워드 매칭 점수로 정렬
+            # 키워드 검색이 있으면 키워드 매칭 점수순 (SQL에서 keyword_score로 이미 정렬됨)
             if keywords and meetings and len(meetings) > 1:
-                # 키워드 매칭 점수 계산
-                for meeting in meetings:
-                    score = 0
-                    title = (meeting.get('title') or '').lower()
-                    description = (meeting.get('description') or '').lower()
-                    summary = (meeting.get('summary') or '').lower()
-
-                    for keyword in keywords:
-                        if keyword.lower() in title:
-                            score += 10
-                        if keyword.lower() in summary:
-                            score += 5
-                        if keyword.lower() in description:
-                            score += 3
-                    
-                    meeting['keyword_score'] = score
-                
-                # 점수순 정렬
-                meetings = sorted(meetings, key=lambda x: x.get('keyword_score', 0), reverse=True)
-                print(f"[DEBUG] 키워드 매칭 점수로 정렬 완료")
-                
                 # 디버그: 상위 3개 점수 출력
                 for i, m in enumerate(meetings[:3]):
-                    print(f"  {i+1}. {m.get('title')} (키워드 점수: {m.get('keyword_score', 0)})")
+                    logger.debug("  %s. %s (키워드 점수: %s)", i + 1, m.get('title'), m.get('keyword_score', 0))
                 
                 # 유사도 기반 단일 회의 판단 (회의 제외)
                 if len(meetings) > 1:
                     import difflib
-                    import re
                     
                     # "회의" 제거 함수
                     def remove_meeting_word(text):
@@ -1172,7 +1272,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                         # "회의" 제거 후 유사도 계산
                         ratio = difflib.SequenceMatcher(None, user_query_clean, title_clean).ratio()
                         similarities.append((meeting, ratio, title_original))
-                        print(f"  - '{meeting.get('title')}' 유사도: {ratio:.2%} (비교: '{user_query_clean}' vs '{title_clean}')")
+                        logger.debug("  - '%s' 유사도: %.2f%% (비교: '%s' vs '%s')", meeting.get('title'), ratio * 100, user_query_clean, title_clean)
                     
                     # 가장 유사한 것 찾기
                     best_match = max(similarities, key=lambda x: x[1])
@@ -1184,69 +1284,43 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                         ratio_diff = best_ratio - second_best_ratio
                         
                         if ratio_diff >= 0.2:
-                            print(f"[DEBUG] 유사도 {best_ratio:.1%} (차이: {ratio_diff:.1%}) → 단일 회의로 처리")
+                            logger.debug("유사도 %.1f%% (차이: %.1f%%) → 단일 회의로 처리", best_ratio * 100, ratio_diff * 100)
                             meetings = [best_match[0]]
                         else:
-                            print(f"[DEBUG] 유사도 {best_ratio:.1%}이지만 2등과 차이({ratio_diff:.1%}) 부족 → 새로운 검색")
+                            logger.debug("유사도 %.1f%%이지만 2등과 차이(%.1f%%) 부족 → 새로운 검색", best_ratio * 100, ratio_diff * 100)
                     else:
-                        print(f"[DEBUG] 최고 유사도 {best_ratio:.1%} < 70% → 새로운 검색")
+                        logger.debug("최고 유사도 %.1f%% < 70%% → 새로운 검색", best_ratio * 100)
 
             elif ENABLE_PERSONA and user_job and meetings and len(meetings) > 1:
-                print(f"[DEBUG] Phase 2-A 페르소나 정렬 시작: user_job={user_job}, meetings={len(meetings)}개")
+                logger.debug("Phase 2-A 페르소나 정렬 시작: user_job=%s, meetings=%s개", user_job, len(meetings))
                 meetings = search_with_persona(meetings, user_job)
-                print(f"[DEBUG] Phase 2-A: {user_job} 관련도 순으로 정렬 완료")
+                logger.debug("Phase 2-A: %s 관련도 순으로 정렬 완료", user_job)
             else:
-                print(f"[DEBUG] 페르소나 정렬 건너뜀 (ENABLE_PERSONA={ENABLE_PERSONA}, user_job={user_job}, len(meetings)={len(meetings) if meetings else 0})")
+                logger.debug("페르소나 정렬 건너뜀 (ENABLE_PERSONA=%s, user_job=%s, len(meetings)=%s)", ENABLE_PERSONA, user_job, len(meetings) if meetings else 0)
 
-            print(f"[DEBUG] 포맷팅 전 최종 확인: meetings 개수={len(meetings) if meetings else 0}")
+            logger.debug("포맷팅 전 최종 확인: meetings 개수=%s", len(meetings) if meetings else 0)
             if meetings:
-                print(f"[DEBUG] 첫 번째 회의: {meetings[0].get('title', 'N/A')}")
+                logger.debug("첫 번째 회의: %s", meetings[0].get('title', 'N/A'))
                 
             # 4. 결과 포맷팅 (실패 시 단계적 완화)
             if not meetings:
-                print(f"[DEBUG] 검색 실패 → 단계적 완화 시작")
+                logger.debug("검색 실패 → 단계적 완화 시작")
                 
                 # ===== 1단계: status 제거 =====
                 if status:
-                    print(f"[DEBUG] 1단계 완화: status 제거")
-                    query_fallback = """SELECT m.*, mr.summary, mr.agenda, mr.purpose, mr.importance_level, mr.importance_reason
-                        FROM meeting m
-                        LEFT JOIN meeting_result mr ON m.id = mr.meeting_id
-                        INNER JOIN participant p ON m.id = p.meeting_id
-                        WHERE 1=1"""
-                    params_fallback = []
-                    
-                    # user_name 조건 추가!
-                    if user_name:
-                        query_fallback += " AND p.name = %s"
-                        params_fallback.append(user_name)
-                        print(f"[DEBUG] 1단계 완화: user_name 필터 추가: {user_name}")
-                    
-                    if keywords:
-                        keyword_conditions = []
-                        for keyword in keywords:
-                            keyword_conditions.append("(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)")
-                            params_fallback.extend([f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'])
-                        query_fallback += " AND (" + " OR ".join(keyword_conditions) + ")"
-                        
-                    if date_info and date_info.get('start_date'):
-                        query_fallback += " AND scheduled_at >= %s"
-                        params_fallback.append(date_info['start_date'])
-                        print(f"[DEBUG] start_date: {date_info['start_date']}")
-
-                    if date_info and date_info.get('end_date'):
-                        query_fallback += " AND scheduled_at <= %s"
-                        params_fallback.append(date_info['end_date'])
-                        print(f"[DEBUG] end_date: {date_info['end_date']}")
+                    logger.debug("1단계 완화: status 제거")
+                    if status_relaxed_meetings is not None:
+                        # 본 검색과 UNION ALL로 함께 가져온 결과 사용 (추가 쿼리 없음)
+                        meetings_fallback = status_relaxed_meetings
+                    else:
+                        query_fallback, params_fallback = _build_status_relaxed_query(user_name, keywords, date_info)
+                        cursor.execute(query_fallback, params_fallback)
+                        meetings_fallback = cursor.fetchall()
                         
-                    query_fallback += " GROUP BY m.id ORDER BY scheduled_at DESC LIMIT 50"
-                    cursor.execute(query_fallback, params_fallback)
-                    meetings_fallback = cursor.fetchall()
-                    
-                    print(f"[DEBUG] 1단계 완화 쿼리 실행 완료")
-                    print(f"[DEBUG] query_fallback: {query_fallback}")
-                    print(f"[DEBUG] params_fallback: {params_fallback}")
-                    print(f"[DEBUG] meetings_fallback 개수: {len(meetings_fallback) if meetings_fallback else 0}")
+                        logger.debug("1단계 완화 쿼리 실행 완료")
+                        logger.debug("query_fallback: %s", query_fallback)
+                        logger.debug("params_fallback: %s", params_fallback)
+                    logger.debug("meetings_fallback 개수: %s", len(meetings_fallback) if meetings_fallback else 0)
 
                     if meetings_fallback:
                         status_kr = {'COMPLETED': '완료된', 'SCHEDULED': '예정된', 'RECORDING': '진행중'}
@@ -1318,62 +1392,70 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
 
 {detail}"""
                         
-                        print(f"[DEBUG] 1단계 완화 성공: {len(meetings_fallback)}개 발견")
+                        logger.debug("1단계 완화 성공: %s개 발견", len(meetings_fallback))
                         return (message, meetings_fallback)
                                     
                 # ===== 2단계: 날짜 제거, 키워드만 검색 =====
                 if date_info and date_info.get('start_date'):
-                    print(f"[DEBUG] 2단계 시작: keywords={keywords}, len={len(keywords) if keywords else 0}")
+                    logger.debug("2단계 시작: keywords=%s, len=%s", keywords, len(keywords) if keywords else 0)
                     
                     # 각 키워드를 DB 제목들과 비교해서 유사도 체크 (먼저)
                     import difflib
-                    import re
 
-                    corrected_keywords = []
+                    # 오타 보정 결과가 같은 단어로 모일 수 있으므로 dict에 넣으면서 중복 제거 (순서 유지)
+                    corrected_keywords = {}
+                    all_words = None  # 제목 단어는 키워드와 무관하므로 첫 키워드에서 한 번만 조회
                     for keyword in keywords:  # keywords 전체 사용
-                        print(f"[DEBUG] 유사도 체크 시작: keyword='{keyword}'")
+                        logger.debug("유사도 체크 시작: keyword='%s'", keyword)
                         
-                        # DB에서 모든 회의 제목 가져오기
-                        if user_id:
-                            cursor.execute("SELECT DISTINCT title FROM meeting WHERE host_user_id = %s", (user_id,))
-                        else:
-                            cursor.execute("SELECT DISTINCT title FROM meeting")
-                        all_titles = [row['title'] for row in cursor.fetchall()]
-                        
-                        print(f"[DEBUG] DB 제목 개수: {len(all_titles)}")
-                        
-                        # 제목에서 단어 추출
-                        all_words = set()
-                        for title in all_titles:
-                            all_words.update(re.findall(r'[가-힣]+', title))
-                        
-                        print(f"[DEBUG] 추출된 단어 개수: {len(all_words)}")
-                        print(f"[DEBUG] 추출된 단어 샘플 (최대 10개): {list(all_words)[:10]}")
+                        if all_words is None:
+                            # DB에서 모든 회의 제목 가져오기
+                            if user_id:
+                                cursor.execute("SELECT DISTINCT title FROM meeting WHERE host_user_id = %s", (user_id,))
+                            else:
+                                cursor.execute("SELECT DISTINCT title FROM meeting")
+                            all_titles = [row['title'] for row in cursor.fetchall()]
+                            
+                            logger.debug("DB 제목 개수: %s", len(all_titles))
+                            
+                            # 제목에서 단어 추출
+                            all_words = set()
+                            for title in all_titles:
+                                all_words.update(re.findall(r'[가-힣]+', title))
+                            
+                            logger.debug("추출된 단어 개수: %s", len(all_words))
+                            logger.debug("추출된 단어 샘플 (최대 10개): %s", list(all_words)[:10])
 
                         # 유사도가 70% 이상인 단어 찾기
+                        # - keyword 쪽은 고정이라 SequenceMatcher 하나를 재사용
+                        # - real_quick_ratio/quick_ratio는 ratio의 상한 → 기준 미달이면 정확한 계산 생략
                         best_match = None
                         best_ratio = 0
+                        matcher = difflib.SequenceMatcher(None, keyword)
                         for word in all_words:
-                            ratio = difflib.SequenceMatcher(None, keyword, word).ratio()
+                            matcher.set_seq2(word)
+                            threshold = max(best_ratio, 0.7)
+                            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                                continue
+                            ratio = matcher.ratio()
                             if ratio > best_ratio and ratio >= 0.7:
                                 best_ratio = ratio
                                 best_match = word
                         
-                        print(f"[DEBUG] '{keyword}' 최고 유사도: {best_ratio:.1%}, 매치: {best_match}")
+                        logger.debug("'%s' 최고 유사도: %.1f%%, 매치: %s", keyword, best_ratio * 100, best_match)
 
                         if best_match:
-                            print(f"[DEBUG] 오타 보정: '{keyword}' → '{best_match}' (유사도: {best_ratio:.1%})")
-                            corrected_keywords.append(best_match)
+                            logger.debug("오타 보정: '%s' → '%s' (유사도: %.1f%%)", keyword, best_match, best_ratio * 100)
+                            corrected_keywords[best_match] = None
                         else:
-                            print(f"[DEBUG] 오타 보정 실패: '{keyword}' (최고 유사도 {best_ratio:.1%} < 70%)")
-                            corrected_keywords.append(keyword)
+                            logger.debug("오타 보정 실패: '%s' (최고 유사도 %.1f%% < 70%%)", keyword, best_ratio * 100)
+                            corrected_keywords[keyword] = None
                     
                     # 이제 의미있는 키워드만 필터링
-                    meaningful_keywords = [k for k in corrected_keywords if k not in ['있어', '없어', '뭐', '거', '것', '회의']]
-                    meaningful_keywords = [k for k in meaningful_keywords if not any(x in k for x in ['일', '월', '주', '년'])]
+                    meaningful_keywords = _filter_search_keywords(corrected_keywords)
                     
                     if meaningful_keywords:
-                        print(f"[DEBUG] 2단계 완화: 날짜 제거, 키워드만 검색 (키워드: {meaningful_keywords})")
+                        logger.debug("2단계 완화: 날짜 제거, 키워드만 검색 (키워드: %s)", meaningful_keywords)
                         query_fallback = """SELECT m.*, mr.summary, mr.agenda, mr.purpose, mr.importance_level, mr.importance_reason
                             FROM meeting m
                             LEFT JOIN meeting_result mr ON m.id = mr.meeting_id
@@ -1385,12 +1467,13 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                         if user_name:
                             query_fallback += " AND p.name = %s"
                             params_fallback.append(user_name)
-                            print(f"[DEBUG] 2단계 완화: user_name 필터 추가: {user_name}")
+                            logger.debug("2단계 완화: user_name 필터 추가: %s", user_name)
                         
                         keyword_conditions = []
                         for keyword in meaningful_keywords:
-                            keyword_conditions.append("(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)")
-                            params_fallback.extend([f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'])
+                            condition, condition_params = _keyword_condition(keyword)
+                            keyword_conditions.append(condition)
+                            params_fallback.extend(condition_params)
                         query_fallback += " AND (" + " OR ".join(keyword_conditions) + ")"
                         
                         if status:
@@ -1402,7 +1485,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                         meetings_fallback = cursor.fetchall()
                         
                         if meetings_fallback:
-                            print(f"[DEBUG] 2단계 완화 성공 (날짜 제거): {len(meetings_fallback)}개 발견")
+                            logger.debug("2단계 완화 성공 (날짜 제거): %s개 발견", len(meetings_fallback))
                             
                             # meetings 변수 덮어쓰기 (아래 일반 로직 방지)
                             meetings = meetings_fallback
@@ -1446,19 +1529,17 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
 하지만 다른 날짜에 '{keyword_str}' 회의가 있어요! 📋
 {detail}"""
                                 
-                                print(f"[DEBUG] 2단계 완화 메시지 생성 완료, return 직전")
-                                print(f"[DEBUG] message 길이: {len(message)}")
+                                logger.debug("2단계 완화 메시지 생성 완료, return 직전")
+                                logger.debug("message 길이: %s", len(message))
                                 
                                 message = "[FALLBACK_SUCCESS]" + message
                                 return (message, meetings_fallback)
 
                             except Exception as e:
-                                print(f"[ERROR] 2단계 완화 메시지 생성 실패: {e}")
-                                import traceback
-                                traceback.print_exc()
+                                logger.exception("2단계 완화 메시지 생성 실패: %s", e)
                 
                 # ===== 최종 실패 =====
-                print(f"[DEBUG] 모든 완화 실패")
+                logger.debug("모든 완화 실패")
 
                 # 날짜만 있고 키워드 없으면 → 간단히
                 if date_info and date_info.get('original') and not keywords:
@@ -1473,8 +1554,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 # 키워드 있으면
                 elif keywords:
                     # 의미있는 키워드만 필터링 (날짜 관련 단어 제거)
-                    keyword_str_list = [k for k in keywords if k not in ['있어', '없어', '뭐', '거', '것', '회의']]
-                    keyword_str_list = [k for k in keyword_str_list if not any(x in k for x in ['일', '월', '주', '년'])]
+                    keyword_str_list = _filter_search_keywords(keywords)
                     
                     if not keyword_str_list:
                         # 의미있는 키워드 없음
@@ -1513,7 +1593,7 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                 if ENABLE_PERSONA and user_job:
                     meeting_detail = format_single_meeting_with_persona(meetings[0], user_job)
                     message = date_prefix + meeting_detail
-                    print(f"[DEBUG] Phase 2-A: 단일 회의 {user_job}용 템플릿 적용")
+                    logger.debug("Phase 2-A: 단일 회의 %s용 템플릿 적용", user_job)
                 else:
                     meeting_detail = format_single_meeting(meetings[0])
                     message = date_prefix + meeting_detail
@@ -1521,8 +1601,8 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
             
             # 여러 회의
             total = len(meetings)
-            print(f"[DEBUG] 여러 회의 포맷팅 시작: total={total}, meetings 타입={type(meetings)}")
-            print(f"[DEBUG] 첫 번째 회의 키: {list(meetings[0].keys()) if meetings else 'None'}")
+            logger.debug("여러 회의 포맷팅 시작: total=%s, meetings 타입=%s", total, type(meetings))
+            logger.debug("첫 번째 회의 키: %s", list(meetings[0].keys()) if meetings else 'None')
 
             try:
                 message, _, _ = format_multiple_meetings_short(
@@ -1532,32 +1612,27 @@ def search_meetings_direct(user_query, date_info=None, status=None, user_job=Non
                     date_info,
                     status
                 )
-                print(f"[DEBUG] 포맷팅 성공: {len(message)}자")
+                logger.debug("포맷팅 성공: %s자", len(message))
             except Exception as format_error:
-                print(f"[ERROR] format_multiple_meetings_short 실패: {format_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("format_multiple_meetings_short 실패: %s", format_error)
                 raise  # 원래 예외 다시 발생
 
             return (message, meetings)
         
         except Exception as e:
-            logger.error(f"MySQL 검색 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"MySQL 검색 실패: {e}")
             return ("검색 중 오류가 발생했어요.", [])
 
 # ============================================================
 # Phase 2-A: 페르소나 검색
 # ============================================================
 
-def calculate_relevance(meeting: dict, user_job: str) -> float:
-    """회의와 User job의 관련도 점수 계산 (실제 DB enum 기준)"""
-    score = 0.0
-    
-    # DB의 실제 ENUM: 'NONE', 'PROJECT_MANAGER', 'FRONTEND_DEVELOPER', 
-    #                  'BACKEND_DEVELOPER', 'DATABASE_ADMINISTRATOR', 'SECURITY_DEVELOPER'
-    job_keywords = {
+# DB의 실제 ENUM: 'NONE', 'PROJECT_MANAGER', 'FRONTEND_DEVELOPER', 
+#                  'BACKEND_DEVELOPER', 'DATABASE_ADMINISTRATOR', 'SECURITY_DEVELOPER'
+# 회의마다 다시 만들지 않도록 모듈 로드 시 한 번만 (키워드는 미리 소문자로)
+_JOB_KEYWORDS = {
+    job: tuple(keyword.lower() for keyword in keywords)
+    for job, keywords in {
         'PROJECT_MANAGER': [
             '기획', '전략', '로드맵', '목표', '계획', '일정', '마일스톤', 
             '프로젝트', 'pm', 'po', '스프린트', '스케줄', '리소스'
@@ -1579,21 +1654,26 @@ def calculate_relevance(meeting: dict, user_job: str) -> float:
             '보안', 'security', '취약점', '암호화', '인증', '권한', 
             'ssl', '방화벽', '점검', '보안점검', '취약점점검'
         ],
-    }
-    
-    keywords = job_keywords.get(user_job, [])
+    }.items()
+}
+
+def calculate_relevance(meeting: dict, user_job: str) -> float:
+    """회의와 User job의 관련도 점수 계산 (실제 DB enum 기준)"""
+    keywords = _JOB_KEYWORDS.get(user_job)
+    if not keywords:
+        return 0.0
     
     title = (meeting.get('title') or '').lower()
     description = (meeting.get('description') or '').lower()
     summary = (meeting.get('summary') or '').lower()
     
+    score = 0.0
     for keyword in keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in title:
+        if keyword in title:
             score += 10
-        if summary and keyword_lower in summary:
+        if keyword in summary:
             score += 5
-        if description and keyword_lower in description:
+        if keyword in description:
             score += 3
     
     return score
@@ -1619,13 +1699,13 @@ def search_with_persona(meetings: list, user_job: str) -> list:
             meeting['time_distance'] = float('inf')
     
     # 디버그: 정렬 전
-    print(f"[DEBUG] 정렬 전 상위 3개:")
+    logger.debug("정렬 전 상위 3개:")
     for i, m in enumerate(meetings[:3]):
         scheduled = m.get('scheduled_at')
         if isinstance(scheduled, str):
             scheduled = datetime.fromisoformat(scheduled.replace('Z', '+00:00'))
         date_str = scheduled.strftime('%Y-%m-%d') if scheduled else '날짜없음'
-        print(f"  {i+1}. {m.get('title')} ({m.get('relevance_score', 0)}점, {date_str})")
+        logger.debug("  %s. %s (%s점, %s)", i + 1, m.get('title'), m.get('relevance_score', 0), date_str)
     
     # 2. 관련도 상위 70% / 하위 30% 분리
     scores = sorted([m['relevance_score'] for m in meetings], reverse=True)
@@ -1645,14 +1725,14 @@ def search_with_persona(meetings: list, user_job: str) -> list:
     final_sorted = high_relevance_sorted + low_relevance_sorted
     
     # 디버그: 정렬 후
-    print(f"[DEBUG] 정렬 후 상위 3개:")
+    logger.debug("정렬 후 상위 3개:")
     for i, m in enumerate(final_sorted[:3]):
         scheduled = m.get('scheduled_at')
         if isinstance(scheduled, str):
             scheduled = datetime.fromisoformat(scheduled.replace('Z', '+00:00'))
         date_str = scheduled.strftime('%Y-%m-%d') if scheduled else '날짜없음'
         days_diff = int(m['time_distance'] / 86400)  # 초 → 일
-        print(f"  {i+1}. {m.get('title')} ({m.get('relevance_score', 0)}점, {date_str}, {days_diff}일 차이)")
+        logger.debug("  %s. %s (%s점, %s, %s일 차이)", i + 1, m.get('title'), m.get('relevance_score', 0), date_str, days_diff)
     
     # 임시 필드 제거
     for meeting in final_sorted:
@@ -1661,52 +1741,6 @@ def search_with_persona(meetings: list, user_job: str) -> list:
     
     return final_sorted
 
-# ============================================================
-# Lambda 응답 파싱 (향후 Lambda 사용 시)
-# ============================================================
-
-def parse_meeting_count(lambda_response: str) -> int:
-    """Lambda 응답에서 회의 개수 추출"""
-    match = re.search(r'회의록\s*(\d+)개', lambda_response)
-    if match:
-        count = int(match.group(1))
-        print(f"[DEBUG] 회의 개수: {count}개")
-        return count
-    return 1
-
-def parse_meetings_list(lambda_response: str) -> list:
-    """Lambda 응답에서 회의 목록 파싱"""
-    meetings = []
-    sections = lambda_response.split("━━━━━━━━━━━━━━━━━━━━━━")
-    
-    for section in sections:
-        if "📌" not in section:
-            continue
-        
-        meeting = {}
-        
-        title_match = re.search(r'📌\s*(.+)', section)
-        if title_match:
-            meeting['title'] = title_match.group(1).strip()
-        
-        date_match = re.search(r'📅\s*날짜:\s*(.+)', section)
-        if date_match:
-            meeting['date'] = date_match.group(1).strip()
-        
-        desc_match = re.search(r'📝\s*설명:\s*(.+)', section)
-        if desc_match:
-            meeting['description'] = desc_match.group(1).strip()
-        
-        summary_match = re.search(r'📋\s*요약:\s*(.+)', section)
-        if summary_match:
-            meeting['summary'] = summary_match.group(1).strip()
-        
-        if meeting.get('title'):
-            meetings.append(meeting)
-    
-    logger.info(f"[파싱 완료] {len(meetings)}개 회의 발견")
-    return meetings
-
 # ============================================================
 # Phase 3: 통계 쿼리 (COUNT)
 # ============================================================
@@ -1731,16 +1765,15 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
             if user_name:
                 query += " AND p.name = %s"
                 params.append(user_name)
-                print(f"[DEBUG] COUNT user_name 필터: {user_name}")
+                logger.debug("COUNT user_name 필터: %s", user_name)
             
             # 키워드 조건
             if keywords:
                 keyword_conditions = []
                 for keyword in keywords:
-                    keyword_conditions.append(
-                        "(m.title LIKE %s OR m.description LIKE %s OR mr.summary LIKE %s)"
-                    )
-                    params.extend([f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'])
+                    condition, condition_params = _keyword_condition(keyword)
+                    keyword_conditions.append(condition)
+                    params.extend(condition_params)
                 
                 query += " AND (" + " OR ".join(keyword_conditions) + ")"
             
@@ -1748,12 +1781,12 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
             if date_info and date_info.get('start_date'):
                 query += " AND scheduled_at >= %s"
                 params.append(date_info['start_date'])
-                print(f"[DEBUG] start_date: {date_info['start_date']}")
+                logger.debug("start_date: %s", date_info['start_date'])
 
             if date_info.get('end_date'):
                 query += " AND scheduled_at <= %s"
                 params.append(date_info['end_date'])
-                print(f"[DEBUG] end_date: {date_info['end_date']}")
+                logger.debug("end_date: %s", date_info['end_date'])
             
             # 상태 조건
             if status:
@@ -1772,9 +1805,9 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
                     if not user_specified_date:
                         query += " AND scheduled_at >= %s"
                         params.append(today)
-                        print(f"[DEBUG] 예정된 회의 → 오늘({today.date()}) 이후만 검색")
+                        logger.debug("예정된 회의 → 오늘(%s) 이후만 검색", today.date())
                     else:
-                        print(f"[DEBUG] 날짜 명시({date_info.get('original')}) → 오늘 이후 필터 해제")
+                        logger.debug("날짜 명시(%s) → 오늘 이후 필터 해제", date_info.get('original'))
                 
                 elif status == 'COMPLETED':
                     # 완료된 회의
@@ -1785,25 +1818,25 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
                     if not user_specified_date:
                         query += " AND scheduled_at < %s"
                         params.append(today)
-                        print(f"[DEBUG] 완료된 회의 → 오늘({today.date()}) 이전만 검색")
+                        logger.debug("완료된 회의 → 오늘(%s) 이전만 검색", today.date())
                     else:
-                        print(f"[DEBUG] 날짜 명시({date_info.get('original')}) → 오늘 이전 필터 해제")
+                        logger.debug("날짜 명시(%s) → 오늘 이전 필터 해제", date_info.get('original'))
                 
                 else:
                     # RECORDING은 날짜 제한 없음
                     query += " AND status = %s"
                     params.append(status)
-                    print(f"[DEBUG] 진행중 회의 → 날짜 제한 없음")
+                    logger.debug("진행중 회의 → 날짜 제한 없음")
             
-            print(f"[DEBUG] COUNT SQL: {query}")
-            print(f"[DEBUG] Params: {params}")
+            logger.debug("COUNT SQL: %s", query)
+            logger.debug("Params: %s", params)
             
             # 개수 세기
             cursor.execute(query, params)
             result = cursor.fetchone()
             count = result['count'] if result else 0
             
-            print(f"[DEBUG] 회의 개수: {count}개")
+            logger.debug("회의 개수: %s개", count)
             
             # 날짜 목록 가져오기 (최대 제한 없음!)
             date_query = query.replace("COUNT(*) as count", "scheduled_at, title, description, summary, id, status, host_user_id")
@@ -1815,7 +1848,7 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
             # ========== Phase 2-A: 페르소나 정렬 적용 ==========
             if ENABLE_PERSONA and user_job and meetings and len(meetings) > 1 and not keywords:
                 meetings = search_with_persona(meetings, user_job)
-                print(f"[DEBUG] Phase 2-A (COUNT): {user_job} 관련도 순으로 정렬")
+                logger.debug("Phase 2-A (COUNT): %s 관련도 순으로 정렬", user_job)
             
             return {
                 'count': count,
@@ -1823,9 +1856,7 @@ def search_meeting_count(keywords=None, date_info=None, status=None, user_job=No
             }
             
         except Exception as e:
-            logger.error(f"COUNT 쿼리 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"COUNT 쿼리 실패: {e}")
             return None
 
 # ============================================================
@@ -1888,7 +1919,7 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
             cursor.execute("SELECT name FROM user WHERE id != %s", (user_id,))
             other_names = [row['name'] for row in cursor.fetchall()]
             
-            print(f"[DEBUG] 현재 사용자: {current_user_name}, 다른 사용자: {other_names}")
+            logger.debug("현재 사용자: %s, 다른 사용자: %s", current_user_name, other_names)
             
             query_lower = user_query.lower()
             
@@ -1918,11 +1949,11 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
             for name in other_names:
                 if name in user_query:
                     if not has_meeting_reference:
-                        print(f"[DEBUG] 타인 이름 '{name}' 감지 → meeting_id 무시, 전체 검색")
+                        logger.debug("타인 이름 '%s' 감지 → meeting_id 무시, 전체 검색", name)
                         meeting_id = None
                         found_name = name
                     else:
-                        print(f"[DEBUG] 타인 이름 '{name}' + 회의 대명사 감지 → meeting_id 유지 (특정 회의 검색)")
+                        logger.debug("타인 이름 '%s' + 회의 대명사 감지 → meeting_id 유지 (특정 회의 검색)", name)
                         found_name = name
                     break
             
@@ -1946,7 +1977,7 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
 
             # 0. "이미 한", "완료한" 패턴 (완료된 Task)
             if any(pattern in query_lower for pattern in ['이미', '완료', '끝난', '다 한', '한 거', '한 것']):
-                print(f"[DEBUG] 완료된 Task 검색")
+                logger.debug("완료된 Task 검색")
                 
                 status_filter = "AND t.status = 'COMPLETED'"
                 status_text = "완료한"
@@ -1988,7 +2019,7 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
             # 0. "이미 한", "완료한" 패턴
                 completed_keywords = ['이미', '완료', '끝난', '다 한', '한 거', '한 것', '했던']
                 if any(keyword in query_lower for keyword in completed_keywords):
-                    print(f"[DEBUG] 완료된 Task 검색")
+                    logger.debug("완료된 Task 검색")
                     
                     status_filter = "AND t.status = 'COMPLETED'"
                     
@@ -2235,8 +2266,6 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
             # 4. "담당자 이름" 패턴 (김철수, 이영희 등)
             else:
                 # 이름 추출 - 조사 목록을 먼저 제거
-                import re
-                
                 # 이전에 이미 found_name이 설정된 경우 (회의 대명사 + 타인 이름)
                 if 'found_name' not in locals():
                     # 조사 제거
@@ -2301,10 +2330,10 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
                 tasks = merge_tasks_and_actions(list(tasks), action_items)
 
                 # 디버깅
-                print(f"[DEBUG] 담당자 검색: name={name}, meeting_id={meeting_id if meeting_id else 'None'}")
-                print(f"[DEBUG] 검색 결과: {len(tasks)}개")
+                logger.debug("담당자 검색: name=%s, meeting_id=%s", name, meeting_id if meeting_id else 'None')
+                logger.debug("검색 결과: %s개", len(tasks))
                 if tasks:
-                    print(f"[DEBUG] 첫 번째 결과: {tasks[0]}")
+                    logger.debug("첫 번째 결과: %s", tasks[0])
                             
                 if not tasks:
                     if status_text:
@@ -2315,9 +2344,7 @@ def search_tasks(user_query: str, user_id: int = 1, meeting_id: int = None, user
                 return (message, tasks)
                         
         except Exception as e:
-            logger.error(f"Task 검색 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Task 검색 실패: {e}")
             return ("Task 검색 중 오류가 발생했어요. 😢", [])
     
 # ============================================================
@@ -2424,9 +2451,7 @@ def search_participants(query_type: str, meeting_id: int = None, person_name: st
                 return ("잘못된 검색 유형이에요. 😢", [])
     
     except Exception as e:
-        logger.error(f"Participant 검색 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Participant 검색 실패: {e}")
         return ("참석자 검색 중 오류가 발생했어요. 😢", [])
     
 
@@ -2466,7 +2491,7 @@ def search_keywords(keyword_name, user_job=None):
             cursor.execute(query, (f'%{keyword_name}%',))
             meetings = cursor.fetchall()
             
-            print(f"[DEBUG] Keyword 검색 결과: {len(meetings)}개 (키워드: {keyword_name})")
+            logger.debug("Keyword 검색 결과: %s개 (키워드: %s)", len(meetings), keyword_name)
             
             # 결과 없음
             if not meetings or len(meetings) == 0:
@@ -2475,7 +2500,7 @@ def search_keywords(keyword_name, user_job=None):
             # 페르소나 정렬
             if ENABLE_PERSONA and user_job and len(meetings) > 1:
                 meetings = search_with_persona(meetings, user_job)
-                print(f"[DEBUG] Keyword 검색: {user_job} 페르소나 정렬 완료")
+                logger.debug("Keyword 검색: %s 페르소나 정렬 완료", user_job)
             
             # 단일 회의
             if len(meetings) == 1:
@@ -2496,9 +2521,7 @@ def search_keywords(keyword_name, user_job=None):
                 return (message, meetings)
         
         except Exception as e:
-            logger.error(f"Keyword 검색 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Keyword 검색 실패: {e}")
             return (f"'{keyword_name}' 키워드 검색 중 오류가 발생했어요. 😢", [])
         
 
@@ -2554,7 +2577,7 @@ def fetch_action_items(cursor, meeting_id: int = None, user_id: int = None, stat
         
         return list(cursor.fetchall())
     except Exception as e:
-        print(f"[DEBUG] Action Item 조회 실패: {e}")
+        logger.debug("Action Item 조회 실패: %s", e)
         return []
 
 
@@ -7,9 +7,9 @@
 import re
 import logging
 from datetime import datetime
-from .models import ChatRequest, ChatResponse
+from .models import ChatRequest, ChatResponse, ROLE_USER, ROLE_ASSISTANT
 from .formatting import format_single_meeting, format_single_meeting_with_persona
-from .context import save_context, delete_context
+from .context import save_context_async, delete_context
 from .config import ENABLE_PERSONA
 
 logger = logging.getLogger(__name__)
@@ -47,13 +47,13 @@ def handle_selection(user_input: str, context: dict,
         shown_completed = context.get('shown_completed', 0)
         shown_scheduled = context.get('shown_scheduled', 0)
         
-        print(f"[DEBUG] 번호 선택 체크: number={selected_number}")
+        logger.debug("번호 선택 체크: number=%s", selected_number)
         
         # ========== 먼저 변수 정의! ==========
         completed_meetings = [m for m in meetings if m.get('status') == 'COMPLETED']
         scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
         
-        print(f"[DEBUG] 완료={len(completed_meetings)}개, 예정={len(scheduled_meetings)}개")
+        logger.debug("완료=%s개, 예정=%s개", len(completed_meetings), len(scheduled_meetings))
         
         # ========== 상태별 분리 표시 확인 ==========
         is_status_separated = (shown_completed > 0 or shown_scheduled > 0)
@@ -64,8 +64,8 @@ def handle_selection(user_input: str, context: dict,
             scheduled_meetings = [m for m in meetings if m.get('status') == 'SCHEDULED']
             
             # 그 다음 로그 출력
-            print(f"[DEBUG] 번호 선택 체크: number={selected_number}")
-            print(f"[DEBUG] 완료={len(completed_meetings)}개, 예정={len(scheduled_meetings)}개")
+            logger.debug("번호 선택 체크: number=%s", selected_number)
+            logger.debug("완료=%s개, 예정=%s개", len(completed_meetings), len(scheduled_meetings))
             
             if status_prefix == '완료':
                 if 1 <= selected_number <= shown_completed:
@@ -96,13 +96,13 @@ def handle_selection(user_input: str, context: dict,
                 has_scheduled = (scheduled_meetings and 
                             1 <= selected_number <= len(scheduled_meetings))
                 
-                print(f"[DEBUG] has_completed={has_completed}, has_scheduled={has_scheduled}")
+                logger.debug("has_completed=%s, has_scheduled=%s", has_completed, has_scheduled)
                 
                 if has_completed and has_scheduled:
                     # 모호함
                     context['last_source'] = 'ambiguous_number'
                     context['last_ambiguous_number'] = selected_number
-                    save_context(session_id, context)
+                    save_context_async(session_id, context)
 
                     return ChatResponse(
                         answer=f"완료된 회의와 예정된 회의 모두 {selected_number}번이 있어요! 🤔\n\n어떤 회의를 보시겠어요?\n\n💬 \"완료 {selected_number}\"\n💬 \"예정 {selected_number}\"",
@@ -130,7 +130,7 @@ def handle_selection(user_input: str, context: dict,
             if 1 <= selected_number <= len(meetings):
                 selected_meeting = meetings[selected_number - 1]
                 selection_method = f"{selected_number}번"
-                print(f"[DEBUG] 번호 선택: {selected_number}번")
+                logger.debug("번호 선택: %s번", selected_number)
             else:
                 return ChatResponse(
                     answer=f"❌ {selected_number}번은 없어요!\n1번부터 {len(meetings)}번까지 선택할 수 있어요. 😊",
@@ -161,10 +161,10 @@ def handle_selection(user_input: str, context: dict,
                 # 1개만 매칭 → 바로 선택
                 selected_meeting = matched_meetings[0][1]
                 selection_method = f"{month}월 {day}일"
-                print(f"[DEBUG] 날짜 선택: {month}월 {day}일 (1개 매칭)")
+                logger.debug("날짜 선택: %s월 %s일 (1개 매칭)", month, day)
             elif len(matched_meetings) > 1:
                 # 여러 개 매칭 → 연도가 다른 경우!
-                print(f"[DEBUG] 날짜 선택: {month}월 {day}일 (여러 개 매칭: {len(matched_meetings)}개)")
+                logger.debug("날짜 선택: %s월 %s일 (여러 개 매칭: %s개)", month, day, len(matched_meetings))
                 
                 response_msg = f"{month}월 {day}일에 회의가 {len(matched_meetings)}개 있어요! 🗓️\n"
                 response_msg += "연도가 다른 것 같아요. 확인해주세요!\n\n"
@@ -194,13 +194,13 @@ def handle_selection(user_input: str, context: dict,
                     'meetings': matched_meetings_list,
                     'original_query': user_input
                 }
-                save_context(session_id, context_data)
+                save_context_async(session_id, context_data)
                 
                 return ChatResponse(
                     answer=response_msg,
                     history=request.history + [
-                        {"role": "user", "content": user_input},
-                        {"role": "assistant", "content": response_msg}
+                        {"role": ROLE_USER, "content": user_input},
+                        {"role": ROLE_ASSISTANT, "content": response_msg}
                     ],
                     source="multiple_date_matches",
                     session_id=session_id
@@ -227,10 +227,10 @@ def handle_selection(user_input: str, context: dict,
                     # 1개만 매칭 → 바로 선택
                     selected_meeting = matched_meetings[0][1]
                     selection_method = f"{day}일"
-                    print(f"[DEBUG] 날짜 선택: {day}일 (1개 매칭)")
+                    logger.debug("날짜 선택: %s일 (1개 매칭)", day)
                 elif len(matched_meetings) > 1:
                     # 여러 개 매칭 → 목록 보여주고 다시 선택
-                    print(f"[DEBUG] 날짜 선택: {day}일 (여러 개 매칭: {len(matched_meetings)}개)")
+                    logger.debug("날짜 선택: %s일 (여러 개 매칭: %s개)", day, len(matched_meetings))
                     
                     response_msg = f"{day}일에 회의가 {len(matched_meetings)}개 있어요! 🗓️\n\n"
                     
@@ -259,13 +259,13 @@ def handle_selection(user_input: str, context: dict,
                         'meetings': matched_meetings_list,
                         'original_query': user_input
                     }
-                    save_context(session_id, context_data)
+                    save_context_async(session_id, context_data)
                     
                     return ChatResponse(
                         answer=response_msg,
                         history=request.history + [
-                            {"role": "user", "content": user_input},
-                            {"role": "assistant", "content": response_msg}
+                            {"role": ROLE_USER, "content": user_input},
+                            {"role": ROLE_ASSISTANT, "content": response_msg}
                         ],
                         source="multiple_date_matches",
                         session_id=session_id
@@ -290,7 +290,7 @@ def handle_selection(user_input: str, context: dict,
         search_word_count = len([t for t in tokens if t in search_stopwords])
         
         if tokens and search_word_count / len(tokens) > 0.6:
-            print(f"[DEBUG] 키워드 선택 스킵: 검색 유도 단어가 대부분 ({search_word_count}/{len(tokens)})")
+            logger.debug("키워드 선택 스킵: 검색 유도 단어가 대부분 (%s/%s)", search_word_count, len(tokens))
             pass
         
         # ========== 키워드 매칭 로직 (수정) ==========
@@ -305,13 +305,13 @@ def handle_selection(user_input: str, context: dict,
                 # 1. 부분 문자열 포함 체크 (정확 매칭)
                 if user_query_clean in title_clean or title_clean in user_query_clean:
                     matched_meetings.append((meeting, 1.0))  # 100% 매칭
-                    print(f"  - '{meeting.get('title')}' 부분 매칭 (100%)")
+                    logger.debug("  - '%s' 부분 매칭 (100%%)", meeting.get('title'))
                     continue
                 
                 # 2. difflib 유사도 계산 (기존 로직)
                 ratio = difflib.SequenceMatcher(None, user_query_clean, title_clean).ratio()
                 
-                print(f"  - '{meeting.get('title')}' 유사도: {ratio:.2%} ('{user_query_clean}' vs '{title_clean}')")
+                logger.debug("  - '%s' 유사도: %.2f%% ('%s' vs '%s')", meeting.get('title'), ratio * 100, user_query_clean, title_clean)
                 
                 # 70% 이상 유사하면 매칭
                 if ratio >= 0.7:
@@ -326,12 +326,12 @@ def handle_selection(user_input: str, context: dict,
             # 1개만 → 바로 선택
             selected_meeting = matched_meetings[0][0]
             selection_method = "키워드"
-            print(f"[DEBUG] 키워드 선택: '{user_input}' (점수: {matched_meetings[0][1]:.2f}, 1개 매칭)")
+            logger.debug("키워드 선택: '%s' (점수: %.2f, 1개 매칭)", user_input, matched_meetings[0][1])
             
         else: # matched_meetings > 1 인 경우만 실행
             # 여러 개 → 점수 순 정렬 후 목록 표시
             matched_meetings.sort(key=lambda x: x[1], reverse=True)
-            print(f"[DEBUG] 키워드 선택: '{user_input}' (여러 개 매칭: {len(matched_meetings)}개)")
+            logger.debug("키워드 선택: '%s' (여러 개 매칭: %s개)", user_input, len(matched_meetings))
             
             response_msg = f"'{user_input}' 관련 회의가 {len(matched_meetings)}개 있어요! 📋\n\n"
             
@@ -363,13 +363,13 @@ def handle_selection(user_input: str, context: dict,
                 'meetings': matched_meetings_list,
                 'original_query': user_input
             }
-            save_context(session_id, context_data)
+            save_context_async(session_id, context_data)
             
             return ChatResponse(
                 answer=response_msg,
                 history=request.history + [
-                    {"role": "user", "content": user_input},
-                    {"role": "assistant", "content": response_msg}
+                    {"role": ROLE_USER, "content": user_input},
+                    {"role": ROLE_ASSISTANT, "content": response_msg}
                 ],
                 source="multiple_keyword_matches",
                 session_id=session_id
@@ -377,11 +377,11 @@ def handle_selection(user_input: str, context: dict,
     
     # 선택된 회의가 없으면 → 새로운 검색으로 처리
     if not selected_meeting:
-        print(f"[DEBUG] 선택 실패 (유사도 70% 미만) → 새로운 검색으로 전환")
+        logger.debug("선택 실패 (유사도 70%% 미만) → 새로운 검색으로 전환")
         return None
     
     # 선택된 회의 정보 포맷
-    print(f"[DEBUG] 선택 완료 ({selection_method}): {selected_meeting['title']}")
+    logger.debug("선택 완료 (%s): %s", selection_method, selected_meeting['title'])
 
     # DB에서 전체 정보 다시 조회 (meeting_result, participants 포함)
     from .database import get_db_connection
@@ -423,14 +423,14 @@ def handle_selection(user_input: str, context: dict,
     if user_job not in valid_jobs:
         user_job = 'NONE'
 
-    print(f"[DEBUG] Phase 2-A: user_job (원본: {user_job_raw}, 정규화: {user_job})")
+    logger.debug("Phase 2-A: user_job (원본: %s, 정규화: %s)", user_job_raw, user_job)
 
     if ENABLE_PERSONA and user_job != 'NONE':
         meeting_info = format_single_meeting_with_persona(selected_meeting, user_job)
-        print(f"[DEBUG] Phase 2-A: {user_job}용 템플릿 적용 (선택)")
+        logger.debug("Phase 2-A: %s용 템플릿 적용 (선택)", user_job)
     else:
         meeting_info = format_single_meeting(selected_meeting)
-        print(f"[DEBUG] 기본 템플릿 적용 (선택)")
+        logger.debug("기본 템플릿 적용 (선택)")
         
     # 선택 완료 후 - 컨텍스트 업데이트 (회의 리스트 유지!)
     new_context = {
@@ -443,14 +443,14 @@ def handle_selection(user_input: str, context: dict,
         'shown_scheduled': context.get('shown_scheduled', 3),
         'original_query': context.get('original_query', '')
     }
-    save_context(session_id, new_context)
-    print(f"[DEBUG] 컨텍스트 업데이트 (회의 리스트 유지): {len(context.get('meetings', []))}개")
+    save_context_async(session_id, new_context)
+    logger.debug("컨텍스트 업데이트 (회의 리스트 유지): %s개", len(context.get('meetings', [])))
         
     return ChatResponse(
         answer=meeting_info,
         history=request.history + [
-            {"role": "user", "content": user_input},
-            {"role": "assistant", "content": meeting_info}
+            {"role": ROLE_USER, "content": user_input},
+            {"role": ROLE_ASSISTANT, "content": meeting_info}
         ],
         source="selected_meeting",
         session_id=session_id
@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent / "stt" / "nest"))
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, UJSONResponse
 
 # --- STT 발화자 분석 관련 ---
 from pydantic import BaseModel
@@ -46,7 +46,10 @@ from summary.action_service import (
 # chatbotSearchMain에서 chat_endpoint 함수 import
 from chatbot.chatbotSearch.chatbotSearchMain import chat as chatbot_chat_endpoint
 
-from chatbot.chatbotSearch.models import ChatRequest as SearchChatRequest, ChatResponse
+from chatbot.chatbotSearch.models import ChatRequest as SearchChatRequest, ChatResponse, chat_response_content
+from chatbot.chatbotSearch.context import close_redis
+from chatbot.chatbotSearch.llm import close_llm_client
+from chatbot.chatbotSearch.database import ensure_search_indexes
 from chatbot.chatbotFAQ.chatbotFAQMain import ChatRequest as FAQChatRequest, ChatResponse as FAQChatResponse, chat as chatbot_faq_endpoint
 
 # ======================================================
@@ -62,6 +65,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def setup_chatbot_search_indexes():
+    """시작 시 챗봇 검색용 인덱스 확인/생성 (ENABLE_SEARCH_INDEX_SETUP일 때만)"""
+    ensure_search_indexes()
+
+@app.on_event("shutdown")
+def shutdown_chatbot_redis():
+    """종료 시 챗봇 Redis 정리 (남은 컨텍스트 저장 완료 후 연결 해제)"""
+    close_redis()
+
+@app.on_event("shutdown")
+async def shutdown_chatbot_llm_client():
+    """종료 시 챗봇 HyperCLOVA 비동기 HTTP 클라이언트 정리"""
+    await close_llm_client()
+
 
 # ======================================================
 # 1. 기본 정보 및 헬스 체크
@@ -102,9 +120,11 @@ async def chat_endpoint(request: SearchChatRequest):
         
         # [옵션] 불필요한 history 데이터 제외 후 반환
         result.history = None
+        content = chat_response_content(result)
         
-        print(f"🔹 챗봇 응답 완료: {result.model_dump(exclude_none=True)}")
-        return result
+        print(f"🔹 챗봇 응답 완료: {content}")
+        # 이미 검증된 응답이므로 response_model 재검증/직렬화 없이 바로 전송
+        return UJSONResponse(content)
     except Exception as e:
         print(f"❌ 챗봇 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))